@@ -1,12 +1,34 @@
+import asyncio
 from collections import deque
-from collections.abc import Hashable, Iterable, Mapping
-from typing import Any, Optional, TypeVar
+from collections.abc import AsyncIterator, Callable, Hashable, Iterable, Mapping
+from inspect import isawaitable
+from itertools import islice
+from concurrent.futures import Executor
+from threading import Event
+from typing import Any, Literal, Optional, TypeVar
 
 from .subtypes import Subtypes
 from .types import Type, Omega, Constructor, Product, Arrow, Intersection
-from .enumeration import enumerate_terms, interpret_term, enumerate_terms_of_size
+from .enumeration import (
+    CallPlans,
+    Term,
+    enumerate_terms,
+    interpret_term,
+    interpret_terms,
+    interpret_terms_concurrently,
+    enumerate_terms_of_size,
+    compile_call_plans,
+    create_executor,
+)
 from .boolean import BooleanTerm, And, Var, Or, Not
-from .bfcl import Clause, FiniteCombinatoryLogic
+from .bfcl import (
+    Clause,
+    FiniteCombinatoryLogic,
+    InhabitationProgress,
+    InhabitationStatistics,
+)
+from .serialization import load_repository, save_repository
+from .parser import TypeParser, parse_query, parse_type
 
 __all__ = [
     "Subtypes",
@@ -16,18 +38,33 @@ __all__ = [
     "Product",
     "Arrow",
     "Intersection",
+    "Term",
     "enumerate_terms",
     "enumerate_terms_of_size",
     "interpret_term",
+    "interpret_terms",
+    "interpret_terms_concurrently",
     "BooleanTerm",
     "And",
     "Var",
     "Or",
     "Not",
     "FiniteCombinatoryLogic",
+    "InhabitationProgress",
+    "InhabitationStatistics",
+    "load_repository",
+    "save_repository",
+    "TypeParser",
+    "parse_type",
+    "parse_query",
     "inhabit_and_interpret",
+    "inhabit_async",
+    "enumerate_terms_async",
+    "interpret_term_async",
+    "inhabit_and_interpret_async",
 ]
 
+S = TypeVar("S")
 T = TypeVar("T", bound=Hashable, covariant=True)
 C = TypeVar("C")
 
@@ -40,11 +77,35 @@ def inhabit_and_interpret(
     | Clause[T],
     max_count: Optional[int] = 100,
     subtypes: Optional[Subtypes[T]] = None,
+    cache_size: int = 0,
+    is_pure: Callable[[C], bool] = lambda combinator: True,
+    executor: Optional[Literal["thread", "process"] | Executor] = None,
+    max_workers: Optional[int] = None,
+    ordered: bool = True,
+    max_pending: Optional[int] = None,
 ) -> Iterable[Any]:
+    """Inhabit the query and interpret at most max_count terms per query.
+
+    If `cache_size` is positive, interpreted values of subterms shared between terms are cached
+    (see `interpret_terms`). Only use this if the combinators satisfying `is_pure` may share
+    their results (`is_pure` is only used by the cache).
+
+    If an executor is given, terms are interpreted concurrently instead (see
+    `interpret_terms_concurrently`), with at most max_pending terms submitted ahead, optionally
+    yielding results in completion order. A pool created for "thread" or "process" is shared by
+    all queries and shut down afterwards. Values are not cached across workers, so a positive
+    `cache_size` cannot be combined with an executor.
+    """
+
+    if executor is not None and cache_size > 0:
+        raise ValueError("cache_size cannot be combined with an executor")
+
     fcl = FiniteCombinatoryLogic(
         repository, Subtypes(dict()) if subtypes is None else subtypes
     )
 
+    plans = compile_call_plans(repository.keys())
+
     if not isinstance(query, list):
         query = [query]
 
@@ -53,9 +114,126 @@ def inhabit_and_interpret(
         deque[tuple[C, list[Type[T] | BooleanTerm[Type[T]] | Clause[T]]]],
     ] = fcl.inhabit(*query)
 
-    for q in query:
-        enumerated_terms = enumerate_terms(
-            start=q, grammar=grammar, max_count=max_count
+    pool = None if executor is None else create_executor(executor, max_workers)
+    try:
+        for q in query:
+            enumerated_terms = enumerate_terms(
+                start=q, grammar=grammar, max_count=max_count
+            )
+            if pool is None:
+                yield from interpret_terms(enumerated_terms, cache_size, is_pure, plans)
+            else:
+                yield from interpret_terms_concurrently(
+                    enumerated_terms, pool, max_workers, max_pending, ordered
+                )
+    finally:
+        if pool is not None and pool is not executor:
+            pool.shutdown(cancel_futures=True)
+
+
+async def inhabit_async(
+    fcl: FiniteCombinatoryLogic[T, C],
+    *targets: BooleanTerm[Type[T]] | Type[T] | Clause[T],
+    progress: Optional[Callable[[InhabitationProgress], None]] = None,
+    cancel: Optional[Event] = None,
+    check_interval: int = 10,
+) -> dict[
+    BooleanTerm[Type[T]] | Type[T] | Clause[T],
+    deque[tuple[C, list[Type[T] | BooleanTerm[Type[T]] | Clause[T]]]],
+]:
+    """Run `fcl.inhabit(*targets)` in a worker thread without blocking the event loop.
+
+    progress, cancel and check_interval are passed on to `fcl.inhabit`. The progress callback is
+    called in the worker thread. Cancelling the awaiting task sets cancel (or a new event), so the
+    worker thread stops after at most check_interval further clauses.
+    """
+
+    if cancel is None:
+        cancel = Event()
+    try:
+        return await asyncio.to_thread(
+            fcl.inhabit,
+            *targets,
+            progress=progress,
+            cancel=cancel,
+            check_interval=check_interval,
         )
-        for term in enumerated_terms:
-            yield interpret_term(term)
+    except asyncio.CancelledError:
+        cancel.set()
+        raise
+
+
+async def enumerate_terms_async(
+    start: S,
+    grammar: Mapping[S, Iterable[tuple[C, list[S]]]],
+    max_count: Optional[int] = 100,
+    chunk_size: int = 1,
+) -> AsyncIterator[Term[C]]:
+    """Asynchronous version of `enumerate_terms`.
+
+    Terms are enumerated in a worker thread, chunk_size terms at a time. If the consuming task is
+    cancelled (or stops iterating), the cancellation token of the enumeration is set, so the
+    worker thread stops without finishing the current round.
+    """
+
+    cancel = Event()
+    terms = iter(enumerate_terms(start, grammar, max_count, cancel))
+    try:
+        while True:
+            chunk = await asyncio.to_thread(lambda: list(islice(terms, chunk_size)))
+            if not chunk:
+                return
+            for term in chunk:
+                yield term
+    finally:
+        cancel.set()
+
+
+async def interpret_term_async(
+    term: Term[C], plans: Optional[CallPlans] = None
+) -> Any:
+    """Asynchronous version of `interpret_term`.
+
+    The term is interpreted in a worker thread. Awaitable results of combinators (e.g. of async
+    functions) are awaited on the running event loop before they are passed on.
+    """
+
+    loop = asyncio.get_running_loop()
+
+    def resolve(value: Any) -> Any:
+        if isawaitable(value):
+
+            async def wait_for() -> Any:
+                return await value
+
+            return asyncio.run_coroutine_threadsafe(wait_for(), loop).result()
+        return value
+
+    return await asyncio.to_thread(interpret_term, term, None, plans, resolve)
+
+
+async def inhabit_and_interpret_async(
+    repository: Mapping[C, Type[T]],
+    query: list[BooleanTerm[Type[T]] | Type[T] | Clause[T]]
+    | BooleanTerm[Type[T]]
+    | Type[T]
+    | Clause[T],
+    max_count: Optional[int] = 100,
+    subtypes: Optional[Subtypes[T]] = None,
+) -> AsyncIterator[Any]:
+    """Asynchronous version of `inhabit_and_interpret`, see `inhabit_async`,
+    `enumerate_terms_async`, and `interpret_term_async`."""
+
+    fcl = FiniteCombinatoryLogic(
+        repository, Subtypes(dict()) if subtypes is None else subtypes
+    )
+    plans = compile_call_plans(repository.keys())
+
+    if not isinstance(query, list):
+        query = [query]
+
+    grammar = await inhabit_async(fcl, *query)
+
+    for q in query:
+        async for term in enumerate_terms_async(q, grammar, max_count):
+            yield await interpret_term_async(term, plans)
@@ -0,0 +1,240 @@
+"""Batch synthesis from the command line.
+
+    python -m bcls REPOSITORY [QUERIES] [--jobs N] [--max-count N] [--terms]
+
+REPOSITORY is a Python file or module defining `repository` (a mapping from combinators to types)
+and optionally `subtypes` (`Subtypes` or an environment `dict`). QUERIES is a file (default: stdin)
+with one query per line, written in the syntax of printed types and queries (see bcls.parser),
+e.g. `a -> b & ~c`. Empty lines and lines starting with "#" are skipped.
+
+All queries are run against one FiniteCombinatoryLogic (one per worker, if --jobs is greater than
+one), so loading and converting the repository is paid once per batch. For each query a JSON
+object is written to stdout (one per line, in the order of the queries) containing the results
+and the time (in seconds) of each phase. Queries are read as workers become free, at most
+MAX_PENDING_PER_JOB queries per worker are pending at any time.
+"""
+
+import argparse
+import importlib
+import importlib.util
+import json
+import sys
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import count
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Optional, TextIO
+
+from .bfcl import FiniteCombinatoryLogic
+from .boolean import Var
+from .enumeration import (
+    CallPlans,
+    Term,
+    compile_call_plans,
+    enumerate_terms,
+    interpret_terms,
+)
+from .parser import TypeParser
+from .subtypes import Subtypes
+
+MAX_PENDING_PER_JOB = 2
+"""Number of queries per worker process, which are submitted before their results are written."""
+
+# repository files are loaded as modules with private names, which never shadow other modules
+_module_names = (f"_bcls_repository_{i}" for i in count())
+
+
+@dataclass(frozen=True)
+class Options:
+    repository: str
+    attribute: str
+    max_count: Optional[int]
+    interpret: bool
+
+
+def load_namespace(source: str) -> dict[str, Any]:
+    """Load a Python file or module and return its namespace."""
+
+    if source.endswith(".py") or Path(source).is_file():
+        path = Path(source)
+        spec = importlib.util.spec_from_file_location(next(_module_names), path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load repository from {source}")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+    else:
+        module = importlib.import_module(source)
+    return vars(module)
+
+
+def read_queries(lines: Iterable[str]) -> Iterator[str]:
+    for line in lines:
+        query = line.strip()
+        if query and not query.startswith("#"):
+            yield query
+
+
+def show_combinator(combinator: Any) -> str:
+    """Names are shown as they are, functions and classes by their name, other combinators by
+    their repr (not by their default str, which contains their address)."""
+
+    if isinstance(combinator, str):
+        return combinator
+    return str(getattr(combinator, "__name__", repr(combinator)))
+
+
+def show_term(term: Term[Any]) -> str:
+    """Show a term in applicative notation, e.g. F(X, G(Y)).
+
+    The string is built iteratively, so deep terms do not exceed the recursion limit.
+    """
+
+    parts: list[str] = []
+    stack: list[str | Term[Any]] = [term]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            parts.append(item)
+            continue
+        parts.append(show_combinator(item.combinator))
+        if item.arguments:
+            stack.append(")")
+            for position, argument in enumerate(reversed(item.arguments)):
+                if position > 0:
+                    stack.append(", ")
+                stack.append(argument)
+            stack.append("(")
+    return "".join(parts)
+
+
+class Batch(object):
+    """A repository prepared for running many queries."""
+
+    def __init__(self, options: Options):
+        self.options = options
+        module_namespace = load_namespace(options.repository)
+        repository = module_namespace[options.attribute]
+        subtypes = module_namespace.get("subtypes", Subtypes({}))
+        if not isinstance(subtypes, Subtypes):
+            subtypes = Subtypes(subtypes)
+        # types are interned across the queries of a batch
+        self.parser = TypeParser()
+        self.fcl: FiniteCombinatoryLogic[Any, Any] = FiniteCombinatoryLogic(
+            repository, subtypes
+        )
+        self.plans: CallPlans = compile_call_plans(repository.keys())
+
+    def run(self, index: int, text: str) -> dict[str, Any]:
+        """Run a single query, errors are reported in the result."""
+
+        result: dict[str, Any] = {"index": index, "query": text}
+        times: dict[str, float] = {}
+        try:
+            start = perf_counter()
+            parsed = self.parser.parse_query(text)
+            # plain types are inhabited as types (not as Boolean queries)
+            query = parsed.name if isinstance(parsed, Var) else parsed
+            start = self._phase(times, "parse", start)
+            grammar = self.fcl.inhabit(query)
+            start = self._phase(times, "inhabit", start)
+            terms = list(enumerate_terms(query, grammar, self.options.max_count))
+            start = self._phase(times, "enumerate", start)
+            if self.options.interpret:
+                results = list(interpret_terms(terms, plans=self.plans))
+                self._phase(times, "interpret", start)
+            else:
+                results = list(map(show_term, terms))
+            result.update(count=len(results), results=results)
+        except Exception as error:
+            result["error"] = f"{type(error).__name__}: {error}"
+        result["time"] = times
+        return result
+
+    @staticmethod
+    def _phase(times: dict[str, float], phase: str, start: float) -> float:
+        now = perf_counter()
+        times[phase] = now - start
+        return now
+
+
+_worker_batch: Optional[Batch] = None
+
+
+def _initialize_worker(options: Options) -> None:
+    global _worker_batch
+    _worker_batch = Batch(options)
+
+
+def to_json_line(result: dict[str, Any]) -> str:
+    # interpretations, which are not JSON values, are written as strings
+    return json.dumps(result, default=str)
+
+
+def _run_in_worker(item: tuple[int, str]) -> str:
+    # results are serialized in the worker, since interpretations may not be picklable
+    assert _worker_batch is not None
+    return to_json_line(_worker_batch.run(*item))
+
+
+def run_batch(options: Options, queries: Iterable[str], jobs: int = 1) -> Iterator[str]:
+    """Run queries and yield their results as JSON lines in the order of the queries."""
+
+    if jobs <= 1:
+        batch = Batch(options)
+        for index, query in enumerate(queries):
+            yield to_json_line(batch.run(index, query))
+        return
+    with ProcessPoolExecutor(
+        jobs, initializer=_initialize_worker, initargs=(options,)
+    ) as executor:
+        # unlike executor.map, only a bounded number of queries is read ahead
+        pending: deque[Future[str]] = deque()
+        for item in enumerate(queries):
+            if len(pending) >= MAX_PENDING_PER_JOB * jobs:
+                yield pending.popleft().result()
+            pending.append(executor.submit(_run_in_worker, item))
+        while pending:
+            yield pending.popleft().result()
+
+
+def write_results(lines: Iterable[str], output: TextIO) -> None:
+    for line in lines:
+        output.write(line + "\n")
+        output.flush()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m bcls", description="Run a batch of queries against a repository."
+    )
+    parser.add_argument("repository", help="Python file or module defining the repository")
+    parser.add_argument(
+        "queries",
+        nargs="?",
+        type=argparse.FileType("r"),
+        default=sys.stdin,
+        help="file with one query per line (default: stdin)",
+    )
+    parser.add_argument(
+        "--attribute", default="repository", help="name of the repository in the module"
+    )
+    parser.add_argument("--jobs", type=int, default=1, help="number of worker processes")
+    parser.add_argument(
+        "--max-count", type=int, default=100, help="maximal number of results per query"
+    )
+    parser.add_argument(
+        "--terms", action="store_true", help="output terms instead of their interpretations"
+    )
+    args = parser.parse_args(argv)
+
+    options = Options(args.repository, args.attribute, args.max_count, not args.terms)
+    write_results(run_batch(options, read_queries(args.queries), args.jobs), sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,288 @@
+"""
+Binary Decision Diagrams
+========================
+
+This module provides reduced ordered binary decision diagrams (BDDs) as an alternative
+representation of boolean terms. All diagrams over the same variable order are stored in one
+`BDD` object, which maintains a table of unique nodes, so equivalent subdiagrams are shared and
+two terms are equivalent iff they are represented by the same node.
+
+A node is an integer index into the node table. The nodes 0 and 1 are the terminals for false and
+true. Every other node tests the variable at its level: its low child is taken, if the variable is
+false, its high child is taken, if the variable is true.
+
+In contrast to the truth table of a term, the size of its BDD is often polynomial in the number of
+variables (e.g. for conjunctions of many negated variables). A dnf can be extracted from a BDD by
+enumerating its paths to the terminal 1.
+
+Usage
+-----
+
+    term = And[str](Or(Var("A"), And(Not(Var("D")), Var("B"))), Var("C"))
+    print(bdd_dnf(term)) # e.g. ((A & C) | (~D & B & C))
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable
+from typing import Generic, Literal, Optional, TypeVar
+
+from .boolean import (
+    And,
+    BooleanTerm,
+    Cube,
+    Not,
+    Or,
+    SignatureOrder,
+    Var,
+    dnf_as_list,
+    expand_cover,
+    order_signature,
+    to_clause,
+)
+
+T = TypeVar("T", bound=Hashable, covariant=True)
+V = TypeVar("V", bound=Hashable)  # variables of a node table
+
+FALSE = 0
+TRUE = 1
+
+
+class BDD(Generic[V]):
+    """Node table for reduced ordered binary decision diagrams over a given variable order."""
+
+    def __init__(self, order: list[V]):
+        self.order = order
+        self.levels = {variable: level for level, variable in enumerate(order)}
+        # (level, low, high) for each node, terminals are below all variables
+        self.nodes: list[tuple[int, int, int]] = [
+            (len(order), FALSE, FALSE),
+            (len(order), TRUE, TRUE),
+        ]
+        self.unique: dict[tuple[int, int, int], int] = {}
+        self.negate_cache: dict[int, int] = {}
+        self.apply_cache: dict[tuple[str, int, int], int] = {}
+
+    def node(self, level: int, low: int, high: int) -> int:
+        """int: The unique node testing the variable at level with given children."""
+
+        if low == high:
+            return low
+        key = (level, low, high)
+        result = self.unique.get(key)
+        if result is None:
+            result = len(self.nodes)
+            self.nodes.append(key)
+            self.unique[key] = result
+        return result
+
+    def var(self, variable: V) -> int:
+        """int: The node representing a single variable."""
+
+        return self.node(self.levels[variable], FALSE, TRUE)
+
+    def negate(self, u: int) -> int:
+        """int: The node representing the negation of u."""
+
+        def negated(w: int) -> Optional[int]:
+            return TRUE - w if w <= TRUE else self.negate_cache.get(w)
+
+        # post-order traversal, each node is negated after its children
+        stack = [u]
+        while stack:
+            current = stack[-1]
+            if negated(current) is not None:
+                stack.pop()
+                continue
+            level, low, high = self.nodes[current]
+            negated_low, negated_high = negated(low), negated(high)
+            if negated_low is None or negated_high is None:
+                stack.extend(child for child in (low, high) if negated(child) is None)
+                continue
+            stack.pop()
+            self.negate_cache[current] = self.node(level, negated_low, negated_high)
+        result = negated(u)
+        assert result is not None
+        return result
+
+    def _applied(self, operator: Literal["and", "or"], u: int, v: int) -> Optional[int]:
+        """The result of apply, if it is trivial or cached, otherwise None."""
+
+        if u == v:
+            return u
+        if operator == "and":
+            if u == FALSE or v == FALSE:
+                return FALSE
+            if u == TRUE:
+                return v
+            if v == TRUE:
+                return u
+        else:
+            if u == TRUE or v == TRUE:
+                return TRUE
+            if u == FALSE:
+                return v
+            if v == FALSE:
+                return u
+        # both operators are commutative
+        return self.apply_cache.get((operator, u, v) if u < v else (operator, v, u))
+
+    def apply(self, operator: Literal["and", "or"], u: int, v: int) -> int:
+        """int: The node representing the conjunction ("and") or disjunction ("or") of u and v."""
+
+        # post-order traversal, each pair of nodes is combined after the pairs of its children
+        stack = [(u, v)]
+        while stack:
+            current_u, current_v = stack[-1]
+            if self._applied(operator, current_u, current_v) is not None:
+                stack.pop()
+                continue
+            level_u, low_u, high_u = self.nodes[current_u]
+            level_v, low_v, high_v = self.nodes[current_v]
+            level = min(level_u, level_v)
+            if level_u != level:
+                low_u, high_u = current_u, current_u
+            if level_v != level:
+                low_v, high_v = current_v, current_v
+            low = self._applied(operator, low_u, low_v)
+            high = self._applied(operator, high_u, high_v)
+            if low is None or high is None:
+                if low is None:
+                    stack.append((low_u, low_v))
+                if high is None:
+                    stack.append((high_u, high_v))
+                continue
+            stack.pop()
+            key = (
+                (operator, current_u, current_v)
+                if current_u < current_v
+                else (operator, current_v, current_u)
+            )
+            self.apply_cache[key] = self.node(level, low, high)
+        result = self._applied(operator, u, v)
+        assert result is not None
+        return result
+
+    def from_term(self, term: BooleanTerm[V]) -> int:
+        """int: The node representing a boolean term over (a subset of) the variable order."""
+
+        results: dict[BooleanTerm[V], int] = {}
+
+        # post-order traversal, each subterm is translated after its subterms
+        stack: list[tuple[BooleanTerm[V], bool]] = [(term, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if current in results:
+                continue
+            match current:
+                case Var(name):
+                    results[current] = self.var(name)
+                case Not(inner) if expanded:
+                    results[current] = self.negate(results[inner])
+                case Not(inner):
+                    stack.extend(((current, True), (inner, False)))
+                case And(inner) if expanded:
+                    result = TRUE
+                    for subterm in inner:
+                        result = self.apply("and", result, results[subterm])
+                    results[current] = result
+                case Or(inner) if expanded:
+                    result = FALSE
+                    for subterm in inner:
+                        result = self.apply("or", result, results[subterm])
+                    results[current] = result
+                case And(inner) | Or(inner):
+                    stack.append((current, True))
+                    stack.extend((subterm, False) for subterm in inner)
+        return results[term]
+
+    def size(self, u: int) -> int:
+        """int: The number of nodes reachable from u (including terminals)."""
+
+        seen = {u}
+        stack = [u]
+        while stack:
+            level, low, high = self.nodes[stack.pop()]
+            if level < len(self.order):
+                for child in (low, high):
+                    if child not in seen:
+                        seen.add(child)
+                        stack.append(child)
+        return len(seen)
+
+    def paths(self, u: int, terminal: int = TRUE) -> Iterable[Cube]:
+        """Iterable[Cube]: Enumerate the paths from u to a terminal as cubes.
+
+        Bits of cubes correspond to the variable order (see boolean.Cube). The cubes are pairwise
+        disjoint and cover exactly the mappings, that lead to the terminal. The number of paths
+        can be exponential in the size of the diagram (e.g. for parity functions).
+        """
+
+        stack: list[tuple[int, int, int]] = [(u, 0, 0)]
+        while stack:
+            current, positives, negatives = stack.pop()
+            level, low, high = self.nodes[current]
+            if level == len(self.order):
+                if current == terminal:
+                    yield (positives, negatives)
+                continue
+            bit = 1 << (len(self.order) - 1 - level)
+            stack.append((low, positives, negatives | bit))
+            stack.append((high, positives | bit, negatives))
+
+    def implies(self, cube: Cube, u: int) -> bool:
+        """bool: Decide whether all mappings in a cube lead from u to the terminal TRUE.
+
+        Each node reachable from u under the literals of the cube is visited at most once.
+        """
+
+        positives, negatives = cube
+        seen = {u}
+        stack = [u]
+        while stack:
+            current = stack.pop()
+            if current == FALSE:
+                return False
+            level, low, high = self.nodes[current]
+            if level == len(self.order):
+                continue
+            bit = 1 << (len(self.order) - 1 - level)
+            for child, excluded in ((low, positives), (high, negatives)):
+                if excluded & bit == 0 and child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+        return True
+
+
+def bdd_dnf(
+    term: BooleanTerm[T],
+    order: Optional[list[T]] = None,
+    signature_order: SignatureOrder = "frequency",
+) -> Or[T]:
+    """BooleanTerm[T]: Compute a small (not necessarily minimal) dnf using a BDD
+
+    The paths of the BDD of the term to TRUE are expanded to prime implicants (see
+    boolean.expand_cover), where each expansion step checks the implicant on the BDD (see
+    BDD.implies). Hence the time needed is proportional to the number of paths times the number
+    of variables times the size of the BDD (for a given variable order) instead of 2**n. The
+    number of paths is often small, but can be exponential in the size of the BDD. The result
+    has the same format as the result of minimal_dnf. If no variable order is given, it is
+    computed by boolean.order_signature.
+    """
+
+    signature = order_signature(term, signature_order) if order is None else order
+    bdd: BDD[T] = BDD(signature)
+    root = bdd.from_term(term)
+    implicants = expand_cover(
+        list(bdd.paths(root, TRUE)), lambda cube: bdd.implies(cube, root), len(signature)
+    )
+    return Or[T](*(And[T](*to_clause(implicant, signature)) for implicant in implicants))
+
+
+def bdd_dnf_as_list(
+    term: BooleanTerm[T], signature_order: SignatureOrder = "frequency"
+) -> list[list[tuple[bool, T]]]:
+    """list[list[tuple[bool, T]]]: Computes a small dnf (see bdd_dnf) and returns the result
+                                   stripped of all Constructors."""
+
+    return dnf_as_list(bdd_dnf(term, signature_order=signature_order))
@@ -1,12 +1,32 @@
 # Propositional Finite Combinatory Logic
 
-from collections import deque
-from collections.abc import Hashable, Iterable, Mapping, MutableMapping, Sequence
+from collections import Counter, deque
+from collections.abc import Hashable, Iterable, Iterator, Mapping, MutableMapping, Sequence
+from dataclasses import dataclass, field
 from functools import reduce
 from itertools import chain
-from typing import Callable, Generic, TypeAlias, TypeVar, cast
-
-from .boolean import BooleanTerm, minimal_dnf_as_list
+from threading import Event
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Literal,
+    Optional,
+    TextIO,
+    TypeAlias,
+    TypeVar,
+    cast,
+)
+
+from .bdd import bdd_dnf_as_list
+from .boolean import (
+    BooleanTerm,
+    SignatureOrder,
+    cached_dnf_as_list,
+    heuristic_dnf_as_list,
+    minimal_dnf_as_list,
+)
 from .combinatorics import maximal_elements, minimal_covers, partition
 from .subtypes import Subtypes
 from .types import Arrow, Intersection, Type, Omega
@@ -14,8 +34,44 @@ from .types import Arrow, Intersection, Type, Omega
 T = TypeVar("T", bound=Hashable, covariant=True)
 C = TypeVar("C")
 
-# ([sigma_1, ..., sigma_n], tau) means sigma_1 -> ... -> sigma_n -> tau
-MultiArrow: TypeAlias = tuple[list[Type[T]], Type[T]]
+
+class MultiArrow(Generic[T]):
+    """The function type sigma_1 -> ... -> sigma_n -> target.
+
+    A multi-arrow only stores its last argument sigma_n and refers to its prefix
+    sigma_1 -> ... -> sigma_(n-1) -> (sigma_n -> target) for the other arguments, so the
+    multi-arrows of all arities of a type share their arguments.
+    """
+
+    __slots__ = ("prefix", "argument", "target", "arity", "_arguments")
+
+    def __init__(
+        self,
+        target: Type[T],
+        prefix: Optional["MultiArrow[T]"] = None,
+        argument: Optional[Type[T]] = None,
+    ):
+        self.target = target
+        self.prefix = prefix
+        self.argument = argument
+        self.arity: int = 0 if prefix is None else prefix.arity + 1
+        self._arguments: Optional[tuple[Type[T], ...]] = None
+
+    @property
+    def arguments(self) -> tuple[Type[T], ...]:
+        """The arguments (sigma_1, ..., sigma_n), collected on first access."""
+
+        if self._arguments is None:
+            arguments: list[Type[T]] = []
+            current = self
+            while current.prefix is not None and current.argument is not None:
+                arguments.append(current.argument)
+                current = current.prefix
+            arguments.reverse()
+            self._arguments = tuple(arguments)
+        return self._arguments
+
+
 # (tau_0, tau_1, ..., tau_n) means tau_0 and (not tau_1) and ... and (not tau_n)
 Clause: TypeAlias = tuple[Type[T], frozenset[Type[T]]]
 
@@ -28,30 +84,140 @@ def show_clause(clause: Clause[T]) -> str:
     return " and not ".join(map(str, flat_clause))
 
 
+def _show_nonterminal(nonterminal: Any) -> str:
+    # non-terminals of grammars are clauses, types or Boolean terms (targets of inhabit)
+    return show_clause(nonterminal) if isinstance(nonterminal, tuple) else str(nonterminal)
+
+
+def _show_rules(
+    clause: Clause[T], possibilities: Iterable[tuple[C, list[Clause[T]]]]
+) -> Iterator[str]:
+    """Pieces of the line showing the rules of a non-terminal."""
+
+    yield _show_nonterminal(clause)
+    yield " => "
+    separator = ""
+    for combinator, args in possibilities:
+        yield separator
+        yield str(combinator)
+        yield "("
+        yield ", ".join(map(_show_nonterminal, args))
+        yield ")"
+        separator = "; "
+
+
 def show_grammar(grammar: TreeGrammar[T, C]) -> Iterable[str]:
     for clause, possibilities in grammar.items():
-        lhs = str(clause) if isinstance(clause, BooleanTerm) else show_clause(clause)
-        yield (
-            lhs
-            + " => "
-            + "; ".join(
-                (str(combinator) + "(" + ", ".join(map(show_clause, args)) + ")")
-                for combinator, args in possibilities
-            )
-        )
+        yield "".join(_show_rules(clause, possibilities))
+
+
+def write_grammar(grammar: TreeGrammar[T, C], output: TextIO) -> None:
+    """Write the lines of `show_grammar` to a text file.
+
+    Lines are written piece by piece, so lines of large grammars are never built in memory.
+    """
+
+    for clause, possibilities in grammar.items():
+        output.writelines(_show_rules(clause, possibilities))
+        output.write("\n")
 
 
 def mstr(m: MultiArrow[T]) -> tuple[str, str]:
-    return (str(list(map(str, m[0]))), str(m[1]))
+    return (str(list(map(str, m.arguments))), str(m.target))
+
+
+@dataclass
+class InhabitationStatistics:
+    """Statistics of FiniteCombinatoryLogic.inhabit, accumulated over all calls.
+
+    Statistics are opt-in: they are only collected, if an instance is passed to
+    FiniteCombinatoryLogic. The hooks on_clause_expanded (called with each expanded clause and its
+    rules) and on_rule_added (called with clause, combinator and arguments of each rule) can be
+    used to forward events.
+    Times are in seconds, phases are "clauses" (conversion of Boolean targets), "expansion",
+    "prune" and "rules" (rules for Boolean and type targets).
+    subtype_checks counts the calls of Subtypes.check_subtype by inhabit, i.e. only top-level
+    checks and not the recursive checks of components of types.
+    """
+
+    clauses_processed: int = 0
+    rules_generated: int = 0
+    subqueries_calls: int = 0
+    subtype_checks: int = 0
+    prune_iterations: int = 0
+    # histograms (size |-> number of occurrences) of the results of the set cover and of the
+    # maximal argument vectors in _subqueries
+    minimal_covers_sizes: Counter[int] = field(default_factory=Counter)
+    maximal_elements_sizes: Counter[int] = field(default_factory=Counter)
+    phase_times: dict[str, float] = field(default_factory=dict)
+    on_clause_expanded: Optional[Callable[[Any, Sequence[Any]], None]] = None
+    on_rule_added: Optional[Callable[[Any, Any, list[Any]], None]] = None
+
+    def add_time(self, phase: str, start: float) -> float:
+        """Add the time since start to a phase and return the current time."""
+
+        now = perf_counter()
+        self.phase_times[phase] = self.phase_times.get(phase, 0.0) + now - start
+        return now
+
+
+@dataclass(frozen=True)
+class InhabitationProgress:
+    """Snapshot of a running inhabit call, which is passed to progress callbacks.
+
+    worklist is the number of pending clauses (possibly already expanded), memo the number of
+    expanded clauses and elapsed the time in seconds since the start of the call.
+    """
+
+    worklist: int
+    memo: int
+    elapsed: float
+
+
+class _CountingSubtypes(Subtypes[T]):
+    """Subtypes, which count the top-level subtype checks (calls of check_subtype)."""
+
+    def __init__(self, subtypes: Subtypes[T], statistics: InhabitationStatistics):
+        # the environment of subtypes is closed already, closing it again does not change it
+        super().__init__(subtypes.environment)
+        self.statistics = statistics
+
+    def check_subtype(self, subtype: Type[T], supertype: Type[T]) -> bool:
+        self.statistics.subtype_checks += 1
+        return super().check_subtype(subtype, supertype)
 
 
 class FiniteCombinatoryLogic(Generic[T, C]):
-    def __init__(self, repository: Mapping[C, Type[T]], subtypes: Subtypes[T]):
+    def __init__(
+        self,
+        repository: Mapping[C, Type[T]],
+        subtypes: Subtypes[T],
+        max_exact_dnf_variables: int = 12,
+        large_dnf_method: Literal["heuristic", "bdd"] = "heuristic",
+        signature_order: SignatureOrder = "frequency",
+        statistics: Optional[InhabitationStatistics] = None,
+    ):
+        """Boolean queries with more than max_exact_dnf_variables distinct types are converted to
+        a small, but not necessarily minimal, dnf instead of a minimal one, since exact
+        minimization needs time exponential in the number of types. The large_dnf_method is
+        either "heuristic" (see `heuristic_dnf`) or "bdd" (see `bdd_dnf`). Both avoid enumerating
+        all assignments, but can still need time exponential in the size of the query, e.g. for
+        conjunctions of many disjunctions, whose dnf is large itself. The signature_order
+        is the heuristic ordering the variables of a query (see `order_signature`).
+        If statistics are given, inhabit records its work in them (see InhabitationStatistics),
+        otherwise no statistics are collected."""
+
         self.repository: Mapping[C, list[list[MultiArrow[T]]]] = {
             c: list(FiniteCombinatoryLogic._function_types(ty))
             for c, ty in repository.items()
         }
-        self.subtypes = subtypes
+        self.subtypes = (
+            subtypes if statistics is None else _CountingSubtypes(subtypes, statistics)
+        )
+        self.statistics = statistics
+        self.max_exact_dnf_variables = max_exact_dnf_variables
+        self.large_dnf_method = large_dnf_method
+        self.signature_order: SignatureOrder = signature_order
 
     @staticmethod
     def _function_types(ty: Type[T]) -> Iterable[list[MultiArrow[T]]]:
@@ -66,13 +232,13 @@ class FiniteCombinatoryLogic(Generic[T, C]):
                     case Intersection(sigma, tau):
                         tys.extend((sigma, tau))
 
-        current: list[MultiArrow[T]] = [([], ty)]
+        current: list[MultiArrow[T]] = [MultiArrow(ty)]
         while len(current) != 0:
             yield current
             current = [
-                (args + [new_arg], new_tgt)
-                for (args, tgt) in current
-                for (new_arg, new_tgt) in unary_function_types(tgt)
+                MultiArrow(new_tgt, m, new_arg)
+                for m in current
+                for (new_arg, new_tgt) in unary_function_types(m.target)
             ]
 
     def _subqueries(
@@ -81,24 +247,28 @@ class FiniteCombinatoryLogic(Generic[T, C]):
         # does the target of a multi-arrow contain a given type?
         target_contains: Callable[
             [MultiArrow[T], Type[T]], bool
-        ] = lambda m, t: self.subtypes.check_subtype(m[1], t)
+        ] = lambda m, t: self.subtypes.check_subtype(m.target, t)
         # cover target using targets of multi-arrows in nary_types
         covers = minimal_covers(nary_types, paths, target_contains)
+        if self.statistics is not None:
+            self.statistics.subqueries_calls += 1
+            self.statistics.minimal_covers_sizes[len(covers)] += 1
         if len(covers) == 0:
             return []
         # intersect corresponding arguments of multi-arrows in each cover
-        intersect_args: Callable[
-            [Iterable[Type[T]], Iterable[Type[T]]], list[Type[T]]
-        ] = lambda args1, args2: [Intersection(a, b) for a, b in zip(args1, args2)]
-
-        intersected_args = (
-            list(reduce(intersect_args, (m[0] for m in ms))) for ms in covers
+        intersect: Callable[[Type[T], Type[T]], Type[T]] = Intersection
+        intersected_args: Iterator[list[Type[T]]] = (
+            [reduce(intersect, args) for args in zip(*(m.arguments for m in ms))]
+            for ms in covers
         )
         # consider only maximal argument vectors
         compare_args = lambda args1, args2: all(
             map(self.subtypes.check_subtype, args1, args2)
         )
-        return maximal_elements(intersected_args, compare_args)
+        result = maximal_elements(intersected_args, compare_args)
+        if self.statistics is not None:
+            self.statistics.maximal_elements_sizes[len(result)] += 1
+        return result
 
     @staticmethod
     def list_of_types_to_clause(types: Iterable[Type[T]]) -> Clause[T]:
@@ -132,7 +302,16 @@ class FiniteCombinatoryLogic(Generic[T, C]):
         )
 
     def boolean_to_clauses(self, target: BooleanTerm[Type[T]]) -> list[Clause[T]]:
-        dnf = minimal_dnf_as_list(target)
+        if len(target.variables) <= self.max_exact_dnf_variables:
+            dnf = cached_dnf_as_list(
+                target, minimal_dnf_as_list, self.signature_order
+            )
+        elif self.large_dnf_method == "bdd":
+            dnf = cached_dnf_as_list(target, bdd_dnf_as_list, self.signature_order)
+        else:
+            dnf = cached_dnf_as_list(
+                target, heuristic_dnf_as_list, self.signature_order
+            )
 
         clauses: list[Clause[T]] = []
 
@@ -149,14 +328,75 @@ class FiniteCombinatoryLogic(Generic[T, C]):
 
             clauses.append((positive_intersection, frozenset(negatives)))
 
-        return clauses
+        return self._simplify_clauses(clauses)
+
+    def _equivalent_types(self, ty1: Type[T], ty2: Type[T]) -> bool:
+        return self.subtypes.check_subtype(ty1, ty2) and self.subtypes.check_subtype(
+            ty2, ty1
+        )
+
+    def _equivalent_clauses(self, clause1: Clause[T], clause2: Clause[T]) -> bool:
+        return (
+            self._equivalent_types(clause1[0], clause2[0])
+            and all(
+                any(self._equivalent_types(n1, n2) for n2 in clause2[1])
+                for n1 in clause1[1]
+            )
+            and all(
+                any(self._equivalent_types(n1, n2) for n1 in clause1[1])
+                for n2 in clause2[1]
+            )
+        )
+
+    def _simplify_clauses(self, clauses: Iterable[Clause[T]]) -> list[Clause[T]]:
+        """Simplify clauses with respect to subtyping.
+
+        - Clauses, whose positive part is a subtype of a negative part, are not inhabited.
+        - If n1 is a subtype of n2, then (not n2) implies (not n1), so only maximal negative
+          types are kept.
+        - Of several equivalent clauses only the first one is kept.
+        """
+
+        result: list[Clause[T]] = []
+        for positive, negatives in clauses:
+            if any(self.subtypes.check_subtype(positive, ty) for ty in negatives):
+                continue
+            clause = (
+                positive,
+                frozenset(maximal_elements(negatives, self.subtypes.check_subtype)),
+            )
+            if any(self._equivalent_clauses(clause, other) for other in result):
+                continue
+            result.append(clause)
+        return result
 
     def inhabit(
-        self, *targets: BooleanTerm[Type[T]] | Type[T] | Clause[T]
+        self,
+        *targets: BooleanTerm[Type[T]] | Type[T] | Clause[T],
+        progress: Optional[Callable[[InhabitationProgress], None]] = None,
+        cancel: Optional[Event] = None,
+        check_interval: int = 10,
     ) -> dict[
         Clause[T] | BooleanTerm[Type[T]] | Type[T],
         deque[tuple[C, list[Type[T] | Clause[T] | BooleanTerm[Type[T]]]]],
     ]:
+        """Compute a tree grammar of inhabitants for the targets.
+
+        Every check_interval clauses, the progress callback is called and the cancellation token
+        is checked. If cancel is set, the search stops and the clauses, which are not expanded yet,
+        get no rules. The result is then a consistent, but partial, grammar. A single clause can
+        take long to expand (it computes covers of the arrows of the combinators), so
+        check_interval bounds how many clauses are expanded after cancel is set. Checking is
+        cheap compared to expanding a clause.
+        """
+
+        if check_interval < 1:
+            raise ValueError(f"check_interval must be at least 1, got {check_interval}")
+        started = perf_counter()
+        # start of the current phase (see InhabitationStatistics.add_time)
+        start = started
+        statistics = self.statistics
+
         clause_targets: deque[Clause[T]] = deque()
         type_targets: deque[Type[T]] = deque()
         boolean_targets: dict[BooleanTerm[Type[T]], list[Clause[T]]] = {}
@@ -174,13 +414,32 @@ class FiniteCombinatoryLogic(Generic[T, C]):
         # dictionary of type |-> sequence of combinatory expressions
         memo: TreeGrammar[T, C] = dict()
 
+        if statistics is not None:
+            start = statistics.add_time("clauses", start)
+
+        processed = 0
         while clause_targets:
+            processed += 1
+            if processed % check_interval == 0:
+                if progress is not None:
+                    progress(
+                        InhabitationProgress(
+                            len(clause_targets), len(memo), perf_counter() - started
+                        )
+                    )
+                if cancel is not None and cancel.is_set():
+                    # unexpanded clauses have no (known) inhabitants
+                    for clause in clause_targets:
+                        memo.setdefault(clause, deque())
+                    break
             current_target = clause_targets.pop()
             if memo.get(current_target) is None:
                 # target type was not seen before
                 # paths: list[Type] = list(target.organized)
                 possibilities: deque[tuple[C, list[Clause[T]]]] = deque()
                 memo.update({current_target: possibilities})
+                if statistics is not None:
+                    statistics.clauses_processed += 1
                 # If the positive part is omega, then the result is junk
                 if current_target[0].is_omega:
                     continue
@@ -215,9 +474,25 @@ class FiniteCombinatoryLogic(Generic[T, C]):
                         ):
                             possibilities.append((combinator, subquery))
                             clause_targets.extendleft(subquery)
+                            if statistics is not None:
+                                statistics.rules_generated += 1
+                                if statistics.on_rule_added is not None:
+                                    statistics.on_rule_added(
+                                        current_target, combinator, subquery
+                                    )
+
+                if statistics is not None and statistics.on_clause_expanded is not None:
+                    statistics.on_clause_expanded(current_target, possibilities)
+
+        if statistics is not None:
+            start = statistics.add_time("expansion", start)
 
         # prune not inhabited types
-        FiniteCombinatoryLogic._prune(memo)
+        prune_iterations = self._prune(memo)
+
+        if statistics is not None:
+            statistics.prune_iterations += prune_iterations
+            start = statistics.add_time("prune", start)
 
         return_memo = cast(
             dict[
@@ -238,11 +513,14 @@ class FiniteCombinatoryLogic(Generic[T, C]):
         for typ in type_targets:
             return_memo[typ] = return_memo[(typ, frozenset({}))]
 
+        if statistics is not None:
+            statistics.add_time("rules", start)
+
         return return_memo
 
     @staticmethod
-    def _prune(memo: TreeGrammar[T, C]) -> None:
-        """Keep only productive grammar rules."""
+    def _prune(memo: TreeGrammar[T, C]) -> int:
+        """Keep only productive grammar rules. Returns the number of iterations needed."""
 
         def is_ground(
             args: list[Clause[T]], ground_types: set[Clause[T] | BooleanTerm[Type[T]]]
@@ -256,8 +534,10 @@ class FiniteCombinatoryLogic(Generic[T, C]):
             ),
             memo.keys(),
         )
+        iterations = 0
         # initialize inhabited (ground) types
         while new_ground_types:
+            iterations += 1
             ground_types.update(new_ground_types)
             new_ground_types, candidates = partition(
                 lambda ty: any(
@@ -272,3 +552,4 @@ class FiniteCombinatoryLogic(Generic[T, C]):
                 for possibility in possibilities
                 if is_ground(possibility[1], ground_types)
             )
+        return iterations
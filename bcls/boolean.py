@@ -9,6 +9,8 @@ algorithm.
 The algorithm itself uses the following steps:
     1) Generate all variable mappings, that evaluate the term to "true" (called minterms). We
         group this list by the number of variables, that are mapped to "true".
+        Instead of evaluating the term for every mapping, we compute its whole truth table at once
+        by bitwise operations on integers (one bit per mapping).
     2) Minimize these mappings in the sense, that if two variable mappings differ in the value of
         exactly one variable, this variable is unnecessary, and both mappings can be merged into
         one mapping, that does not set this variable to any value.
@@ -108,15 +110,18 @@ to cover all minterms.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Hashable, Iterable
+from collections import Counter
+from collections.abc import Callable, Hashable, Iterable, Iterator
 from dataclasses import dataclass
-from functools import cached_property
+from functools import cached_property, lru_cache, reduce
 from itertools import chain, compress, groupby
-from typing import Generic, Optional, TypeAlias, TypeVar
+from operator import or_
+from typing import Any, Generic, Literal, Optional, TypeAlias, TypeVar, cast
 
-from .combinatorics import minimal_covers
+from .combinatorics import minimum_cover
 
 T = TypeVar("T", bound=Hashable, covariant=True)
+V = TypeVar("V", bound=Hashable)  # variables, that occur as parameters
 
 Mapping: TypeAlias = tuple[int, int]
 """Mappings are encoded as a tuple of integers. The binary representation of the first integer
@@ -173,13 +178,14 @@ class BooleanTerm(Generic[T], ABC):
     ) -> bool:
         """bool: Evaluate the term given a variable mapping
 
-        Results of this evaluation are cached.
+        Results of this evaluation are cached in evaluate_cache, which can be shared between
+        calls. To evaluate a term for many mappings, an Evaluator should be created once.
 
         Note:
             - The second field of a mapping is completely ignored in this evaluation.
               To guarantee a correct result, it should be 0.
             - This could have been an evaluate method for each child class. But to incorporate the
-              caching and limit the amount of function calls, it was done at the parent class.
+              caching and limit the amount of function calls, it was done in an Evaluator.
 
 
         Args:
@@ -187,35 +193,97 @@ class BooleanTerm(Generic[T], ABC):
                                  in the signature
             signature (list[T]): The list of all variables in the "domain" of the mapping
         """
-        # We are only interested in variables, that actually occur in the term
-        interesting_variables = mapping[0] & self._mask_signature(signature)
-
-        # Use a cached result, if such an evaluation was already queried
-        if evaluate_cache is None:
-            evaluate_cache = {}
-        if (self, interesting_variables) in evaluate_cache:
-            return evaluate_cache[(self, interesting_variables)]
-
-        value = False
-        match self:
-            case And(inner):
-                # an And-term evaluates to true iff all of its subterms evaluate to true
-                value = all(subterm.evaluate(mapping, signature) for subterm in inner)
-            case Or(inner):
-                # an Or-term evaluates to true iff any of its subterms evaluate to true
-                value = any(subterm.evaluate(mapping, signature) for subterm in inner)
-            case Not(inner):
-                # a Not-Term evaluates to true iff its subterm evaluate to false
-                value = not inner.evaluate(mapping, signature)
-            case Var(_):
-                # interesting_variables has exactly one 1, if the only variable of this subterm is
-                # true, 0 otherwise.
-                value = interesting_variables != 0
+        key = tuple(signature)
+        evaluator = self._evaluators.get(key)
+        if evaluator is None:
+            evaluator = self._evaluators.setdefault(key, Evaluator(self, signature))
+        return evaluator(mapping, {} if evaluate_cache is None else evaluate_cache)
+
+    @cached_property
+    def _evaluators(self) -> dict[tuple[Hashable, ...], Evaluator[Any]]:
+        """Evaluators of this term for the signatures, it was evaluated with."""
+        return {}
+
+    def compile(self, signature: list[T]) -> Callable[[int], bool]:
+        """Callable[[int], bool]: Generate a function evaluating the term for a given signature
 
-        # cache the result for future lookups
-        evaluate_cache[(self, interesting_variables)] = value
+        The generated function takes the first component of a mapping (the values of the
+        variables) and is equivalent to `lambda x: self.evaluate((x, 0), signature)`. Each variable
+        is tested by a single bitwise and, operands of And and Or are ordered by size to make
+        short-circuiting cheap. Subterms, which occur more than once, are evaluated once and bound
+        to a local variable, so the size of the function is linear in the number of subterms.
 
-        return value
+        Args:
+            signature (list[T]): The list of all variables in the "domain" of the mapping
+        """
+        bits = {
+            variable: 1 << (len(signature) - 1 - i) for i, variable in enumerate(signature)
+        }
+        # number of occurrences of each subterm as an operand of a distinct subterm
+        uses: Counter[BooleanTerm[T]] = Counter()
+        pending: list[BooleanTerm[T]] = [self]
+        visited: set[BooleanTerm[T]] = {self}
+        while pending:
+            match pending.pop():
+                case Not(inner):
+                    operands: Iterable[BooleanTerm[T]] = (inner,)
+                case And(inner) | Or(inner):
+                    operands = inner
+                case _:
+                    continue
+            uses.update(operands)
+            for operand in operands:
+                if operand not in visited:
+                    visited.add(operand)
+                    pending.append(operand)
+
+        expressions: dict[BooleanTerm[T], str] = {}
+        assignments: list[str] = []
+
+        # post-order traversal, each subterm is translated after its subterms
+        stack: list[tuple[BooleanTerm[T], bool]] = [(self, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if current in expressions:
+                continue
+            match current:
+                case Var(name):
+                    expressions[current] = f"(m & {bits[name]} != 0)"
+                    continue
+                case Not(inner) if expanded:
+                    expressions[current] = f"(not {expressions[inner]})"
+                case Not(inner):
+                    stack.extend(((current, True), (inner, False)))
+                    continue
+                case And(inner) | Or(inner) if expanded:
+                    translated = sorted((expressions[subterm] for subterm in inner), key=len)
+                    if len(translated) == 0:
+                        expressions[current] = str(isinstance(current, And))
+                    else:
+                        operator = " and " if isinstance(current, And) else " or "
+                        expressions[current] = f"({operator.join(translated)})"
+                case And(inner) | Or(inner):
+                    stack.append((current, True))
+                    stack.extend((subterm, False) for subterm in inner)
+                    continue
+            if uses[current] > 1:
+                # shared subterms are evaluated before their first use
+                local = f"s{len(assignments)}"
+                assignments.append(f"    {local} = {expressions[current]}")
+                expressions[current] = local
+
+        source = "\n".join(
+            ("def evaluate(m):", *assignments, f"    return {expressions[self]}")
+        )
+        namespace: dict[str, Any] = {}
+        try:
+            exec(source, namespace)
+        except (SyntaxError, RecursionError, MemoryError):
+            # the expression is nested too deeply for the python parser
+            evaluator = Evaluator(self, signature)
+            return lambda x: evaluator((x, 0))
+        function: Callable[[int], bool] = namespace["evaluate"]
+        return function
 
     @abstractmethod
     def __str__(self) -> str:
@@ -266,9 +334,13 @@ class And(BooleanTerm[T]):
     def __str__(self) -> str:
         return f"({' & '.join(str(subterm) for subterm in self.inner)})"
 
-    def __hash__(self) -> int:
+    @cached_property
+    def _hash(self) -> int:
         return hash((And, self.inner))
 
+    def __hash__(self) -> int:
+        return self._hash
+
 
 class Or(BooleanTerm[T]):
     """Or constructor for boolean terms, takes a list of subterms"""
@@ -291,9 +363,13 @@ class Or(BooleanTerm[T]):
     def __str__(self) -> str:
         return f"({' | '.join(str(subterm) for subterm in self.inner)})"
 
-    def __hash__(self) -> int:
+    @cached_property
+    def _hash(self) -> int:
         return hash((Or, self.inner))
 
+    def __hash__(self) -> int:
+        return self._hash
+
 
 @dataclass(frozen=True)
 class Var(BooleanTerm[T]):
@@ -308,9 +384,13 @@ class Var(BooleanTerm[T]):
     def __str__(self) -> str:
         return str(self.name)
 
-    def __hash__(self) -> int:
+    @cached_property
+    def _hash(self) -> int:
         return hash((Var, self.name))
 
+    def __hash__(self) -> int:
+        return self._hash
+
 
 class Not(BooleanTerm[T]):
     """Negation constructor for boolean terms."""
@@ -332,9 +412,123 @@ class Not(BooleanTerm[T]):
     def __str__(self) -> str:
         return f"~{self.inner}"
 
-    def __hash__(self) -> int:
+    @cached_property
+    def _hash(self) -> int:
         return hash((Not, self.inner))
 
+    def __hash__(self) -> int:
+        return self._hash
+
+
+class Evaluator(Generic[V]):
+    """Evaluates a boolean term for mappings of a fixed signature.
+
+    On creation, the mask of variables (see BooleanTerm._mask_signature) of each subterm is
+    computed once, and the operands of And and Or are ordered by their size, so that
+    short-circuiting skips the expensive operands. Results are cached for each subterm and the
+    values of the variables in it, and the cache is shared by all subterms and (unless a cache is
+    given for a call) all evaluations. Terms are evaluated without recursion.
+    """
+
+    def __init__(self, term: BooleanTerm[V], signature: list[V]):
+        self.term = term
+        self.cache: dict[tuple[BooleanTerm[V], int], bool] = {}
+        self.masks: dict[BooleanTerm[V], int] = {}
+        self.operands: dict[BooleanTerm[V], list[BooleanTerm[V]]] = {}
+        bits = {
+            variable: 1 << (len(signature) - 1 - i) for i, variable in enumerate(signature)
+        }
+        sizes: dict[BooleanTerm[V], int] = {}
+
+        # post-order traversal, each subterm is prepared after its subterms
+        stack: list[tuple[BooleanTerm[V], bool]] = [(term, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if current in self.masks:
+                continue
+            match current:
+                case Var(name):
+                    self.masks[current] = bits.get(name, 0)
+                    sizes[current] = 1
+                case Not(inner) if expanded:
+                    self.masks[current] = self.masks[inner]
+                    sizes[current] = sizes[inner] + 1
+                case Not(inner):
+                    stack.extend(((current, True), (inner, False)))
+                case And(inner) | Or(inner) if expanded:
+                    operands = sorted(inner, key=sizes.__getitem__)
+                    self.operands[current] = operands
+                    self.masks[current] = reduce(
+                        or_, (self.masks[subterm] for subterm in operands), 0
+                    )
+                    sizes[current] = sum(sizes[subterm] for subterm in operands) + 1
+                case And(inner) | Or(inner):
+                    stack.append((current, True))
+                    stack.extend((subterm, False) for subterm in inner)
+
+    def __call__(
+        self,
+        mapping: Mapping,
+        cache: Optional[dict[tuple[BooleanTerm[V], int], bool]] = None,
+    ) -> bool:
+        """bool: Evaluate the term for a mapping (the second field of the mapping is ignored)"""
+
+        return self._evaluate(self.term, mapping[0], self.cache if cache is None else cache)
+
+    def _evaluate(
+        self,
+        term: BooleanTerm[V],
+        values: int,
+        cache: dict[tuple[BooleanTerm[V], int], bool],
+    ) -> bool:
+        # pending Not, And and Or terms above the current term, and the index of the operand,
+        # which is evaluated, in And and Or terms
+        frames: list[tuple[BooleanTerm[V], int]] = []
+        current = term
+        while True:
+            # We are only interested in variables, that actually occur in the term
+            interesting_variables = values & self.masks[current]
+
+            # Use a cached result, if such an evaluation was already queried
+            key = (current, interesting_variables)
+            value = cache.get(key)
+            if value is None:
+                match current:
+                    case Not(inner):
+                        frames.append((current, 0))
+                        current = inner
+                        continue
+                    case And(_) | Or(_) if self.operands[current]:
+                        frames.append((current, 0))
+                        current = self.operands[current][0]
+                        continue
+                    case And(_) | Or(_):
+                        value = isinstance(current, And)
+                    case _:
+                        # interesting_variables has exactly one 1, if the only variable of this
+                        # subterm is true, 0 otherwise.
+                        value = interesting_variables != 0
+                cache[key] = value
+
+            # pass the value to the pending terms, until an operand is left to evaluate
+            while frames:
+                parent, index = frames.pop()
+                if isinstance(parent, Not):
+                    # a Not-Term evaluates to true iff its subterm evaluate to false
+                    value = not value
+                else:
+                    # an And-term evaluates to false iff any of its subterms evaluate to false,
+                    # an Or-term evaluates to true iff any of its subterms evaluate to true
+                    operands = self.operands[parent]
+                    if value == isinstance(parent, And) and index + 1 < len(operands):
+                        frames.append((parent, index + 1))
+                        current = operands[index + 1]
+                        break
+                # cache the result for future lookups
+                cache[(parent, values & self.masks[parent])] = value
+            else:
+                return value
+
 
 def mapping_lt(mapping: Mapping, other: Mapping) -> bool:
     """bool: Compute the inclusion operation of mappings for the set cover algorithm."""
@@ -380,29 +574,221 @@ def to_clause(
 def generate_all_variable_mappings(length_of_signature: int) -> Iterable[Mapping]:
     """Iterable[Mapping]: Generate all possible variable mappings for a signature of a given length
 
-    Since a mapping is encoded by an integer, this is done by counting to 2**length_of_signature.
-    The result is sorted by the amount of 1s in the binary representation of the integer.
+    Since a mapping is encoded by an integer, this enumerates all integers below
+    2**length_of_signature. The result is sorted by the amount of 1s in the binary representation
+    of the integer. Integers with the same amount of 1s are generated in increasing order using
+    Gosper's hack, so the mappings are never materialized.
     """
 
-    return (
-        (x, 0)
-        for x in sorted(range(2**length_of_signature), key=lambda x: x.bit_count())
-    )
+    for class_level in range(length_of_signature + 1):
+        yield from ((x, 0) for x in same_bit_count(class_level, length_of_signature))
+
+
+def same_bit_count(bit_count: int, length: int) -> Iterator[int]:
+    """Iterator[int]: All integers below 2**length with a given amount of 1s in increasing order."""
+
+    if bit_count == 0:
+        yield 0
+        return
+    x = (1 << bit_count) - 1
+    while x < 1 << length:
+        yield x
+        # Gosper's hack: the next larger integer with the same amount of 1s
+        lowest = x & -x
+        ripple = x + lowest
+        x = (((ripple ^ x) >> 2) // lowest) | ripple
+
+
+def variable_truth_table(position: int, length_of_signature: int) -> int:
+    """int: The truth table of the variable at a position of a signature of a given length.
+
+    The bit at index x of the result is set iff the variable is true in the mapping (x, 0).
+    """
+
+    # the variable corresponds to bit `period` of a mapping, hence in the truth table its value
+    # alternates between blocks of `period` zeros and `period` ones
+    period = 1 << (length_of_signature - 1 - position)
+    table = ((1 << period) - 1) << period
+    # double the table until it covers all 2**length_of_signature mappings
+    length = 2 * period
+    while length < 1 << length_of_signature:
+        table |= table << length
+        length *= 2
+    return table
+
+
+def truth_table(term: BooleanTerm[T], signature: list[T]) -> int:
+    """int: Compute the truth table of a term as a packed integer.
+
+    The bit at index x of the result is set iff the term evaluates to true for the mapping (x, 0).
+    Instead of evaluating the term for each of the 2**len(signature) mappings, each subterm is
+    evaluated once for all mappings using bitwise operations on the truth tables of its subterms.
+    """
+
+    full = (1 << (1 << len(signature))) - 1
+    positions = {variable: i for i, variable in enumerate(signature)}
+    tables: dict[BooleanTerm[T], int] = {}
+
+    # post-order traversal, each subterm is evaluated after its subterms
+    stack: list[tuple[BooleanTerm[T], bool]] = [(term, False)]
+    while stack:
+        current, expanded = stack.pop()
+        if current in tables:
+            continue
+        match current:
+            case Var(name):
+                tables[current] = variable_truth_table(positions[name], len(signature))
+            case Not(inner) if expanded:
+                tables[current] = full ^ tables[inner]
+            case Not(inner):
+                stack.extend(((current, True), (inner, False)))
+            case And(inner) if expanded:
+                table = full
+                for subterm in inner:
+                    table &= tables[subterm]
+                tables[current] = table
+            case Or(inner) if expanded:
+                table = 0
+                for subterm in inner:
+                    table |= tables[subterm]
+                tables[current] = table
+            case And(inner) | Or(inner):
+                stack.append((current, True))
+                stack.extend((subterm, False) for subterm in inner)
+    return tables[term]
+
+
+TRUTH_TABLE_MAX_VARIABLES = 20
+"""Maximal length of a signature, for which get_minterms computes a full truth table."""
+
+
+def restrict(
+    term: BooleanTerm[V], variable: V, value: bool
+) -> BooleanTerm[V] | bool:
+    """BooleanTerm[T] | bool: Substitute a value for a variable and simplify the result.
+
+    Subterms without the variable are kept, except for subterms without any variables (e.g. the
+    empty disjunction `Or()`), which are constant and replaced by their value. If the value of
+    the term is decided by the substitution, the result is a bool.
+    """
+
+    results: dict[BooleanTerm[V], BooleanTerm[V] | bool] = {}
+
+    # post-order traversal, each subterm is restricted after its subterms
+    stack: list[tuple[BooleanTerm[V], bool]] = [(term, False)]
+    while stack:
+        current, expanded = stack.pop()
+        if current in results:
+            continue
+        if not current.variables:
+            results[current] = truth_table(current, []) == 1
+            continue
+        if variable not in current.variables:
+            results[current] = current
+            continue
+        match current:
+            case Var(_):
+                results[current] = value
+            case Not(inner) if expanded:
+                restricted = results[inner]
+                results[current] = (
+                    not restricted if isinstance(restricted, bool) else Not(restricted)
+                )
+            case Not(inner):
+                stack.extend(((current, True), (inner, False)))
+            case And(inner) | Or(inner) if expanded:
+                # True is neutral for And and decides Or, False vice versa
+                neutral = isinstance(current, And)
+                subterms: list[BooleanTerm[V]] = []
+                result: BooleanTerm[V] | bool | None = None
+                for subterm in inner:
+                    restricted = results[subterm]
+                    if isinstance(restricted, bool):
+                        if restricted != neutral:
+                            result = restricted
+                            break
+                    else:
+                        subterms.append(restricted)
+                if result is None:
+                    if not subterms:
+                        result = neutral
+                    elif len(subterms) == 1:
+                        result = subterms[0]
+                    else:
+                        result = And(*subterms) if neutral else Or(*subterms)
+                results[current] = result
+            case And(inner) | Or(inner):
+                stack.append((current, True))
+                stack.extend((subterm, False) for subterm in inner)
+            case _:
+                raise TypeError(f"Unsupported boolean term: {current}")
+    return results[term]
+
+
+def stream_minterms(term: BooleanTerm[T], signature: list[T]) -> Iterator[int]:
+    """Iterator[int]: Generate all mappings (as integers), for which a term evaluates to true
+
+    Variables are assigned in the order of the signature. After each assignment the term is
+    simplified, and the search stops as soon as the partial assignment decides the term. If the
+    term is decided true, all completions of the partial assignment are generated, if it is
+    decided false, none are. Partial assignments, which decide the term early, prune the search,
+    but a term decided only by its last variables (e.g. `And(x, Not(x))`, where x is last in the
+    signature) still requires visiting up to 2**len(signature) partial assignments.
+    The result is in no particular order.
+    """
+
+    length = len(signature)
+    # a term without variables is constant, the search starts with a decided term
+    root: BooleanTerm[T] | bool = term if term.variables else truth_table(term, []) == 1
+    # partial assignments (value, position of the next variable, simplified term)
+    stack: list[tuple[int, int, BooleanTerm[T] | bool]] = [(0, 0, root)]
+    while stack:
+        value, position, current = stack.pop()
+        if current is False:
+            continue
+        if current is True:
+            free = length - position
+            yield from (value << free | rest for rest in range(1 << free))
+            continue
+        assert not isinstance(current, bool)
+        if position == length:
+            # restricting all variables of the signature decides terms over the signature
+            raise ValueError(f"Variables of {current} are not in the signature")
+        variable = signature[position]
+        for assignment in (False, True):
+            stack.append(
+                (
+                    value << 1 | assignment,
+                    position + 1,
+                    restrict(current, variable, assignment),
+                )
+            )
 
 
 def get_minterms(term: BooleanTerm[T], signature: list[T]) -> Iterable[Mapping]:
     """Iterable[Mapping]: Generate all mappings for a term, that evaluate to true
 
     The result is sorted by the amount of variables, that are mapped to true.
+    For small signatures the minterms are read from the truth table of the term. For large
+    signatures they are streamed (see stream_minterms), so memory scales with the number of
+    minterms rather than with 2**len(signature).
     """
-    all_variable_mappings = list(generate_all_variable_mappings(len(signature)))
 
-    evaluate_cache: dict[tuple[BooleanTerm[T], int], bool] = {}
+    if len(signature) > TRUTH_TABLE_MAX_VARIABLES:
+        classes: list[list[int]] = [[] for _ in range(len(signature) + 1)]
+        for x in stream_minterms(term, signature):
+            classes[x.bit_count()].append(x)
+        return ((x, 0) for class_level in classes for x in sorted(class_level))
 
-    return filter(
-        lambda mapping: term.evaluate(mapping, signature, evaluate_cache),
-        all_variable_mappings,
-    )
+    # the truth table in binary, reversed such that the character at index x is the value of x
+    table = bin(truth_table(term, signature))[:1:-1]
+    minterms: list[int] = []
+    x = table.find("1")
+    while x >= 0:
+        minterms.append(x)
+        x = table.find("1", x + 1)
+
+    return ((x, 0) for x in sorted(minterms, key=lambda x: x.bit_count()))
 
 
 def get_prime_implicants(
@@ -493,22 +879,329 @@ def get_prime_implicants(
         merged = set()
 
 
+def implicant_cost(mapping: Mapping, length_of_signature: int) -> int:
+    """int: The cost of an implicant in a dnf, i.e. its number of literals plus one."""
+
+    return length_of_signature - mapping[1].bit_count() + 1
+
+
 def get_min_prime_implicants(
     term: BooleanTerm[T], signature: list[T]
 ) -> list[list[Mapping]]:
+    """list[list[Mapping]]: Compute a cheapest cover of the minterms by prime implicants
+
+    The result is empty, if there is no cover, or contains a single cover, which minimizes the
+    number of implicants plus the number of literals (see implicant_cost).
+    """
+
     minterms = list(get_minterms(term, signature))
     primes = get_prime_implicants(minterms, len(signature))
-    return minimal_covers(list(primes), minterms, mapping_lt)
+    cover = minimum_cover(
+        list(primes),
+        minterms,
+        mapping_lt,
+        lambda mapping: implicant_cost(mapping, len(signature)),
+    )
+    return [] if cover is None else [cover]
+
+
+Cube: TypeAlias = tuple[int, int]
+"""Cubes (conjunctions of literals) are encoded as a tuple of integers. The binary representation of
+the first integer corresponds to the positive literals, the binary representation of the second
+integer corresponds to the negative literals. Bits correspond to variables like in mappings."""
 
 
-def minimal_dnf(term: BooleanTerm[T]) -> Or[T]:
+def absorb_cubes(cubes: Iterable[Cube]) -> list[Cube]:
+    """list[Cube]: Remove contradictory cubes and cubes, that are contained in another cube.
+
+    A cube is contained in another cube, if it has all literals of the other cube. The result is
+    sorted by the number of literals.
+    """
+
+    result: list[Cube] = []
+    for positives, negatives in sorted(
+        set(cubes), key=lambda cube: (cube[0] | cube[1]).bit_count()
+    ):
+        if positives & negatives != 0:
+            continue
+        if any(
+            p & positives == p and n & negatives == n for (p, n) in result
+        ):
+            continue
+        result.append((positives, negatives))
+    return result
+
+
+HEURISTIC_MAX_OFF_CUBES = 4096
+"""Maximal number of cubes of the negation of a term, which get_heuristic_implicants computes
+(see get_dnf_cubes). For terms with more, implicants are checked on the term itself."""
+
+
+def get_dnf_cubes(
+    term: BooleanTerm[T], signature: list[T], max_off_cubes: Optional[int] = None
+) -> tuple[list[Cube], Optional[list[Cube]]]:
+    """tuple[list[Cube], Optional[list[Cube]]]: Compute cubes covering the term and its negation
+
+    The cubes are obtained syntactically by pushing negations to the variables and distributing
+    conjunctions over disjunctions, where contradictory and contained cubes are dropped as soon
+    as possible. The first list covers exactly the mappings, that evaluate the term to true, the
+    second list covers exactly the mappings, that evaluate the term to false.
+
+    Distributing a conjunction of disjunctions multiplies their numbers of cubes, so the number
+    of cubes (and the runtime) can be exponential in the size of the term. This is typical for
+    the negation of a term in dnf. If computing the cubes of the negation needs more than
+    max_off_cubes cubes, the second component is None.
+    """
+
+    bits = {variable: 1 << (len(signature) - 1 - i) for i, variable in enumerate(signature)}
+    on_cubes = _syntactic_cubes(term, False, bits, None)
+    assert on_cubes is not None
+    return on_cubes, _syntactic_cubes(term, True, bits, max_off_cubes)
+
+
+def _syntactic_cubes(
+    term: BooleanTerm[T], negate: bool, bits: dict[T, int], max_cubes: Optional[int]
+) -> Optional[list[Cube]]:
+    """Cubes of a (negated) term or None, if more than max_cubes cubes are needed."""
+
+    # cubes of subterms, the flag indicates, that the subterm is negated
+    cubes: dict[tuple[BooleanTerm[T], bool], list[Cube]] = {}
+
+    # post-order traversal, each subterm is translated after its subterms
+    stack: list[tuple[BooleanTerm[T], bool, bool]] = [(term, negate, False)]
+    while stack:
+        current, negated, expanded = stack.pop()
+        if (current, negated) in cubes:
+            continue
+        match current:
+            case Var(name):
+                bit = bits[name]
+                cubes[(current, negated)] = [(0, bit)] if negated else [(bit, 0)]
+            case Not(inner) if expanded:
+                cubes[(current, negated)] = cubes[(inner, not negated)]
+            case Not(inner):
+                stack.extend(((current, negated, True), (inner, not negated, False)))
+            case And(inner) | Or(inner) if expanded:
+                # negated disjunctions are conjunctions of negations (and vice versa)
+                if isinstance(current, And) != negated:
+                    result: list[Cube] = [(0, 0)]
+                    for subterm in inner:
+                        subcubes = cubes[(subterm, negated)]
+                        if max_cubes is not None and len(result) * len(subcubes) > max_cubes:
+                            return None
+                        result = absorb_cubes(
+                            (p1 | p2, n1 | n2) for (p1, n1) in result for (p2, n2) in subcubes
+                        )
+                else:
+                    result = absorb_cubes(
+                        chain.from_iterable(cubes[(subterm, negated)] for subterm in inner)
+                    )
+                    if max_cubes is not None and len(result) > max_cubes:
+                        return None
+                cubes[(current, negated)] = result
+            case And(inner) | Or(inner):
+                stack.append((current, negated, True))
+                stack.extend((subterm, negated, False) for subterm in inner)
+    return cubes[(term, negate)]
+
+
+def is_implicant(term: BooleanTerm[T], signature: list[T], cube: Cube) -> bool:
+    """bool: Decide whether all mappings in a cube evaluate the term to true.
+
+    The literals of the cube are substituted into the term, then the negation of the restricted
+    term is searched for a minterm (see stream_minterms).
+    """
+
+    positives, negatives = cube
+    restricted: BooleanTerm[T] | bool = term
+    for i, variable in enumerate(signature):
+        bit = 1 << (len(signature) - 1 - i)
+        if isinstance(restricted, bool):
+            break
+        if (positives | negatives) & bit:
+            restricted = restrict(restricted, variable, positives & bit != 0)
+    if isinstance(restricted, bool):
+        return restricted
+    remaining = [variable for variable in signature if variable in restricted.variables]
+    return next(stream_minterms(Not(restricted), remaining), None) is None
+
+
+def expand_cube(cube: Cube, off_cubes: list[Cube] | Callable[[Cube], bool]) -> Cube:
+    """Cube: Greedily remove literals from a cube, as long as it does not intersect off_cubes.
+
+    Instead of off_cubes, a function deciding, whether a cube is an implicant, can be given.
+    """
+
+    positives, negatives = cube
+    literals = positives | negatives
+    while literals:
+        bit = literals & -literals
+        literals ^= bit
+        new_positives, new_negatives = positives & ~bit, negatives & ~bit
+        if callable(off_cubes):
+            implicant = off_cubes((new_positives, new_negatives))
+        else:
+            # two cubes intersect iff they do not contain complementary literals
+            implicant = all(
+                (new_positives & n) != 0 or (new_negatives & p) != 0 for (p, n) in off_cubes
+            )
+        if implicant:
+            positives, negatives = new_positives, new_negatives
+    return (positives, negatives)
+
+
+def get_heuristic_implicants(term: BooleanTerm[T], signature: list[T]) -> list[Mapping]:
+    """list[Mapping]: Compute a small (not necessarily minimal) set of prime implicants
+
+    This is a simplified version of the expansion and irredundancy steps of the Espresso heuristic:
+    Starting from the syntactic cubes of the term, each cube is expanded to a prime implicant by
+    removing literals as long as it does not intersect the cubes of the negated term. Cubes
+    contained in an already expanded cube are dropped.
+
+    No minterms are enumerated, but the number of syntactic cubes can be exponential in the size
+    of the term (see get_dnf_cubes). If the negated term has more than HEURISTIC_MAX_OFF_CUBES
+    cubes, each expansion step checks the implicant on the term instead (see is_implicant).
+    """
+
+    on_cubes, off_cubes = get_dnf_cubes(term, signature, HEURISTIC_MAX_OFF_CUBES)
+    if off_cubes is None:
+        return expand_cover(
+            on_cubes, lambda cube: is_implicant(term, signature, cube), len(signature)
+        )
+    return expand_cover(on_cubes, off_cubes, len(signature))
+
+
+def expand_cover(
+    on_cubes: list[Cube],
+    off_cubes: list[Cube] | Callable[[Cube], bool],
+    length_of_signature: int,
+) -> list[Mapping]:
+    """list[Mapping]: Expand cubes covering exactly the mappings, that do not intersect off_cubes,
+    to a set of prime implicants covering the same mappings (see get_heuristic_implicants).
+
+    The runtime is at least the product of the numbers of on_cubes and off_cubes."""
+
+    implicants: list[Cube] = []
+    for positives, negatives in absorb_cubes(on_cubes):
+        if any(p & positives == p and n & negatives == n for (p, n) in implicants):
+            continue
+        implicants.append(expand_cube((positives, negatives), off_cubes))
+
+    full = (1 << length_of_signature) - 1
+    return [
+        (positives, full & ~(positives | negatives))
+        for (positives, negatives) in absorb_cubes(implicants)
+    ]
+
+
+SignatureOrder: TypeAlias = Literal["frequency", "name", "unordered"]
+"""Heuristics for the order of the variables in a signature (see order_signature)."""
+
+
+def order_signature(
+    term: BooleanTerm[V], signature_order: SignatureOrder = "frequency"
+) -> list[V]:
+    """list[V]: Compute a signature for a term, i.e. an order of its variables
+
+    The following heuristics are available:
+
+        * "frequency": Variables, that occur more often in the term, come first. They are the
+          most significant bits of mappings, so partial assignments (see stream_minterms) decide
+          the term earlier. Ties are broken by the first occurrence in a depth-first traversal,
+          which keeps variables of the same subterm adjacent (which is important for BDDs).
+        * "name": Variables are sorted by their string representation.
+        * "unordered": The iteration order of term.variables. This is not deterministic across
+          runs, if the hashes of the variables are not.
+
+    Except for "unordered", the result only depends on the term (and the string representation of
+    its variables), so the chosen prime implicants are reproducible.
+    """
+
+    match signature_order:
+        case "unordered":
+            return list(term.variables)
+        case "name":
+            return sorted(term.variables, key=str)
+        case "frequency":
+            # number of occurrences of each variable in a subterm (shared subterms are counted
+            # once for each occurrence) and a canonical string for each subterm, which does not
+            # depend on the iteration order of the operands of And and Or
+            occurrences: dict[BooleanTerm[V], Counter[V]] = {}
+            keys: dict[BooleanTerm[V], str] = {}
+            stack: list[tuple[BooleanTerm[V], bool]] = [(term, False)]
+            while stack:
+                current, expanded = stack.pop()
+                if current in occurrences:
+                    continue
+                match current:
+                    case Var(name):
+                        occurrences[current] = Counter((name,))
+                        keys[current] = str(name)
+                    case Not(inner) if expanded:
+                        occurrences[current] = occurrences[inner]
+                        keys[current] = f"~{keys[inner]}"
+                    case Not(inner):
+                        stack.extend(((current, True), (inner, False)))
+                    case And(inner) | Or(inner) if expanded:
+                        counter: Counter[V] = Counter()
+                        for subterm in inner:
+                            counter.update(occurrences[subterm])
+                        occurrences[current] = counter
+                        operator = " & " if isinstance(current, And) else " | "
+                        keys[current] = f"({operator.join(sorted(map(keys.__getitem__, inner)))})"
+                    case And(inner) | Or(inner):
+                        stack.append((current, True))
+                        stack.extend((subterm, False) for subterm in inner)
+
+            # first occurrence of each variable, visiting operands in the order of their keys
+            first_occurrence: dict[V, int] = {}
+            pending: list[BooleanTerm[V]] = [term]
+            while pending:
+                match pending.pop():
+                    case Var(name):
+                        first_occurrence.setdefault(name, len(first_occurrence))
+                    case Not(inner):
+                        pending.append(inner)
+                    case And(inner) | Or(inner):
+                        pending.extend(sorted(inner, key=keys.__getitem__, reverse=True))
+
+            frequency = occurrences[term]
+            return sorted(
+                term.variables,
+                key=lambda variable: (-frequency[variable], first_occurrence[variable]),
+            )
+    raise ValueError(f"Unknown signature order: {signature_order}")
+
+
+def heuristic_dnf(
+    term: BooleanTerm[T], signature_order: SignatureOrder = "frequency"
+) -> Or[T]:
+    """BooleanTerm[T]: Compute a small (not necessarily minimal) dnf for a given boolean term
+
+    In contrast to minimal_dnf, this does not enumerate the mappings of the variables, but its
+    runtime can still be exponential in the size of the term (see get_heuristic_implicants).
+    The result has the same format as the result of minimal_dnf.
+    """
+
+    signature = order_signature(term, signature_order)
+    return Or[T](
+        *(
+            And[T](*to_clause(implicant, signature))
+            for implicant in get_heuristic_implicants(term, signature)
+        )
+    )
+
+
+def minimal_dnf(
+    term: BooleanTerm[T], signature_order: SignatureOrder = "frequency"
+) -> Or[T]:
     """BooleanTerm[T]: Compute the minimal dnf for a given boolean term
 
     The result is in dnf. If the result is "Or(And([]))", it corresponds to the value True, if the
     result is "Or([])" it corresponds to the value of False
     """
 
-    signature = list(term.variables)
+    signature = order_signature(term, signature_order)
     minimal_primes = get_min_prime_implicants(term, signature)
 
     if len(minimal_primes) == 0:
@@ -519,7 +1212,9 @@ def minimal_dnf(term: BooleanTerm[T]) -> Or[T]:
     )
 
 
-def minimal_cnf(term: BooleanTerm[T]) -> And[T]:
+def minimal_cnf(
+    term: BooleanTerm[T], signature_order: SignatureOrder = "frequency"
+) -> And[T]:
     """BooleanTerm[T]: Compute the minimal dnf for a given boolean term
 
     The result is in dnf. If the result is "Or(And([]))", it corresponds to the value True, if the
@@ -527,7 +1222,7 @@ def minimal_cnf(term: BooleanTerm[T]) -> And[T]:
     """
 
     nterm: BooleanTerm[T] = Not(term)
-    signature = list(nterm.variables)
+    signature = order_signature(nterm, signature_order)
     minimal_primes = get_min_prime_implicants(nterm, signature)
 
     if len(minimal_primes) == 0:
@@ -541,15 +1236,12 @@ def minimal_cnf(term: BooleanTerm[T]) -> And[T]:
     )
 
 
-def minimal_dnf_as_list(term: BooleanTerm[T]) -> list[list[tuple[bool, T]]]:
-    """list[list[tuple[bool, T]]]: Computes the minimal dnf and returns the result stripped of all
-                                   Constructors.
+def dnf_as_list(dnf_term: Or[T]) -> list[list[tuple[bool, T]]]:
+    """list[list[tuple[bool, T]]]: Strip a dnf of all Constructors.
 
     Since the format of the dnf is well known, this makes it easier to iterate over the clauses
     of the dnf of a term."""
 
-    dnf_term = minimal_dnf(term)
-
     if not isinstance(dnf_term, Or):
         raise RuntimeError(
             "minimal_dnf, did not return a dnf. This is most likely a bug."
@@ -577,6 +1269,173 @@ def minimal_dnf_as_list(term: BooleanTerm[T]) -> list[list[tuple[bool, T]]]:
     return output_list
 
 
+def minimal_dnf_as_list(
+    term: BooleanTerm[T], signature_order: SignatureOrder = "frequency"
+) -> list[list[tuple[bool, T]]]:
+    """list[list[tuple[bool, T]]]: Computes the minimal dnf and returns the result stripped of all
+                                   Constructors.
+
+    Since the format of the dnf is well known, this makes it easier to iterate over the clauses
+    of the dnf of a term."""
+
+    return dnf_as_list(minimal_dnf(term, signature_order))
+
+
+def heuristic_dnf_as_list(
+    term: BooleanTerm[T], signature_order: SignatureOrder = "frequency"
+) -> list[list[tuple[bool, T]]]:
+    """list[list[tuple[bool, T]]]: Computes a small dnf (see heuristic_dnf) and returns the result
+                                   stripped of all Constructors."""
+
+    return dnf_as_list(heuristic_dnf(term, signature_order))
+
+
+Shape: TypeAlias = tuple[Hashable, ...]
+"""The shape of a boolean term is the term with all variables replaced by integers (slots), encoded
+as nested tuples ("var", slot), ("not", shape), ("and", frozenset of shapes) or
+("or", frozenset of shapes)."""
+
+
+def get_shape(term: BooleanTerm[T]) -> tuple[Shape, list[T]]:
+    """tuple[Shape, list[T]]: Abstract the variables of a term to slots
+
+    Returns the shape of the term and the list of variables, where the variable at index i is
+    represented by slot i. Slots are assigned in a traversal, where subterms are ordered by their
+    skeleton (shape without slots), so terms with the same boolean structure usually get the same
+    shape, regardless of their variables.
+    """
+
+    # skeletons of subterms, post-order traversal
+    skeletons: dict[BooleanTerm[T], str] = {}
+    stack: list[tuple[BooleanTerm[T], bool]] = [(term, False)]
+    while stack:
+        current, expanded = stack.pop()
+        if current in skeletons:
+            continue
+        match current:
+            case Var(_):
+                skeletons[current] = "v"
+            case Not(inner) if expanded:
+                skeletons[current] = f"~{skeletons[inner]}"
+            case Not(inner):
+                stack.extend(((current, True), (inner, False)))
+            case And(inner) | Or(inner) if expanded:
+                operator = "&" if isinstance(current, And) else "|"
+                operands = ",".join(sorted(map(skeletons.__getitem__, inner)))
+                skeletons[current] = f"{operator}({operands})"
+            case And(inner) | Or(inner):
+                stack.append((current, True))
+                stack.extend((subterm, False) for subterm in inner)
+            case _:
+                raise TypeError(f"Unsupported boolean term: {current}")
+
+    # slots in the order of a depth-first traversal visiting operands ordered by their skeletons
+    slots: dict[T, int] = {}
+    visited: set[BooleanTerm[T]] = set()
+    pending: list[BooleanTerm[T]] = [term]
+    while pending:
+        current = pending.pop()
+        if current in visited:
+            continue
+        visited.add(current)
+        match current:
+            case Var(name):
+                slots.setdefault(name, len(slots))
+            case Not(inner):
+                pending.append(inner)
+            case And(inner) | Or(inner):
+                pending.extend(sorted(inner, key=skeletons.__getitem__, reverse=True))
+
+    # shapes of subterms, post-order traversal
+    shapes: dict[BooleanTerm[T], Shape] = {}
+    stack = [(term, False)]
+    while stack:
+        current, expanded = stack.pop()
+        if current in shapes:
+            continue
+        match current:
+            case Var(name):
+                shapes[current] = ("var", slots[name])
+            case Not(inner) if expanded:
+                shapes[current] = ("not", shapes[inner])
+            case Not(inner):
+                stack.extend(((current, True), (inner, False)))
+            case And(inner) | Or(inner) if expanded:
+                operator = "and" if isinstance(current, And) else "or"
+                shapes[current] = (operator, frozenset(map(shapes.__getitem__, inner)))
+            case And(inner) | Or(inner):
+                stack.append((current, True))
+                stack.extend((subterm, False) for subterm in inner)
+
+    return shapes[term], list(slots.keys())
+
+
+def term_of_shape(shape: Shape) -> BooleanTerm[int]:
+    """BooleanTerm[int]: The boolean term over slots corresponding to a shape."""
+
+    # terms of subshapes by identity (hashing nested shapes is linear in their size)
+    terms: dict[int, BooleanTerm[int]] = {}
+
+    # post-order traversal, each subshape is translated after its subshapes
+    stack: list[tuple[Shape, bool]] = [(shape, False)]
+    while stack:
+        current, expanded = stack.pop()
+        if id(current) in terms:
+            continue
+        match current:
+            case ("var", int(slot)):
+                terms[id(current)] = Var(slot)
+            case ("not", inner) if expanded:
+                terms[id(current)] = Not(terms[id(inner)])
+            case ("not", inner):
+                stack.extend(((current, True), (cast(Shape, inner), False)))
+            case ("and" | "or" as operator, frozenset() as inner) if expanded:
+                subterms = (terms[id(subshape)] for subshape in inner)
+                terms[id(current)] = And(*subterms) if operator == "and" else Or(*subterms)
+            case ("and" | "or", frozenset() as inner):
+                stack.append((current, True))
+                stack.extend((subshape, False) for subshape in inner)
+            case _:
+                raise TypeError(f"Unsupported shape: {current}")
+    return terms[id(shape)]
+
+
+DNF_CACHE_SIZE = 1024
+"""Maximal number of boolean structures, whose dnf is kept by cached_dnf_as_list."""
+
+
+DnfMethod: TypeAlias = Callable[
+    [BooleanTerm[int], SignatureOrder], list[list[tuple[bool, int]]]
+]
+"""Functions computing a dnf as list, e.g. minimal_dnf_as_list or heuristic_dnf_as_list."""
+
+
+@lru_cache(maxsize=DNF_CACHE_SIZE)
+def _dnf_of_shape(
+    shape: Shape, compute: DnfMethod, signature_order: SignatureOrder
+) -> list[list[tuple[bool, int]]]:
+    return compute(term_of_shape(shape), signature_order)
+
+
+def cached_dnf_as_list(
+    term: BooleanTerm[T],
+    compute: DnfMethod = minimal_dnf_as_list,
+    signature_order: SignatureOrder = "frequency",
+) -> list[list[tuple[bool, T]]]:
+    """list[list[tuple[bool, T]]]: Computes a dnf stripped of all Constructors using a cache
+
+    The dnf is computed by `compute` (e.g. minimal_dnf_as_list or heuristic_dnf_as_list) for the
+    shape of the term (see get_shape), and results are cached in a least recently used cache. So
+    terms with the same boolean structure (up to renaming of variables) share the computation.
+    """
+
+    shape, variables = get_shape(term)
+    return [
+        [(polarity, variables[slot]) for (polarity, slot) in clause]
+        for clause in _dnf_of_shape(shape, compute, signature_order)
+    ]
+
+
 def minimal_cnf_as_list(term: BooleanTerm[T]) -> list[list[tuple[bool, T]]]:
     """list[list[tuple[bool, T]]]: Computes the minimal cnf and returns the result stripped of all
                                    Constructors.
@@ -1,6 +1,8 @@
 from collections import deque
-from collections.abc import Callable, Iterable, Sequence
-from typing import TypeVar
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from functools import reduce
+from operator import or_
+from typing import Optional, TypeVar
 
 S = TypeVar("S")  # Type of Sets
 E = TypeVar("E")  # Type of Elements
@@ -91,3 +93,157 @@ def minimal_covers(
                 new_c.add(j)
                 covers.append(new_c)
     return [[sets[j] for j in c] for c in covers]
+
+
+def minimum_cover(
+    sets: list[S],
+    to_cover: list[E],
+    contains: Callable[[S, E], bool],
+    cost: Callable[[S], float] = lambda _: 1,
+) -> Optional[list[S]]:
+    """Compute a single cheapest cover of elements in to_cover using given sets.
+
+    The cost of a cover is the sum of the costs of its sets. Returns None, if there is no cover.
+
+    The search is a branch-and-bound, where each node of the search tree is reduced by
+    - choosing essential sets (the only set containing some element),
+    - removing dominated sets (covering a subset of the elements of a set, that is not more
+      expensive) and
+    - removing dominated elements (every set containing another element also contains it).
+    A greedy cover is used as initial upper bound, and branches are pruned using a lower bound
+    computed from elements, that do not share any set.
+    """
+
+    # coverage[j] has bit i set iff sets[j] contains to_cover[i]
+    coverage = [
+        sum(1 << i for i, element in enumerate(to_cover) if contains(s, element))
+        for s in sets
+    ]
+    costs = [cost(s) for s in sets]
+    everything = (1 << len(to_cover)) - 1
+    if reduce(or_, coverage, 0) & everything != everything:
+        return None
+
+    def elements(mask: int) -> Iterator[int]:
+        while mask:
+            lowest = mask & -mask
+            yield lowest.bit_length() - 1
+            mask ^= lowest
+
+    def covering(uncovered: int, candidates: list[int]) -> dict[int, int]:
+        """For each uncovered element the candidates containing it (as bit mask)."""
+        result = dict.fromkeys(elements(uncovered), 0)
+        for j in candidates:
+            for i in elements(coverage[j] & uncovered):
+                result[i] |= 1 << j
+        return result
+
+    def simplify(
+        uncovered: int, candidates: list[int]
+    ) -> Optional[tuple[int, list[int], list[int]]]:
+        """Reduce a node of the search tree. Returns None, if there is no cover."""
+        forced: list[int] = []
+        changed = True
+        while changed and uncovered:
+            changed = False
+            # dominated sets, sets covering more elements are considered first
+            dominating: list[int] = []
+            for j in sorted(
+                (j for j in candidates if coverage[j] & uncovered),
+                key=lambda j: (-(coverage[j] & uncovered).bit_count(), costs[j]),
+            ):
+                covered = coverage[j] & uncovered
+                if not any(
+                    covered & ~coverage[k] == 0 and costs[k] <= costs[j]
+                    for k in dominating
+                ):
+                    dominating.append(j)
+            changed = len(dominating) < len(candidates)
+            candidates = dominating
+
+            # essential sets
+            for i, containing in covering(uncovered, candidates).items():
+                if not uncovered & 1 << i:
+                    continue  # covered by a set chosen in this pass
+                if containing == 0:
+                    return None
+                if containing.bit_count() == 1:
+                    j = containing.bit_length() - 1
+                    forced.append(j)
+                    uncovered &= ~coverage[j]
+                    changed = True
+            candidates = [j for j in candidates if j not in forced]
+
+            # dominated elements, covering the element i1 also covers the element i2
+            containing_sets = sorted(
+                covering(uncovered, candidates).items(),
+                key=lambda item: item[1].bit_count(),
+            )
+            for index, (i1, containing1) in enumerate(containing_sets):
+                if not uncovered & 1 << i1:
+                    continue
+                for i2, containing2 in containing_sets[index + 1 :]:
+                    if uncovered & 1 << i2 and containing1 & ~containing2 == 0:
+                        uncovered &= ~(1 << i2)
+                        changed = True
+        return uncovered, candidates, forced
+
+    def lower_bound(uncovered: int, candidates: list[int]) -> float:
+        """Sum of the cheapest sets for elements, that pairwise do not share a set."""
+        bound: float = 0
+        used = 0
+        for containing in sorted(
+            covering(uncovered, candidates).values(), key=int.bit_count
+        ):
+            if containing & used == 0:
+                used |= containing
+                bound += min(costs[j] for j in elements(containing))
+        return bound
+
+    # greedy initial cover
+    best: list[int] = []
+    uncovered = everything
+    while uncovered:
+        j = max(
+            (j for j in range(len(sets)) if coverage[j] & uncovered),
+            key=lambda j: (coverage[j] & uncovered).bit_count() / max(costs[j], 1e-9),
+        )
+        best.append(j)
+        uncovered &= ~coverage[j]
+    best_cost = sum(costs[j] for j in best)
+
+    def search(
+        uncovered: int, candidates: list[int], chosen: list[int], chosen_cost: float
+    ) -> None:
+        nonlocal best, best_cost
+        simplified = simplify(uncovered, candidates)
+        if simplified is None:
+            return
+        uncovered, candidates, forced = simplified
+        chosen = chosen + forced
+        chosen_cost += sum(costs[j] for j in forced)
+        if chosen_cost >= best_cost:
+            return
+        if not uncovered:
+            best, best_cost = chosen, chosen_cost
+            return
+        if chosen_cost + lower_bound(uncovered, candidates) >= best_cost:
+            return
+        # branch on the element contained in the fewest sets, one of them is in the cover
+        containing = min(covering(uncovered, candidates).values(), key=int.bit_count)
+        excluded = 0
+        for j in sorted(
+            elements(containing),
+            key=lambda j: (costs[j], -(coverage[j] & uncovered).bit_count()),
+        ):
+            # branches for later sets do not contain the sets of earlier branches
+            excluded |= 1 << j
+            search(
+                uncovered & ~coverage[j],
+                [k for k in candidates if not excluded & 1 << k],
+                chosen + [j],
+                chosen_cost + costs[j],
+            )
+
+    search(everything, list(range(len(sets))), [], 0)
+    return [sets[j] for j in best]
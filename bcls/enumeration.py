@@ -5,12 +5,27 @@
 # Here, the indexed type [1, Section 4] is the tree grammar, where indices are non-terminals.
 # Uniqueness is guaranteed by python's set (instead of list) data structure.
 
+from __future__ import annotations
+
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from functools import partial
+import heapq
 import itertools
-from inspect import Parameter, signature, _ParameterKind, _empty
-from collections import deque
-from collections.abc import Callable, Hashable, Iterable, Mapping
-from typing import Any, Optional, TypeAlias, TypeVar
+import os
+from threading import Event
+from inspect import signature, _ParameterKind, _empty
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+from typing import Any, Generic, Literal, Optional, TypeAlias, TypeVar, overload
 
 S = TypeVar("S")  # non-terminals
 T = TypeVar("T", bound=Hashable)
@@ -18,9 +33,103 @@ T = TypeVar("T", bound=Hashable)
 Tree: TypeAlias = tuple[T, tuple["Tree[T]", ...]]
 
 
-def tree_size(tree: Tree[T]) -> int:
+class Term(Generic[T]):
+    """A tree node with cached size and hash.
+
+    Terms behave like `Tree` tuples `(combinator, arguments)` (indexing, unpacking, equality and
+    hashing agree with the corresponding tuple), but never walk their subterms again after
+    construction. Terms are not `tuple` instances, so code checking `isinstance(term, tuple)`
+    has to check for `Term` as well. Terms created through a `TermTable` are hash-consed, i.e.
+    structurally equal subterms are represented by a single shared object.
+    """
+
+    __slots__ = ("combinator", "arguments", "size", "_hash")
+
+    combinator: T
+    arguments: tuple[Term[T], ...]
+    size: int
+    _hash: int
+
+    def __init__(self, combinator: T, arguments: tuple[Term[T], ...]):
+        self.combinator = combinator
+        self.arguments = arguments
+        self.size = 1 + sum(argument.size for argument in arguments)
+        # same value as the hash of the corresponding tuple, computed from the cached child hashes
+        self._hash = hash((combinator, arguments))
+
+    @overload
+    def __getitem__(self, index: Literal[0]) -> T:
+        ...
+
+    @overload
+    def __getitem__(self, index: Literal[1]) -> tuple[Term[T], ...]:
+        ...
+
+    def __getitem__(self, index: int) -> T | tuple[Term[T], ...]:
+        if index == 0 or index == -2:
+            return self.combinator
+        elif index == 1 or index == -1:
+            return self.arguments
+        raise IndexError("Term index out of range")
+
+    def __len__(self) -> int:
+        return 2
+
+    def __iter__(self) -> Iterator[Any]:
+        yield self.combinator
+        yield self.arguments
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, Term):
+            return (
+                self._hash == other._hash
+                and self.size == other.size
+                and self.combinator == other.combinator
+                and self.arguments == other.arguments
+            )
+        if isinstance(other, tuple):
+            return (self.combinator, self.arguments) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr((self.combinator, self.arguments))
+
+    def __reduce__(self) -> tuple[type[Term[T]], tuple[T, tuple[Term[T], ...]]]:
+        # the cached hash must not be transferred between processes
+        return (Term, (self.combinator, self.arguments))
+
+
+class TermTable(Generic[T]):
+    """Hash-consing table for terms."""
+
+    def __init__(self) -> None:
+        self.terms: dict[Term[T], Term[T]] = {}
+
+    def __call__(self, combinator: T, arguments: Iterable[Term[T]]) -> Term[T]:
+        """Return the unique term with given combinator and arguments."""
+
+        term = Term(combinator, tuple(arguments))
+        return self.terms.setdefault(term, term)
+
+    def retain(self, terms: Iterable[Term[T]]) -> None:
+        """Forget all terms except the given ones (which must be closed under subterms)."""
+
+        self.terms = {term: term for term in terms}
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+
+def tree_size(tree: Tree[T] | Term[T]) -> int:
     """The number of nodes in a tree."""
 
+    if isinstance(tree, Term):
+        return tree.size
     result = 0
     trees: deque[Tree[T]] = deque((tree,))
     while trees:
@@ -29,6 +138,12 @@ def tree_size(tree: Tree[T]) -> int:
     return result
 
 
+def candidate_size(candidate: tuple[T, tuple[Term[T], ...]]) -> int:
+    """The number of nodes in a term with given combinator and arguments."""
+
+    return 1 + sum(argument.size for argument in candidate[1])
+
+
 def bounded_union(
     old_elements: set[S], new_elements: Iterable[S], max_count: int
 ) -> set[S]:
@@ -43,42 +158,109 @@ def bounded_union(
     return result
 
 
+def smallest_candidates(
+    candidates: Iterable[tuple[T, tuple[Term[T], ...]]],
+    excluded: set[Term[T]],
+    count: int,
+) -> list[tuple[T, tuple[Term[T], ...]]]:
+    """Return the count smallest candidates, which are not in excluded, ordered by size.
+
+    Candidates of equal size are ordered by their position in candidates. At most count candidates
+    are kept at a time, so candidates can be a stream much larger than the result.
+    """
+
+    # max-heap of the smallest candidates so far, by (size, position)
+    heap: list[tuple[int, int, tuple[T, tuple[Term[T], ...]]]] = []
+    selected: set[tuple[T, tuple[Term[T], ...]]] = set()
+    for position, candidate in enumerate(candidates):
+        size = candidate_size(candidate)
+        if len(heap) >= count and size >= -heap[0][0]:
+            continue
+        if candidate in excluded or candidate in selected:
+            continue
+        selected.add(candidate)
+        if len(heap) < count:
+            heapq.heappush(heap, (-size, -position, candidate))
+        else:
+            selected.remove(heapq.heapreplace(heap, (-size, -position, candidate))[2])
+    return [candidate for (_, _, candidate) in sorted(heap, reverse=True)]
+
+
+def until_cancelled(items: Iterable[S], cancel: Optional[Event]) -> Iterable[S]:
+    """The items, until the cancellation token cancel is set."""
+
+    if cancel is None:
+        return items
+    return itertools.takewhile(lambda item: not cancel.is_set(), items)
+
+
 def enumerate_terms(
     start: S,
     grammar: Mapping[S, Iterable[tuple[T, list[S]]]],
     max_count: Optional[int] = 100,
-) -> Iterable[Tree[T]]:
+    cancel: Optional[Event] = None,
+) -> Iterable[Term[T]]:
     """Given a start symbol and a tree grammar, enumerate at most max_count ground terms derivable
     from the start symbol ordered by (depth, term size).
+
+    Enumerated terms are hash-consed, i.e. subterms shared by several terms are stored once.
+    With max_count, the candidates of a round are not collected, only the (at most max_count)
+    smallest ones are kept. Candidates of equal size are taken in the order of the grammar.
+    The cancellation token cancel is checked before each round (terms of the next depth) and for
+    each candidate. Once it is set, the enumeration stops after the terms already generated, the
+    terms of an interrupted round are dropped.
     """
 
+    make_term: TermTable[T] = TermTable()
     # accumulator for previously seen terms
-    result: set[Tree[T]] = set()
-    terms: dict[S, set[Tree[T]]] = {n: set() for n in grammar.keys()}
+    result: set[Term[T]] = set()
+    terms: dict[S, set[Term[T]]] = {n: set() for n in grammar.keys()}
     terms_size: int = -1
     while terms_size < sum(len(ts) for ts in terms.values()):
+        if cancel is not None and cancel.is_set():
+            return
         terms_size = sum(len(ts) for ts in terms.values())
 
+        # candidates are plain (combinator, arguments) pairs, only selected ones become terms
         new_terms: Callable[
-            [Iterable[tuple[T, list[S]]]], set[Tree[T]]
-        ] = lambda exprs: {
-            (c, tuple(args))
-            for (c, ms) in exprs
-            for args in itertools.product(*(terms[m] for m in ms))
-        }
+            [Iterable[tuple[T, list[S]]]], Iterable[tuple[T, tuple[Term[T], ...]]]
+        ] = lambda exprs: until_cancelled(
+            (
+                (c, args)
+                for (c, ms) in exprs
+                for args in itertools.product(*(terms[m] for m in ms))
+            ),
+            cancel,
+        )
 
         if max_count is None:
             # new terms are built from previous terms according to grammar
-            terms = {n: new_terms(exprs) for (n, exprs) in grammar.items()}
+            terms = {
+                n: {make_term(c, args) for (c, args) in new_terms(exprs)}
+                for (n, exprs) in grammar.items()
+            }
         else:
+            # the candidates of a round are streamed, only the smallest ones are kept
             terms = {
                 n: terms[n]
                 if len(terms[n]) >= max_count
                 else bounded_union(
-                    terms[n], sorted(new_terms(exprs), key=tree_size), max_count
+                    terms[n],
+                    (
+                        make_term(c, args)
+                        for (c, args) in smallest_candidates(
+                            new_terms(exprs), terms[n], max_count - len(terms[n])
+                        )
+                    ),
+                    max_count,
                 )
                 for (n, exprs) in grammar.items()
             }
+        if cancel is not None and cancel.is_set():
+            # the round is incomplete
+            return
+        # discarded candidates are not kept alive by the table
+        make_term.retain(itertools.chain.from_iterable(terms.values()))
         for term in sorted(terms[start], key=tree_size):
             # yield term if not seen previously
             if term not in result:
@@ -86,12 +268,12 @@ def enumerate_terms(
                 yield term
 
 
-def group_by_tree_size(terms: Iterable[Tree[T]]) -> dict[int, set[Tree[T]]]:
+def group_by_tree_size(terms: Iterable[Term[T]]) -> dict[int, set[Term[T]]]:
     """Groups terms by tree_size as a dictionary mapping size to sets of terms."""
 
-    result: dict[int, set[Tree[T]]] = dict()
+    result: dict[int, set[Term[T]]] = dict()
     for term in terms:
-        size = tree_size(term)
+        size = term.size
         ts = result.get(size, set())
         ts.add(term)
         result[size] = ts
@@ -99,11 +281,11 @@ def group_by_tree_size(terms: Iterable[Tree[T]]) -> dict[int, set[Tree[T]]]:
 
 
 def grouped_bounded_union(
-    grouped_old_terms: dict[int, set[Tree[T]]],
-    grouped_new_terms: dict[int, set[Tree[T]]],
+    grouped_old_terms: dict[int, set[Term[T]]],
+    grouped_new_terms: dict[int, set[Term[T]]],
     max_count: int,
     term_size: int,
-) -> set[Tree[T]]:
+) -> set[Term[T]]:
     return set(
         itertools.chain.from_iterable(
             bounded_union(
@@ -121,21 +303,22 @@ def enumerate_terms_of_size(
     grammar: Mapping[S, Iterable[tuple[T, list[S]]]],
     term_size: int,
     max_count: int,
-) -> Iterable[Tree[T]]:
+) -> Iterable[Term[T]]:
     """Given a start symbol, a tree grammar, and term size, enumerate at most max_count ground terms
     of specified term size derivable from the start symbol."""
 
+    make_term: TermTable[T] = TermTable()
     # accumulator for previously seen terms
-    result: set[Tree[T]] = set()
-    terms: dict[S, set[Tree[T]]] = {n: set() for n in grammar.keys()}
+    result: set[Term[T]] = set()
+    terms: dict[S, set[Term[T]]] = {n: set() for n in grammar.keys()}
     terms_size: int = -1
     while terms_size < sum(len(ts) for ts in terms.values()):
         terms_size = sum(len(ts) for ts in terms.values())
 
         new_terms: Callable[
-            [Iterable[tuple[T, list[S]]]], set[Tree[T]]
+            [Iterable[tuple[T, list[S]]]], set[Term[T]]
         ] = lambda exprs: {
-            (c, tuple(args))
+            make_term(c, args)
             for (c, ms) in exprs
             for args in itertools.product(*(terms[m] for m in ms))
         }
@@ -151,47 +334,169 @@ def enumerate_terms_of_size(
             )
             for (n, exprs) in grammar.items()
         }
+        # discarded candidates are not kept alive by the table
+        make_term.retain(itertools.chain.from_iterable(terms.values()))
 
         for term in terms[start]:
             # yield term if not seen previously
-            if tree_size(term) == term_size and term not in result:
+            if term.size == term_size and term not in result:
                 result.add(term)
                 yield term
 
 
-def interpret_term(term: Tree[T]) -> Any:
-    """Recursively evaluate given term."""
+class _Missing:
+    """Type of `MISSING`."""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING = _Missing()
+"""Marker for values not present in an InterpretationCache."""
+
+
+class InterpretationCache:
+    """Bounded cache for interpreted values of subterms (least recently used values are evicted).
+
+    Cached values are shared between all terms containing the same subterm. Therefore, only
+    subterms built exclusively from combinators satisfying `is_pure` are cached.
+    """
+
+    def __init__(
+        self, max_size: int, is_pure: Callable[[Any], bool] = lambda combinator: True
+    ):
+        self.max_size = max_size
+        self.is_pure = is_pure
+        self.values: OrderedDict[Tree[Any] | Term[Any], Any] = OrderedDict()
+
+    def lookup(self, term: Tree[T] | Term[T]) -> Any | _Missing:
+        """Return the cached value of a term, or `MISSING`."""
+
+        value = self.values.get(term, MISSING)
+        if value is not MISSING:
+            self.values.move_to_end(term)
+        return value
+
+    def store(self, term: Tree[T] | Term[T], value: Any) -> None:
+        self.values[term] = value
+        if len(self.values) > self.max_size:
+            self.values.popitem(last=False)
+
+
+@dataclass(frozen=True)
+class CallPlan:
+    """How to apply a combinator to arguments, derived from its signature once."""
+
+    # a callable without parameters is called even if it has no arguments
+    call_without_arguments: bool
+    # number of parameters without default values (excluding *args)
+    required_arity: int
+    # number of arguments consumed by a single call, None for combinators with *args
+    maximal_arity: Optional[int]
+
+
+CallPlans: TypeAlias = dict[Any, CallPlan]
 
-    terms: deque[Tree[T]] = deque((term,))
-    combinators: deque[tuple[T, int]] = deque()
+
+def call_plan(combinator: Any) -> CallPlan:
+    """Compute the call plan of a combinator."""
+
+    if not callable(combinator):
+        return CallPlan(call_without_arguments=False, required_arity=0, maximal_arity=0)
+    try:
+        parameters_of_c = list(signature(combinator).parameters.values())
+    except ValueError:
+        raise RuntimeError(
+            f"Combinator {combinator} does not expose a signature. "
+            "If it's a built-in, you can simply wrap it in another function."
+        )
+
+    simple_arity = len([x for x in parameters_of_c if x.default == _empty])
+    default_arity = len([x for x in parameters_of_c if x.default != _empty])
+
+    # if any parameter is marked as var_args, we need to use all available arguments
+    pop_all = any(x.kind == _ParameterKind.VAR_POSITIONAL for x in parameters_of_c)
+
+    # If a var_args parameter is found, we need to subtract it from the normal parameters.
+    # Note: python does only allow one parameter in the form of *arg
+    if pop_all:
+        simple_arity -= 1
+
+    return CallPlan(
+        call_without_arguments=len(parameters_of_c) == 0,
+        required_arity=simple_arity,
+        maximal_arity=None if pop_all else simple_arity + default_arity,
+    )
+
+
+def compile_call_plans(combinators: Iterable[Any]) -> CallPlans:
+    """Compute the call plans of all combinators (e.g. of all keys of a repository).
+
+    Combinators without a signature are left out, they are reported once they are interpreted.
+    """
+
+    plans: CallPlans = {}
+    for combinator in combinators:
+        try:
+            plans[combinator] = call_plan(combinator)
+        except RuntimeError:
+            pass
+    return plans
+
+
+def interpret_term(
+    term: Tree[T] | Term[T],
+    cache: Optional[InterpretationCache] = None,
+    plans: Optional[CallPlans] = None,
+    resolve: Optional[Callable[[Any], Any]] = None,
+) -> Any:
+    """Recursively evaluate given term.
+
+    If a cache is given, values of pure subterms are looked up in and added to the cache.
+    Call plans of combinators are taken from (and missing ones are added to) `plans`.
+    If given, `resolve` is applied to the result of every (non-partial) combinator call, e.g. to
+    wait for awaitable results.
+    """
+
+    if plans is None:
+        plans = {}
+
+    terms: deque[Tree[T] | Term[T]] = deque((term,))
+    # decomposed terms with their number of arguments, or their cached value
+    combinators: deque[tuple[Tree[T] | Term[T], int, Any | _Missing]] = deque()
     # decompose terms
     while terms:
         t = terms.pop()
-        combinators.append((t[0], len(t[1])))
-        terms.extend(reversed(t[1]))
+        value = MISSING if cache is None else cache.lookup(t)
+        if value is MISSING:
+            combinators.append((t, len(t[1]), MISSING))
+            terms.extend(reversed(t[1]))
+        else:
+            combinators.append((t, 0, value))
     results: deque[Any] = deque()
+    # for each result: is it built exclusively from pure combinators?
+    pure_results: deque[bool] = deque()
 
     # apply/call decomposed terms
     while combinators:
-        (c, n) = combinators.pop()
-        parameters_of_c: Iterable[Parameter] = []
-        current_combinator: partial[Any] | T | Callable[..., Any] = c
-
-        if callable(current_combinator):
-            try:
-                parameters_of_c = list(
-                    signature(current_combinator).parameters.values()
-                )
-            except ValueError:
-                raise RuntimeError(
-                    f"Combinator {c} does not expose a signature. "
-                    "If it's a built-in, you can simply wrap it in another function."
-                )
-
-            if n == 0 and len(parameters_of_c) == 0:
-                current_combinator = current_combinator()
-
-        arguments = deque((results.pop() for _ in range(n)))
+        (t, n, value) = combinators.pop()
+        if value is not MISSING:
+            results.append(value)
+            pure_results.append(True)
+            continue
+        c = t[0]
+        plan = plans.get(c)
+        if plan is None:
+            plan = plans[c] = call_plan(c)
+        # the combinator, its partial applications, and the (arbitrary) results of calls
+        current_combinator: Any = c
+
+        if n == 0 and plan.call_without_arguments and callable(current_combinator):
+            current_combinator = current_combinator()
+            if resolve is not None:
+                current_combinator = resolve(current_combinator)
+
+        arguments = [results.pop() for _ in range(n)]
 
         while arguments:
             if not callable(current_combinator):
@@ -200,62 +505,124 @@ def interpret_term(term: Tree[T]) -> Any:
                     f"but can only be applied to {n - len(arguments)}"
                 )
 
-            use_partial = False
-
-            simple_arity = len(
-                list(filter(lambda x: x.default == _empty, parameters_of_c))
-            )
-            default_arity = len(
-                list(filter(lambda x: x.default != _empty, parameters_of_c))
-            )
-
-            # if any parameter is marked as var_args, we need to use all available arguments
-            pop_all = any(
-                map(lambda x: x.kind == _ParameterKind.VAR_POSITIONAL, parameters_of_c)
-            )
-
-            # If a var_args parameter is found, we need to subtract it from the normal parameters.
-            # Note: python does only allow one parameter in the form of *arg
-            if pop_all:
-                simple_arity -= 1
-
             # If a combinator needs more arguments than available, we need to use partial
             # application
-            if simple_arity > len(arguments):
-                use_partial = True
-
-            fixed_parameters: deque[Any] = deque(
-                arguments.popleft() for _ in range(min(simple_arity, len(arguments)))
-            )
+            use_partial = plan.required_arity > len(arguments)
 
-            var_parameters: deque[Any] = deque()
-            if pop_all:
-                var_parameters.extend(arguments)
-                arguments = deque()
-
-            default_parameters: deque[Any] = deque()
-            for _ in range(default_arity):
-                try:
-                    default_parameters.append(arguments.popleft())
-                except IndexError:
-                    pass
+            consumed = len(arguments) if plan.maximal_arity is None else plan.maximal_arity
+            parameters = arguments[:consumed]
+            arguments = arguments[consumed:]
 
             if use_partial:
-                current_combinator = partial(
-                    current_combinator,
-                    *fixed_parameters,
-                    *var_parameters,
-                    *default_parameters,
-                )
+                current_combinator = partial(current_combinator, *parameters)
             else:
-                current_combinator = current_combinator(
-                    *fixed_parameters, *var_parameters, *default_parameters
-                )
+                current_combinator = current_combinator(*parameters)
+                if resolve is not None:
+                    current_combinator = resolve(current_combinator)
 
         results.append(current_combinator)
+        if cache is not None:
+            pure_arguments = [pure_results.pop() for _ in range(n)]
+            is_pure = cache.is_pure(c) and all(pure_arguments)
+            if is_pure:
+                cache.store(t, current_combinator)
+            pure_results.append(is_pure)
     return results.pop()
 
 
+def interpret_terms(
+    terms: Iterable[Tree[T] | Term[T]],
+    cache_size: int = 0,
+    is_pure: Callable[[Any], bool] = lambda combinator: True,
+    plans: Optional[CallPlans] = None,
+) -> Iterable[Any]:
+    """Evaluate given terms.
+
+    If `cache_size` is positive, values of subterms shared by several terms are computed once and
+    kept in an `InterpretationCache` of this size. This is only sound for combinators satisfying
+    `is_pure`, i.e. combinators whose results may be shared.
+    Call plans are shared by all terms (see `compile_call_plans`).
+    """
+
+    cache = InterpretationCache(cache_size, is_pure) if cache_size > 0 else None
+    if plans is None:
+        plans = {}
+    for term in terms:
+        yield interpret_term(term, cache, plans)
+
+
+# call plans of worker threads/processes, filled on demand
+_worker_plans: CallPlans = {}
+
+
+def _interpret_in_worker(term: Tree[T] | Term[T]) -> Any:
+    return interpret_term(term, plans=_worker_plans)
+
+
+def create_executor(
+    executor: Literal["thread", "process"] | Executor, max_workers: Optional[int] = None
+) -> Executor:
+    """Create a pool for "thread" or "process" with max_workers workers, or return the given
+    `concurrent.futures.Executor`."""
+
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers)
+    if executor == "process":
+        return ProcessPoolExecutor(max_workers)
+    if isinstance(executor, Executor):
+        return executor
+    raise ValueError(f"Unknown executor: {executor}")
+
+
+def interpret_terms_concurrently(
+    terms: Iterable[Tree[T] | Term[T]],
+    executor: Literal["thread", "process"] | Executor = "thread",
+    max_workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+    ordered: bool = True,
+) -> Iterable[Any]:
+    """Evaluate given terms concurrently.
+
+    The executor is either "thread", "process" (a pool with max_workers workers is created and
+    shut down afterwards), or an existing `concurrent.futures.Executor`. Process pools require
+    terms, combinators and results to be picklable. Each worker computes the call plans of the
+    combinators it interprets (see `compile_call_plans`).
+
+    At most max_pending terms (default: twice the number of workers) are submitted but not yet
+    yielded, so terms are only drawn from the given iterable as results are consumed. If ordered
+    is False, results are yielded in completion order instead of the order of the terms. If the
+    iteration stops early, terms, which are submitted but not started, are cancelled.
+    """
+
+    pool = create_executor(executor, max_workers)
+    if max_pending is None:
+        max_pending = 2 * (max_workers or os.cpu_count() or 1)
+
+    pending: deque[Future[Any]] = deque()
+    try:
+        for term in terms:
+            while len(pending) >= max_pending:
+                if ordered:
+                    yield pending.popleft().result()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+                        yield future.result()
+            pending.append(pool.submit(_interpret_in_worker, term))
+        if ordered:
+            while pending:
+                yield pending.popleft().result()
+        else:
+            for future in as_completed(pending):
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if pool is not executor:
+            pool.shutdown(cancel_futures=True)
+
+
 def test() -> None:
     d: Mapping[str, list[tuple[str, list[str]]]] = {
         "X": [("a", []), ("b", ["X", "Y"])],
@@ -0,0 +1,190 @@
+"""
+Parser for the syntax of pretty-printed types and Boolean queries.
+
+Types are written as they are shown by `str`:
+
+    omega           Omega()
+    a               Constructor("a")
+    List(a)         Constructor("List", Constructor("a"))
+    a * b           Product(a, b)        (left associative)
+    a -> b          Arrow(a, b)          (right associative)
+    a & b           Intersection(a, b)   (right associative)
+
+Intersection binds tighter than product, product binds tighter than arrow. Constructor names
+are strings of characters other than whitespace, "(", ")", "&", "|", "~", "*" and "->".
+
+Queries extend types by negation `~`, which binds tightest, and disjunction `|`, which binds
+loosest. An `&` with a negation or disjunction as an operand is a conjunction, otherwise it is
+an intersection (both are inhabited by the same terms). Negations, disjunctions and conjunctions
+cannot occur inside types, e.g. `~a -> b` is not a valid query.
+
+Parsing is iterative (operator precedence), the parser does not recurse on nested input. A
+`TypeParser` interns types: structurally equal types parsed by the same parser are identical
+objects, which are only constructed once.
+"""
+
+import re
+from collections.abc import Callable
+from typing import Any, Optional
+
+from .boolean import And, BooleanTerm, Not, Or, Var
+from .types import Arrow, Constructor, Intersection, Omega, Product, Type
+
+# operators, names and names applied to an argument (followed by "("), whitespace between tokens
+# is skipped by finditer
+TOKENS = re.compile(r"(->|[&|~*()])|((?:[^\s()&|~*-]|-(?!>))+)(\s*\()?")
+OPERATOR, NAME, APPLICATION = 1, 2, 3
+
+# binary operators: precedence and right associativity
+BINARY = {"|": (1, False), "->": (2, True), "*": (3, False), "&": (4, True)}
+NEGATION_PRECEDENCE = 5
+TYPE_OPERATORS: dict[str, Callable[[Type[str], Type[str]], Type[str]]] = {
+    "->": Arrow,
+    "*": Product,
+    "&": Intersection,
+}
+
+Parsed = Type[str] | BooleanTerm[Type[str]]
+
+
+class TypeParser(object):
+    """Parser for types and queries, which interns the parsed types."""
+
+    def __init__(self) -> None:
+        # interned types, keyed by the operator (or constructor name) and the identities of the
+        # components
+        self._types: dict[tuple[Any, ...], Type[str]] = {}
+        self._omega: Type[str] = Omega()
+
+    def __len__(self) -> int:
+        """Number of interned types."""
+        return len(self._types)
+
+    def parse_type(self, text: str) -> Type[str]:
+        result = self._parse(text)
+        if not isinstance(result, Type):
+            raise ValueError(f"Boolean operators are not allowed in types: {text}")
+        return result
+
+    def parse_query(self, text: str) -> BooleanTerm[Type[str]]:
+        result = self._parse(text)
+        return Var(result) if isinstance(result, Type) else result
+
+    def _constructor(self, name: str, arg: Type[str]) -> Type[str]:
+        key = (name, id(arg))
+        ty = self._types.get(key)
+        if ty is None:
+            ty = self._types[key] = Constructor(name, arg)
+        return ty
+
+    def _binary(self, operator: str, left: Parsed, right: Parsed) -> Parsed:
+        if operator == "|":
+            return Or(*self._operands(Or, left), *self._operands(Or, right))
+        if operator == "&" and not (isinstance(left, Type) and isinstance(right, Type)):
+            return And(*self._operands(And, left), *self._operands(And, right))
+        if not (isinstance(left, Type) and isinstance(right, Type)):
+            raise ValueError(f"Boolean operators are not allowed in operands of {operator}")
+        key = (operator, id(left), id(right))
+        ty = self._types.get(key)
+        if ty is None:
+            ty = self._types[key] = TYPE_OPERATORS[operator](left, right)
+        return ty
+
+    @staticmethod
+    def _operands(kind: type[And[Any]] | type[Or[Any]], term: Parsed) -> Any:
+        # operands of nested conjunctions (disjunctions) are merged
+        if isinstance(term, Type):
+            return (Var(term),)
+        if isinstance(term, kind):
+            return term.inner
+        return (term,)
+
+    def _parse(self, text: str) -> Parsed:
+        operands: list[Parsed] = []
+        # precedence, operator and position of pending operators, "(" (precedence 0) and
+        # constructor applications (precedence -1, the operator is the name of the constructor)
+        operators: list[tuple[int, str, int]] = []
+        expect_operand = True
+
+        def reduce() -> None:
+            _, operator, position = operators.pop()
+            try:
+                if operator == "~":
+                    operand = operands.pop()
+                    operands.append(Not(Var(operand) if isinstance(operand, Type) else operand))
+                else:
+                    right = operands.pop()
+                    operands.append(self._binary(operator, operands.pop(), right))
+            except ValueError as error:
+                raise ValueError(f"{error} at position {position}: {text}") from None
+
+        def error(position: int, message: str) -> ValueError:
+            return ValueError(f"{message} at position {position}: {text}")
+
+        for match in TOKENS.finditer(text):
+            token_kind = match.lastindex
+            position = match.start()
+            if expect_operand:
+                if token_kind == NAME:
+                    name = match.group(NAME)
+                    operands.append(
+                        self._omega if name == "omega" else self._constructor(name, self._omega)
+                    )
+                    expect_operand = False
+                elif token_kind == APPLICATION:
+                    operators.append((-1, match.group(NAME), position))
+                elif match.group() in ("(", "~"):
+                    token = match.group()
+                    operators.append((NEGATION_PRECEDENCE if token == "~" else 0, token, position))
+                else:
+                    raise error(position, f"Expected a type, got {match.group()!r}")
+                continue
+            token = match.group()
+            if token in BINARY:
+                precedence, right_associative = BINARY[token]
+                while operators and (
+                    operators[-1][0] > precedence
+                    or (operators[-1][0] == precedence and not right_associative)
+                ):
+                    reduce()
+                operators.append((precedence, token, position))
+                expect_operand = True
+            elif token == ")":
+                while operators and operators[-1][0] > 0:
+                    reduce()
+                if not operators:
+                    raise error(position, "Unbalanced ')'")
+                precedence, name, start = operators.pop()
+                if precedence < 0:
+                    arg = operands.pop()
+                    if not isinstance(arg, Type):
+                        raise error(start, "Boolean operators are not allowed in arguments")
+                    operands.append(self._constructor(name, arg))
+            else:
+                raise error(position, f"Expected an operator, got {token!r}")
+
+        if expect_operand:
+            raise error(len(text), "Unexpected end of input")
+        while operators:
+            if operators[-1][0] <= 0:
+                raise error(operators[-1][2], "Unbalanced '('")
+            reduce()
+        return operands[0]
+
+
+def parse_type(text: str, parser: Optional[TypeParser] = None) -> Type[str]:
+    """Parse a type, e.g. `parse_type("List(a) & b -> c * d")`.
+
+    Types are interned by the given parser (or a new parser).
+    """
+
+    return (TypeParser() if parser is None else parser).parse_type(text)
+
+
+def parse_query(text: str, parser: Optional[TypeParser] = None) -> BooleanTerm[Type[str]]:
+    """Parse a Boolean query over types, e.g. `parse_query("(a -> b) & ~c | d")`.
+
+    Types are interned by the given parser (or a new parser).
+    """
+
+    return (TypeParser() if parser is None else parser).parse_query(text)
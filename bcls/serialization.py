@@ -0,0 +1,315 @@
+"""
+Repository files
+================
+
+A compact binary format for repositories (combinator signatures) and subtype environments.
+
+Types are stored as a table, in which each distinct type occurs exactly once and refers to its
+components by index. Besides the components, each entry stores the derived fields `is_omega`,
+`size` and `organized` of the type, so loading does not recompute them (the organized set of an
+intersection is not stored, it is computed from its components on first access). Loading
+creates each type of the table once, hence equal types in the loaded repository are identical
+objects.
+
+Constructor names and combinators are stored as strings. All integers are unsigned 32 bit
+integers in the byte order of the machine, that wrote the file (files in the other byte order
+are converted while loading). The file is memory-mapped while loading.
+
+Layout (counts and sections in this order, each entry is one or more integers):
+
+    header        magic b"BCLS", version, byte order marker
+    counts        strings, string bytes, types, organized entries, combinators, subtype pairs
+    strings       end offset of each string in the string data
+    string data   utf-8 encoded strings (padded to 4 bytes)
+    types         kind, component 1, component 2, is_omega, size, start and end of organized
+    organized     indices of the types in the organized sets
+    combinators   string index of the combinator, type index of its type
+    subtypes      string index of the subtype, string index of the supertype
+"""
+
+import mmap
+import os
+import sys
+from array import array
+from collections.abc import Callable, Mapping
+from os import PathLike
+from typing import Any, Literal, Optional, TypeVar
+
+from .types import Arrow, Constructor, Intersection, Omega, Product, Type
+
+C = TypeVar("C")
+
+MAGIC = b"BCLS"
+VERSION = 1
+BYTE_ORDER_MARKER = 0x01020304
+
+# kinds of types in the type table
+OMEGA, CONSTRUCTOR, PRODUCT, ARROW, INTERSECTION = range(5)
+TYPE_FIELDS = 7
+NO_COMPONENT = 0xFFFFFFFF
+
+
+class _Writer(object):
+    """Collects the tables of a repository file."""
+
+    def __init__(self) -> None:
+        self.strings: dict[str, int] = {}
+        self.types: dict[Type[str], int] = {}
+        self.type_table = array("I")
+        self.organized = array("I")
+
+    def string(self, value: Any) -> int:
+        if not isinstance(value, str):
+            raise TypeError(f"Only strings can be stored in repository files, got: {value!r}")
+        return self.strings.setdefault(value, len(self.strings))
+
+    def type(self, ty: Type[str]) -> int:
+        """Add a type (and its components and organized types) to the table."""
+
+        # post-order traversal, a type is added after its components and organized types
+        stack: list[tuple[Type[str], bool]] = [(ty, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if current in self.types:
+                continue
+            dependencies = self._components(current)
+            if not isinstance(current, Intersection):
+                dependencies.extend(current.organized)
+            dependencies = [
+                dependency
+                for dependency in dependencies
+                if dependency != current and dependency not in self.types
+            ]
+            if not expanded and dependencies:
+                stack.append((current, True))
+                stack.extend((dependency, False) for dependency in dependencies)
+                continue
+            self._add(current)
+        return self.types[ty]
+
+    @staticmethod
+    def _components(ty: Type[str]) -> list[Type[str]]:
+        match ty:
+            case Constructor(_, arg):
+                return [arg]
+            case Product(left, right) | Arrow(left, right) | Intersection(left, right):
+                return [left, right]
+        return []
+
+    def _add(self, ty: Type[str]) -> None:
+        index = len(self.types)
+        self.types[ty] = index
+        match ty:
+            case Omega():
+                kind, first, second = OMEGA, NO_COMPONENT, NO_COMPONENT
+            case Constructor(name, arg):
+                kind, first, second = CONSTRUCTOR, self.string(name), self.types[arg]
+            case Product(left, right):
+                kind, first, second = PRODUCT, self.types[left], self.types[right]
+            case Arrow(source, target):
+                kind, first, second = ARROW, self.types[source], self.types[target]
+            case Intersection(left, right):
+                kind, first, second = INTERSECTION, self.types[left], self.types[right]
+            case _:
+                raise TypeError(f"Unsupported type: {ty}")
+        start = len(self.organized)
+        if kind != INTERSECTION:
+            self.organized.extend(
+                index if path == ty else self.types[path] for path in ty.organized
+            )
+        self.type_table.extend(
+            (kind, first, second, ty.is_omega, ty.size, start, len(self.organized))
+        )
+
+
+def save_repository(
+    path: str | PathLike[str],
+    repository: Mapping[C, Type[str]],
+    environment: Optional[Mapping[str, set[str]]] = None,
+    name: Callable[[C], str] = str,
+    byteorder: Literal["little", "big"] = sys.byteorder,
+) -> None:
+    """Write a repository and a subtype environment to a file.
+
+    Combinators are stored by name (computed by the function name), constructor names must be
+    strings. Integers are written in the given byte order (default: the one of this machine).
+    """
+
+    writer = _Writer()
+    combinators = array("I")
+    for combinator, ty in repository.items():
+        combinators.extend((writer.string(name(combinator)), writer.type(ty)))
+    subtypes = array("I")
+    for subtype, supertypes in (environment or {}).items():
+        for supertype in supertypes:
+            subtypes.extend((writer.string(subtype), writer.string(supertype)))
+
+    encoded = [string.encode("utf-8") for string in writer.strings]
+    offsets = array("I")
+    end = 0
+    for string in encoded:
+        end += len(string)
+        offsets.append(end)
+    string_data = b"".join(encoded)
+    string_data += b"\0" * (-len(string_data) % 4)
+
+    header = array(
+        "I",
+        (
+            VERSION,
+            BYTE_ORDER_MARKER,
+            len(encoded),
+            len(string_data),
+            len(writer.types),
+            len(writer.organized),
+            len(combinators) // 2,
+            len(subtypes) // 2,
+        ),
+    )
+    sections = (header, offsets, writer.type_table, writer.organized, combinators, subtypes)
+    if byteorder != sys.byteorder:
+        for section in sections:
+            section.byteswap()
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        for section in sections[:2]:
+            file.write(section.tobytes())
+        file.write(string_data)
+        for section in sections[2:]:
+            file.write(section.tobytes())
+
+
+def load_repository(
+    path: str | PathLike[str], combinators: Optional[Mapping[str, C]] = None
+) -> tuple[dict[Any, Type[str]], dict[str, set[str]]]:
+    """Read a repository and a subtype environment from a file.
+
+    If combinators are given, the names of the combinators in the file are replaced by the
+    corresponding combinators, otherwise the names are used as combinators.
+    """
+
+    with open(path, "rb") as file:
+        # mmap cannot map empty files
+        if os.fstat(file.fileno()).st_size < len(MAGIC):
+            raise ValueError(f"{path} is not a repository file")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[: len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} is not a repository file")
+            with memoryview(data) as view:
+                try:
+                    return _load(view, combinators)
+                except (IndexError, UnicodeDecodeError) as error:
+                    # references to types or strings, which are not in the file
+                    raise ValueError(f"Corrupt repository file {path}: {error}") from error
+
+
+def _load(
+    view: memoryview, combinators: Optional[Mapping[str, C]]
+) -> tuple[dict[Any, Type[str]], dict[str, set[str]]]:
+    position = 4
+
+    swap = False
+
+    def integers(count: int) -> list[int]:
+        """Read the next count integers."""
+        nonlocal position
+        if position + 4 * count > len(view):
+            raise ValueError("Truncated repository file")
+        with view[position : position + 4 * count] as section:
+            position += 4 * count
+            if swap:
+                swapped = array("I")
+                swapped.frombytes(section)
+                swapped.byteswap()
+                return swapped.tolist()
+            with section.cast("I") as cast:
+                return cast.tolist()
+
+    version, marker = integers(2)
+    if marker != BYTE_ORDER_MARKER:
+        swap = True
+        position -= 8
+        version, marker = integers(2)
+        if marker != BYTE_ORDER_MARKER:
+            raise ValueError("Corrupt repository file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported repository file version: {version}")
+
+    (
+        number_of_strings,
+        string_bytes,
+        number_of_types,
+        number_of_organized,
+        number_of_combinators,
+        number_of_subtypes,
+    ) = integers(6)
+
+    offsets = integers(number_of_strings)
+    if position + string_bytes > len(view):
+        raise ValueError("Truncated repository file")
+    string_data = bytes(view[position : position + string_bytes])
+    position += string_bytes
+    strings: list[str] = []
+    start = 0
+    for end in offsets:
+        strings.append(string_data[start:end].decode("utf-8"))
+        start = end
+
+    type_table = integers(TYPE_FIELDS * number_of_types)
+    organized = integers(number_of_organized)
+
+    # types are created without __post_init__, the derived fields are taken from the file
+    types: list[Type[str]] = []
+    for index in range(number_of_types):
+        base = TYPE_FIELDS * index
+        kind, first, second, is_omega, size, start, end = type_table[base : base + TYPE_FIELDS]
+        ty: Type[str]
+        fields: dict[str, Any]
+        match kind:
+            case 0:  # OMEGA
+                ty, fields = object.__new__(Omega), {}
+            case 1:  # CONSTRUCTOR
+                ty, fields = object.__new__(Constructor), {
+                    "name": strings[first],
+                    "arg": types[second],
+                }
+            case 2:  # PRODUCT
+                ty, fields = object.__new__(Product), {
+                    "left": types[first],
+                    "right": types[second],
+                }
+            case 3:  # ARROW
+                ty, fields = object.__new__(Arrow), {
+                    "source": types[first],
+                    "target": types[second],
+                }
+            case 4:  # INTERSECTION
+                ty, fields = object.__new__(Intersection), {
+                    "left": types[first],
+                    "right": types[second],
+                }
+            case _:
+                raise ValueError(f"Corrupt repository file, unknown kind of type: {kind}")
+        fields["is_omega"] = bool(is_omega)
+        fields["size"] = size
+        vars(ty).update(fields)
+        types.append(ty)
+        if kind != INTERSECTION:
+            # organized types precede the type (except the type itself)
+            vars(ty)["organized"] = {types[path] for path in organized[start:end]}
+
+    combinator_table = integers(2 * number_of_combinators)
+    repository: dict[Any, Type[str]] = {}
+    for index in range(number_of_combinators):
+        name = strings[combinator_table[2 * index]]
+        combinator = name if combinators is None else combinators[name]
+        repository[combinator] = types[combinator_table[2 * index + 1]]
+
+    subtype_table = integers(2 * number_of_subtypes)
+    environment: dict[str, set[str]] = {}
+    for index in range(number_of_subtypes):
+        environment.setdefault(strings[subtype_table[2 * index]], set()).add(
+            strings[subtype_table[2 * index + 1]]
+        )
+
+    return repository, environment
@@ -1,75 +1,131 @@
-from collections import deque
-from collections.abc import Hashable
-from typing import Generic, TypeVar
+from collections.abc import Hashable, Sequence
+from typing import Generic, Optional, TypeVar
 
 from .types import Arrow, Constructor, Intersection, Product, Type
 
 T = TypeVar("T", bound=Hashable, covariant=True)
 
 
+class PathIndex(Generic[T]):
+    """The components of a type (without top-level intersections) indexed by their head.
+
+    Constructors are indexed by name (their arguments are stored), arrows (with targets, which
+    are not omega) and products are stored as pairs. The index of a type is computed once and
+    cached on the type (see `of`).
+    """
+
+    __slots__ = ("constructors", "arrows", "products")
+
+    def __init__(self, ty: Type[T]):
+        self.constructors: dict[T, list[Type[T]]] = {}
+        self.arrows: list[tuple[Type[T], Type[T]]] = []
+        self.products: list[tuple[Type[T], Type[T]]] = []
+        components: list[Type[T]] = [ty]
+        while components:
+            match components.pop():
+                case Constructor(name, arg):
+                    self.constructors.setdefault(name, []).append(arg)
+                case Arrow(src, tgt) if not tgt.is_omega:
+                    self.arrows.append((src, tgt))
+                case Product(l, r):
+                    self.products.append((l, r))
+                case Intersection(l, r):
+                    components.extend((l, r))
+
+    @staticmethod
+    def of(ty: Type[T]) -> "PathIndex[T]":
+        index: Optional[PathIndex[T]] = vars(ty).get("_path_index")
+        if index is None:
+            index = vars(ty)["_path_index"] = PathIndex(ty)
+        return index
+
+
 class Subtypes(Generic[T]):
     def __init__(self, environment: dict[T, set[T]]):
         self.environment = self._transitive_closure(
             self._reflexive_closure(environment)
         )
+        # constructor names |-> names of their subtypes (including themselves)
+        self._subtypes_of: dict[T, set[T]] = {}
+        for subtype, supertypes in self.environment.items():
+            for name in supertypes:
+                self._subtypes_of.setdefault(name, set()).add(subtype)
+
+    def _check_subtype_rec(self, subtypes: Sequence[Type[T]], supertype: Type[T]) -> bool:
+        """Decides whether the intersection of subtypes is a subtype of supertype.
+
+        The subtypes are looked up in their (cached) path indices, only the supertype is
+        decomposed. Intersections in the supertype are split with an explicit stack.
+        """
+
+        indices: Optional[list[PathIndex[T]]] = None
+        supertypes: list[Type[T]] = [supertype]
+        while supertypes:
+            component = supertypes.pop()
+            if component.is_omega:
+                continue
+            if isinstance(component, Intersection):
+                supertypes.extend((component.right, component.left))
+                continue
+            if indices is None:
+                indices = [PathIndex.of(ty) for ty in subtypes]
+            if not self._check_component(indices, component):
+                return False
+        return True
+
+    def _check_component(self, indices: list[PathIndex[T]], supertype: Type[T]) -> bool:
+        """Decides whether the intersection of the indexed subtypes is a subtype of supertype,
+        which is not an intersection."""
 
-    def _check_subtype_rec(self, subtypes: deque[Type[T]], supertype: Type[T]) -> bool:
-        if supertype.is_omega:
-            return True
         match supertype:
             case Constructor(name2, arg2):
-                casted_constr: deque[Type[T]] = deque()
-                while subtypes:
-                    match subtypes.pop():
-                        case Constructor(name1, arg1):
-                            if name2 == name1 or name2 in self.environment.get(
-                                name1, {}
-                            ):
-                                casted_constr.append(arg1)
-                        case Intersection(l, r):
-                            subtypes.extend((l, r))
+                names = self._subtypes_of.get(name2, (name2,))
+                casted_constr: list[Type[T]] = []
+                for index in indices:
+                    constructors = index.constructors
+                    if len(names) < len(constructors):
+                        for name1 in names:
+                            casted_constr.extend(constructors.get(name1, ()))
+                    else:
+                        for name1, args in constructors.items():
+                            if name1 in names:
+                                casted_constr.extend(args)
                 return len(casted_constr) != 0 and self._check_subtype_rec(
                     casted_constr, arg2
                 )
             case Arrow(src2, tgt2):
-                casted_arr: deque[Type[T]] = deque()
-                while subtypes:
-                    match subtypes.pop():
-                        case Arrow(src1, tgt1):
-                            if self._check_subtype_rec(deque((src2,)), src1):
-                                casted_arr.append(tgt1)
-                        case Intersection(l, r):
-                            subtypes.extend((l, r))
+                casted_arr: list[Type[T]] = []
+                # arrows often share (interned) sources, each is checked once
+                sources: dict[int, bool] = {}
+                for index in indices:
+                    for src1, tgt1 in index.arrows:
+                        is_source = sources.get(id(src1))
+                        if is_source is None:
+                            is_source = sources[id(src1)] = self._check_subtype_rec((src2,), src1)
+                        if is_source:
+                            casted_arr.append(tgt1)
                 return len(casted_arr) != 0 and self._check_subtype_rec(
                     casted_arr, tgt2
                 )
             case Product(l2, r2):
-                casted_l: deque[Type[T]] = deque()
-                casted_r: deque[Type[T]] = deque()
-                while subtypes:
-                    match subtypes.pop():
-                        case Product(l1, r1):
-                            casted_l.append(l1)
-                            casted_r.append(r1)
-                        case Intersection(l, r):
-                            subtypes.extend((l, r))
+                casted_l: list[Type[T]] = []
+                casted_r: list[Type[T]] = []
+                for index in indices:
+                    for l1, r1 in index.products:
+                        casted_l.append(l1)
+                        casted_r.append(r1)
                 return (
                     len(casted_l) != 0
-                    and len(casted_r) != 0
                     and self._check_subtype_rec(casted_l, l2)
                     and self._check_subtype_rec(casted_r, r2)
                 )
-            case Intersection(l, r):
-                return self._check_subtype_rec(subtypes, l) and self._check_subtype_rec(
-                    subtypes, r
-                )
             case _:
                 raise TypeError(f"Unsupported type in check_subtype: {supertype}")
 
     def check_subtype(self, subtype: Type[T], supertype: Type[T]) -> bool:
         """Decides whether subtype <= supertype."""
 
-        return self._check_subtype_rec(deque((subtype,)), supertype)
+        return self._check_subtype_rec((subtype,), supertype)
 
     @staticmethod
     def _reflexive_closure(env: dict[T, set[T]]) -> dict[T, set[T]]:
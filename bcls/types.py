@@ -4,7 +4,7 @@ import itertools
 from abc import ABC, abstractmethod
 from collections.abc import Hashable, Sequence
 from dataclasses import dataclass, field
-from typing import Any, Generic, TypeVar
+from typing import Any, ClassVar, Generic, Optional, TypeVar
 
 T = TypeVar("T", bound=Hashable, covariant=True)
 
@@ -15,8 +15,15 @@ class Type(ABC, Generic[T]):
     size: int = field(init=True, kw_only=True, compare=False)
     organized: set[Type[T]] = field(init=True, kw_only=True, compare=False)
 
+    # types with a lower precedence are put in parentheses, where a higher precedence is expected
+    _precedence: ClassVar[int] = 11
+
     def __str__(self) -> str:
-        return self._str_prec(0)
+        # the string is cached and reused when printing types containing this type
+        string: Optional[str] = vars(self).get("_str")
+        if string is None:
+            string = vars(self)["_str"] = self._str_prec(0)
+        return string
 
     def __mul__(self, other: Type[T]) -> Type[T]:
         return Product(self, other)
@@ -34,9 +41,36 @@ class Type(ABC, Generic[T]):
         pass
 
     @abstractmethod
-    def _str_prec(self, prec: int) -> str:
+    def _str_parts(self) -> list[str | tuple[Type[T], int]]:
+        """Parts of the string of this type: strings and components with their precedence."""
         pass
 
+    def _str_prec(self, prec: int) -> str:
+        """String of this type in a context expecting precedence prec.
+
+        The string is built iteratively, so deep types do not exceed the recursion limit.
+        """
+
+        parts: list[str] = []
+        stack: list[str | tuple[Type[T], int]] = [(self, prec)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                parts.append(item)
+                continue
+            ty, context = item
+            parens = context > ty._precedence
+            string: Optional[str] = vars(ty).get("_str")
+            if string is not None:
+                parts.append(Type._parens(string) if parens else string)
+                continue
+            if parens:
+                stack.append(")")
+            stack.extend(reversed(ty._str_parts()))
+            if parens:
+                stack.append("(")
+        return "".join(parts)
+
     @staticmethod
     def _parens(s: str) -> str:
         return f"({s})"
@@ -53,17 +87,23 @@ class Type(ABC, Generic[T]):
             return Omega()
 
     def __getstate__(self) -> dict[str, Any]:
-        state = self.__dict__.copy()
+        state = vars(self).copy()
         del state["is_omega"]
         del state["size"]
-        del state["organized"]
+        state.pop("organized", None)
+        # caches of the string and of the path index (see Subtypes)
+        state.pop("_str", None)
+        state.pop("_path_index", None)
         return state
 
     def __setstate__(self, state: dict[str, Any]) -> None:
-        self.__dict__.update(state)
-        self.__dict__["is_omega"] = self._is_omega()
-        self.__dict__["size"] = self._size()
-        self.__dict__["organized"] = self._organized()
+        fields = vars(self)
+        fields.pop("_str", None)
+        fields.pop("_path_index", None)
+        fields.update(state)
+        fields["is_omega"] = self._is_omega()
+        fields["size"] = self._size()
+        fields["organized"] = self._organized()
 
 
 @dataclass(frozen=True)
@@ -88,8 +128,8 @@ class Omega(Type[T]):
     def _organized(self) -> set[Type[T]]:
         return set()
 
-    def _str_prec(self, prec: int) -> str:
-        return "omega"
+    def _str_parts(self) -> list[str | tuple[Type[T], int]]:
+        return ["omega"]
 
 
 @dataclass(frozen=True)
@@ -119,11 +159,11 @@ class Constructor(Type[T]):
         else:
             return {Constructor(self.name, ap) for ap in self.arg.organized}
 
-    def _str_prec(self, prec: int) -> str:
-        if self.arg == Omega():
-            return str(self.name)
+    def _str_parts(self) -> list[str | tuple[Type[T], int]]:
+        if isinstance(self.arg, Omega):
+            return [str(self.name)]
         else:
-            return f"{str(self.name)}({str(self.arg)})"
+            return [f"{str(self.name)}(", (self.arg, 0), ")"]
 
 
 @dataclass(frozen=True)
@@ -158,20 +198,15 @@ class Product(Type[T]):
                 )
             )
 
-    def _str_prec(self, prec: int) -> str:
-        product_prec: int = 9
+    _precedence: ClassVar[int] = 9
 
-        def product_str_prec(other: Type[T]) -> str:
-            match other:
-                case Product(_, _):
-                    return other._str_prec(product_prec)
-                case _:
-                    return other._str_prec(product_prec + 1)
-
-        result: str = (
-            f"{product_str_prec(self.left)} * {self.right._str_prec(product_prec + 1)}"
-        )
-        return Type[T]._parens(result) if prec > product_prec else result
+    def _str_parts(self) -> list[str | tuple[Type[T], int]]:
+        match self.left:
+            case Product(_, _):
+                left_prec = self._precedence
+            case _:
+                left_prec = self._precedence + 1
+        return [(self.left, left_prec), " * ", (self.right, self._precedence + 1)]
 
 
 @dataclass(frozen=True)
@@ -203,21 +238,15 @@ class Arrow(Type[T]):
         else:
             return {Arrow(self.source, tp) for tp in self.target.organized}
 
-    def _str_prec(self, prec: int) -> str:
-        arrow_prec: int = 8
-        result: str
+    _precedence: ClassVar[int] = 8
+
+    def _str_parts(self) -> list[str | tuple[Type[T], int]]:
         match self.target:
             case Arrow(_, _):
-                result = (
-                    f"{self.source._str_prec(arrow_prec + 1)} -> "
-                    f"{self.target._str_prec(arrow_prec)}"
-                )
+                target_prec = self._precedence
             case _:
-                result = (
-                    f"{self.source._str_prec(arrow_prec + 1)} -> "
-                    f"{self.target._str_prec(arrow_prec + 1)}"
-                )
-        return Type._parens(result) if prec > arrow_prec else result
+                target_prec = self._precedence + 1
+        return [(self.source, self._precedence + 1), " -> ", (self.target, target_prec)]
 
 
 @dataclass(frozen=True)
@@ -229,11 +258,17 @@ class Intersection(Type[T]):
     organized: set[Type[T]] = field(init=False, compare=False)
 
     def __post_init__(self) -> None:
-        super().__init__(
-            is_omega=self._is_omega(),
-            size=self._size(),
-            organized=self._organized(),
-        )
+        # organized is computed on first access (see __getattr__), otherwise building a chain of
+        # k intersections (e.g. by Type.intersect) would copy the paths of every suffix
+        object.__setattr__(self, "is_omega", self._is_omega())
+        object.__setattr__(self, "size", self._size())
+
+    def __getattr__(self, name: str) -> set[Type[T]]:
+        # only called for attributes, which are not set (yet)
+        if name == "organized":
+            organized = vars(self)["organized"] = self._organized()
+            return organized
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
 
     def _is_omega(self) -> bool:
         return self.left.is_omega and self.right.is_omega
@@ -242,19 +277,30 @@ class Intersection(Type[T]):
         return 1 + self.left.size + self.right.size
 
     def _organized(self) -> set[Type[T]]:
-        return set.union(self.left.organized, self.right.organized)
-
-    def _str_prec(self, prec: int) -> str:
-        intersection_prec: int = 10
-
-        def intersection_str_prec(other: Type[T]) -> str:
+        # union of the paths of all (nested) components, without computing the organized sets
+        # of nested intersections
+        organized: set[Type[T]] = set()
+        components: list[Type[T]] = [self.left, self.right]
+        while components:
+            component = components.pop()
+            if isinstance(component, Intersection) and "organized" not in vars(component):
+                components.extend((component.left, component.right))
+            else:
+                organized.update(component.organized)
+        return organized
+
+    _precedence: ClassVar[int] = 10
+
+    def _str_parts(self) -> list[str | tuple[Type[T], int]]:
+        def operand_prec(other: Type[T]) -> int:
             match other:
                 case Intersection(_, _):
-                    return other._str_prec(intersection_prec)
+                    return self._precedence
                 case _:
-                    return other._str_prec(intersection_prec + 1)
+                    return self._precedence + 1
 
-        result: str = (
-            f"{intersection_str_prec(self.left)} & {intersection_str_prec(self.right)}"
-        )
-        return Type._parens(result) if prec > intersection_prec else result
+        return [
+            (self.left, operand_prec(self.left)),
+            " & ",
+            (self.right, operand_prec(self.right)),
+        ]
@@ -0,0 +1,75 @@
+import unittest
+from random import Random
+
+from bcls.bdd import BDD, FALSE, TRUE, bdd_dnf
+from bcls.boolean import And, Not, Or, Var
+
+from tests.boolean_terms import assignments, evaluate, random_term, variables
+
+
+def node_value(bdd, u, values):
+    """Follow the path of an assignment from u to a terminal."""
+
+    while u > TRUE:
+        level, low, high = bdd.nodes[u]
+        u = high if values[bdd.order[level]] else low
+    return u == TRUE
+
+
+class TestBDD(unittest.TestCase):
+    def test_random_terms(self):
+        random = Random(6)
+        bdd = BDD(variables)
+        for _ in range(200):
+            term1, term2 = random_term(random, 3), random_term(random, 3)
+            u, v = bdd.from_term(term1), bdd.from_term(term2)
+            conjunction, disjunction = bdd.apply("and", u, v), bdd.apply("or", u, v)
+            negation = bdd.negate(u)
+            for values in assignments(variables):
+                value1, value2 = evaluate(term1, values), evaluate(term2, values)
+                self.assertEqual(node_value(bdd, u, values), value1)
+                self.assertEqual(node_value(bdd, conjunction, values), value1 and value2)
+                self.assertEqual(node_value(bdd, disjunction, values), value1 or value2)
+                self.assertEqual(node_value(bdd, negation, values), not value1)
+            self.assertEqual(bdd.negate(negation), u)
+
+    def test_canonical(self):
+        bdd = BDD(variables)
+        u = bdd.from_term(Or(And("a", "b"), And("a", Not("b"))))
+        self.assertEqual(u, bdd.var("a"))
+        self.assertEqual(bdd.from_term(Or("c", Not("c"))), TRUE)
+        self.assertEqual(bdd.from_term(And("c", Not("c"))), FALSE)
+
+    def test_deep(self):
+        order = [f"x{i}" for i in range(1500)]
+        bdd = BDD(order)
+        u = bdd.apply("and", bdd.from_term(And(*order[::2])), bdd.from_term(And(*order[1::2])))
+        self.assertEqual(bdd.size(u), 1502)
+        v = bdd.negate(u)
+        self.assertEqual(bdd.apply("or", u, v), TRUE)
+        self.assertEqual(bdd.negate(v), u)
+
+
+class TestBddDnf(unittest.TestCase):
+    def test_random_terms(self):
+        random = Random(7)
+        for _ in range(300):
+            term = random_term(random, 3)
+            dnf = bdd_dnf(term)
+            for values in assignments(variables):
+                self.assertEqual(evaluate(dnf, values), evaluate(term, values))
+            for clause in dnf.inner:
+                self.assertTrue(all(isinstance(literal, (Var, Not)) for literal in clause.inner))
+
+    def test_implies(self):
+        bdd = BDD(variables)
+        u = bdd.from_term(Or(And("a", "b"), "c"))
+        # cubes over the order a, b, c, d
+        self.assertTrue(bdd.implies((0b1100, 0), u))
+        self.assertTrue(bdd.implies((0b0010, 0), u))
+        self.assertFalse(bdd.implies((0b1000, 0), u))
+        self.assertFalse(bdd.implies((0, 0b0010), u))
+
+
+if __name__ == "__main__":
+    unittest.main()
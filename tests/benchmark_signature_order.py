@@ -0,0 +1,108 @@
+import timeit
+from itertools import product
+
+from bcls import (
+    BooleanTerm,
+    FiniteCombinatoryLogic,
+    Intersection,
+    Subtypes,
+    Type,
+    Var,
+)
+from bcls.bdd import bdd_dnf
+from bcls.boolean import And, Not, Or, heuristic_dnf, minimal_dnf
+
+from tests.benchmark_labyrinth import (
+    SIZE,
+    Move,
+    Start,
+    free,
+    is_free,
+    move,
+    pos,
+    seen,
+)
+
+ORDERS = ["unordered", "name", "frequency"]
+
+
+def labyrinth_targets() -> dict[str, BooleanTerm[Type]]:
+    """Boolean queries on the labyrinth, visiting (or avoiding) some fields on the diagonal."""
+
+    goal: BooleanTerm[Type] = Var(pos(SIZE - 1, SIZE - 1))
+    diagonal: list[BooleanTerm[Type]] = [Var(seen(i, i)) for i in range(1, SIZE - 1)]
+    corners: list[BooleanTerm[Type]] = [Var(seen(0, SIZE - 1)), Var(seen(SIZE - 1, 0))]
+    return {
+        "goal": goal,
+        "goal via diagonal": And(goal, *diagonal),
+        "goal via some corner": And(goal, Or(*corners)),
+        "goal via diagonal or corner": Or(*(And(goal, field) for field in diagonal + corners)),
+        "goal avoiding corners": And(goal, *(Not(corner) for corner in corners)),
+        "any position avoiding some field": Or(
+            *(
+                And(Var(pos(row, col)), Not(Var(seen(col, row))))
+                for row, col in product(range(SIZE), repeat=2)
+                if row < col
+            )
+        ),
+    }
+
+
+def test() -> None:
+    targets = labyrinth_targets()
+
+    print("DNF computation (seconds, number of clauses)")
+    for name, target in targets.items():
+        for order in ORDERS:
+            for method_name, method in (
+                ("minimal", minimal_dnf),
+                ("heuristic", heuristic_dnf),
+                ("bdd", lambda term, order: bdd_dnf(term, signature_order=order)),
+            ):
+                start = timeit.default_timer()
+                dnf = method(target, order)
+                duration = timeit.default_timer() - start
+                print(
+                    f"{name:35} {order:10} {method_name:10} "
+                    f"{duration:.4f} {len(dnf.inner)}"
+                )
+
+    free_fields = {
+        f"Pos_at_({row}, {col})": free(row, col)
+        for row in range(0, SIZE)
+        for col in range(0, SIZE)
+        if is_free(row, col)
+    }
+    repository = {
+        Start(): Intersection(pos(0, 0), seen(0, 0)),
+        Move("up"): move(1, 0, 0, 0),
+        Move("down"): move(0, 0, 1, 0),
+        Move("left"): move(0, 1, 0, 0),
+        Move("right"): move(0, 0, 0, 1),
+        **free_fields,
+    }
+
+    goal = Var(pos(SIZE - 1, SIZE - 1))
+    corners = [Var(pos(0, SIZE - 1)), Var(pos(SIZE - 1, 0))]
+    inhabitation_targets: dict[str, BooleanTerm[Type]] = {
+        "goal": goal,
+        "goal or corner": Or(goal, *corners),
+        "goal and seen goal": And(goal, Var(seen(SIZE - 1, SIZE - 1))),
+        "seen goal or corner": Or(
+            And(goal, Var(seen(SIZE - 1, SIZE - 1))), *corners
+        ),
+    }
+
+    print("Inhabitation (seconds)")
+    for name, target in inhabitation_targets.items():
+        for order in ORDERS:
+            gamma = FiniteCombinatoryLogic(
+                repository, Subtypes({}), signature_order=order
+            )
+            start = timeit.default_timer()
+            gamma.inhabit(target)
+            print(f"{name:35} {order:10} {timeit.default_timer() - start:.4f}")
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,272 @@
+"""Benchmark suite for bcls.
+
+Runs the phases construction, inhabitation, pruning, enumeration and interpretation separately on
+scaling inputs and writes the results as JSON, e.g.
+
+    python -m tests.benchmark_suite --max-size 6 --output benchmark_results.json
+
+Inputs:
+    * labyrinths of size 3 to --max-size (positive target),
+    * labyrinths of size 2 to --max-negation-size with a Boolean target with negations,
+    * synthetic wide repositories of width 10 to --max-width.
+"""
+
+import argparse
+import json
+import platform
+import time
+import timeit
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from bcls import (
+    Arrow,
+    BooleanTerm,
+    Constructor,
+    FiniteCombinatoryLogic,
+    InhabitationStatistics,
+    Intersection,
+    Omega,
+    Product,
+    Subtypes,
+    Type,
+    Var,
+    enumerate_terms,
+    interpret_terms,
+)
+from bcls.boolean import And, Not, Or
+
+
+@dataclass
+class Benchmark(object):
+    name: str
+    parameter: int
+    repository: Mapping[Any, Type[str]]
+    target: BooleanTerm[Type[str]]
+    max_count: int = 100
+
+
+# labyrinth (see benchmark_labyrinth.py)
+def is_free(row: int, col: int) -> bool:
+    SEED = 0
+    if row == col:
+        return True
+    else:
+        return (
+            pow(11, (row + col + SEED) * (row + col + SEED) + col + 7, 1000003) % 5 > 0
+        )
+
+
+def int_to_type(x: int) -> Type[str]:
+    return Constructor(str(x))
+
+
+def free(row: int, col: int) -> Type[str]:
+    return Constructor("Free", Product(int_to_type(row), int_to_type(col)))
+
+
+def pos(row: int, col: int) -> Type[str]:
+    return Constructor("Pos", Product(int_to_type(row), int_to_type(col)))
+
+
+def seen(row: int, col: int) -> Type[str]:
+    return Constructor(f"Seen_({row}, {col})")
+
+
+@dataclass(frozen=True)
+class Move(object):
+    direction: str = field(init=True)
+
+    def __call__(self, path: str, position: str) -> str:
+        return f"{path} then go {self.direction}"
+
+
+@dataclass(frozen=True)
+class Start(object):
+    def __call__(self) -> str:
+        return "start"
+
+
+def move(size: int, drow_from: int, dcol_from: int, drow_to: int, dcol_to: int) -> Type[str]:
+    return Type.intersect(
+        [
+            Arrow(
+                pos(row + drow_from, col + dcol_from),
+                Arrow(
+                    free(row + drow_to, col + dcol_to),
+                    Intersection(
+                        pos(row + drow_to, col + dcol_to),
+                        seen(row + drow_to, col + dcol_to),
+                    ),
+                ),
+            )
+            for row in range(0, size)
+            for col in range(0, size)
+        ]
+        + [
+            Arrow(seen(row, col), Arrow(Omega(), seen(row, col)))
+            for row in range(0, size)
+            for col in range(0, size)
+        ]
+    )
+
+
+def labyrinth(size: int) -> dict[Any, Type[str]]:
+    free_fields = {
+        f"Pos_at_({row}, {col})": free(row, col)
+        for row in range(0, size)
+        for col in range(0, size)
+        if is_free(row, col)
+    }
+    return {
+        Start(): Intersection(pos(0, 0), seen(0, 0)),
+        Move("up"): move(size, 1, 0, 0, 0),
+        Move("down"): move(size, 0, 0, 1, 0),
+        Move("left"): move(size, 0, 1, 0, 0),
+        Move("right"): move(size, 0, 0, 0, 1),
+        **free_fields,
+    }
+
+
+# wide repository
+@dataclass(frozen=True)
+class Leaf(object):
+    index: int = field(init=True)
+
+    def __call__(self) -> str:
+        return f"leaf_{self.index}"
+
+
+@dataclass(frozen=True)
+class Node(object):
+    index: int = field(init=True)
+
+    def __call__(self, left: str, right: str) -> str:
+        return f"node_{self.index}({left}, {right})"
+
+
+def wide_repository(width: int) -> dict[Any, Type[str]]:
+    """Many unrelated combinators, each producing a Goal and its own tag."""
+
+    def a(i: int) -> Type[str]:
+        return Constructor(f"A_{i}")
+
+    def tag(i: int) -> Type[str]:
+        return Constructor(f"Tag_{i}")
+
+    goal: Type[str] = Constructor("Goal")
+    return {
+        **{Leaf(i): a(i) for i in range(width)},
+        **{
+            Node(i): Arrow(
+                a(i), Arrow(a((i + 1) % width), Intersection(goal, tag(i)))
+            )
+            for i in range(width)
+        },
+    }
+
+
+def benchmarks(max_size: int, max_negation_size: int, max_width: int) -> Iterator[Benchmark]:
+    for size in range(3, max_size + 1):
+        yield Benchmark("labyrinth", size, labyrinth(size), Var(pos(size - 1, size - 1)))
+    for size in range(2, max_negation_size + 1):
+        yield Benchmark(
+            "labyrinth (negation)",
+            size,
+            labyrinth(size),
+            And(Var(pos(size - 1, size - 1)), Not(Var(seen(0, 1)))),
+        )
+    width = 10
+    while width <= max_width:
+        tags = [Var(Constructor(f"Tag_{i}")) for i in range(0, width, 2)]
+        yield Benchmark(
+            "wide repository",
+            width,
+            wide_repository(width),
+            And(Var(Constructor("Goal")), Not(Or(*tags))),
+        )
+        width *= 2
+
+
+def measure(function: Callable[[], Any]) -> tuple[float, Any]:
+    start = timeit.default_timer()
+    result = function()
+    return timeit.default_timer() - start, result
+
+
+def run(benchmark: Benchmark) -> dict[str, Any]:
+    statistics = InhabitationStatistics()
+    construction, gamma = measure(
+        lambda: FiniteCombinatoryLogic(benchmark.repository, Subtypes({}), statistics=statistics)
+    )
+    inhabitation, grammar = measure(lambda: gamma.inhabit(benchmark.target))
+    prune = statistics.phase_times["prune"]
+    enumeration, terms = measure(
+        lambda: list(enumerate_terms(benchmark.target, grammar, benchmark.max_count))
+    )
+    # an uninhabited target would measure nothing in the following phases
+    assert len(terms) > 0, f"{benchmark.name} {benchmark.parameter}: no inhabitants"
+    interpretation, _ = measure(lambda: list(interpret_terms(terms)))
+    return {
+        "benchmark": benchmark.name,
+        "parameter": benchmark.parameter,
+        "target": str(benchmark.target),
+        "grammar_size": len(grammar),
+        "terms": len(terms),
+        "phases": {
+            "construction": construction,
+            "inhabit": inhabitation - prune,
+            "prune": prune,
+            "enumeration": enumeration,
+            "interpretation": interpretation,
+        },
+        "statistics": {
+            "clauses_processed": statistics.clauses_processed,
+            "rules_generated": statistics.rules_generated,
+            "subqueries_calls": statistics.subqueries_calls,
+            "subtype_checks": statistics.subtype_checks,
+            "prune_iterations": statistics.prune_iterations,
+        },
+    }
+
+
+def test() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-size", type=int, default=6, help="largest labyrinth")
+    parser.add_argument(
+        "--max-negation-size",
+        type=int,
+        default=3,
+        help="largest labyrinth with a Boolean target with negations",
+    )
+    parser.add_argument("--max-width", type=int, default=160, help="widest repository")
+    parser.add_argument(
+        "--output", default="benchmark_results.json", help="file for the JSON results"
+    )
+    args = parser.parse_args()
+
+    results = []
+    for benchmark in benchmarks(args.max_size, args.max_negation_size, args.max_width):
+        result = run(benchmark)
+        print(
+            f"{result['benchmark']:22} {result['parameter']:4} "
+            + " ".join(f"{phase}: {t:.4f}" for phase, t in result["phases"].items())
+        )
+        results.append(result)
+
+    with open(args.output, "w") as output:
+        json.dump(
+            {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": results,
+            },
+            output,
+            indent=2,
+        )
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,122 @@
+import io
+import unittest
+from threading import Event
+
+from bcls import *
+from bcls.bfcl import mstr, show_grammar, write_grammar
+
+a = Constructor("a")
+b = Constructor("b")
+c = Constructor("c")
+
+
+class TestClauses(unittest.TestCase):
+    def setUp(self):
+        self.fcl = FiniteCombinatoryLogic({"X": a, "Y": c}, Subtypes({"a": {"b"}}))
+
+    def test_unsatisfiable_clause(self):
+        self.assertEqual(self.fcl.boolean_to_clauses(Var(a) & ~Var(b)), [])
+
+    def test_redundant_negatives(self):
+        clauses = self.fcl.boolean_to_clauses(Var(c) & ~Var(a) & ~Var(b))
+        self.assertEqual(clauses, [(c, frozenset({b}))])
+
+    def test_equivalent_clauses(self):
+        fcl = FiniteCombinatoryLogic({}, Subtypes({"a": {"b"}, "b": {"a"}}))
+        self.assertEqual(len(fcl.boolean_to_clauses(Var(a) | Var(b))), 1)
+
+
+class TestFunctionTypes(unittest.TestCase):
+    def test_multi_arrows(self):
+        ty = Intersection(Arrow(a, Arrow(b, c)), Arrow(c, Intersection(a, Arrow(a, b))))
+        levels = list(FiniteCombinatoryLogic._function_types(ty))
+        shown = [sorted(mstr(m) for m in level) for level in levels]
+        self.assertEqual(
+            shown,
+            [
+                [("[]", str(ty))],
+                [("['a']", "b -> c"), ("['c']", "a & (a -> b)")],
+                [("['a', 'b']", "c"), ("['c', 'a']", "b")],
+            ],
+        )
+        # arguments are shared with the prefix
+        for m in levels[2]:
+            self.assertIs(m.prefix.argument, m.arguments[0])
+            # arguments are collected once
+            self.assertIs(m.arguments, m.arguments)
+            self.assertIn(m.prefix, levels[1])
+
+
+class TestShowGrammar(unittest.TestCase):
+    def test_write_grammar(self):
+        fcl = FiniteCombinatoryLogic({"X": a, "F": Arrow(a, Intersection(b, c))}, Subtypes({}))
+        grammar = fcl.inhabit(b, Var(c) & ~Var(a))
+        lines = list(show_grammar(grammar))
+        self.assertIn("b => F(a)", lines)
+        output = io.StringIO()
+        write_grammar(grammar, output)
+        self.assertEqual(output.getvalue(), "".join(line + "\n" for line in lines))
+
+
+class TestStatistics(unittest.TestCase):
+    def test_statistics(self):
+        expanded = []
+        rules = []
+        statistics = InhabitationStatistics(
+            on_clause_expanded=lambda clause, possibilities: expanded.append(clause),
+            on_rule_added=lambda clause, combinator, args: rules.append(combinator),
+        )
+        repository = {"X": a, "F": Arrow(a, c)}
+        fcl = FiniteCombinatoryLogic(repository, Subtypes({}), statistics=statistics)
+        fcl.inhabit(c)
+        self.assertEqual(statistics.clauses_processed, 2)
+        self.assertEqual(statistics.rules_generated, 2)
+        self.assertEqual(sorted(rules), ["F", "X"])
+        self.assertEqual(set(expanded), {(a, frozenset()), (c, frozenset())})
+        self.assertGreater(statistics.subtype_checks, 0)
+        self.assertGreater(statistics.subqueries_calls, 0)
+        self.assertEqual(
+            set(statistics.phase_times), {"clauses", "expansion", "prune", "rules"}
+        )
+
+    def test_disabled(self):
+        fcl = FiniteCombinatoryLogic({"X": a}, Subtypes({}))
+        self.assertIsNone(fcl.statistics)
+        self.assertIs(type(fcl.subtypes), Subtypes)
+
+
+class TestProgress(unittest.TestCase):
+    def setUp(self):
+        # a chain of arrows, so inhabit processes many clauses
+        self.types = [Constructor(f"T{i}") for i in range(50)]
+        repository = {"X": self.types[0]}
+        repository.update(
+            {f"F{i}": Arrow(self.types[i], self.types[i + 1]) for i in range(49)}
+        )
+        self.fcl = FiniteCombinatoryLogic(repository, Subtypes({}))
+
+    def test_progress(self):
+        reports = []
+        self.fcl.inhabit(self.types[-1], progress=reports.append, check_interval=10)
+        self.assertEqual(len(reports), 5)
+        self.assertEqual([report.memo for report in reports], [9, 19, 29, 39, 49])
+
+    def test_cancel(self):
+        cancel = Event()
+        cancel.set()
+        grammar = self.fcl.inhabit(self.types[-1], cancel=cancel, check_interval=10)
+        self.assertIn(self.types[-1], grammar)
+        self.assertLess(len(grammar), 50)
+        self.assertEqual(list(enumerate_terms(self.types[-1], grammar)), [])
+        self.assertEqual(
+            list(enumerate_terms(self.types[-1], self.fcl.inhabit(self.types[-1]), cancel=cancel)),
+            [],
+        )
+
+    def test_check_interval(self):
+        with self.assertRaises(ValueError):
+            self.fcl.inhabit(self.types[-1], check_interval=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -110,11 +110,11 @@ def check_equiv(term_1: BooleanTerm[str], term_2: BooleanTerm[str]) -> bool:
     variable_list = list(variables)
 
     mappings = generate_all_variable_mappings(len(variable_list))
+    function_1 = term_1.compile(variable_list)
+    function_2 = term_2.compile(variable_list)
 
-    for mapping in mappings:
-        if term_1.evaluate(mapping, variable_list) != term_2.evaluate(
-            mapping, variable_list
-        ):
+    for mapping, _ in mappings:
+        if function_1(mapping) != function_2(mapping):
             return False
 
     return True
@@ -0,0 +1,360 @@
+import unittest
+from itertools import product
+from random import Random
+from unittest import mock
+
+from bcls import boolean
+from bcls.boolean import (
+    And,
+    Evaluator,
+    Not,
+    Or,
+    Var,
+    _dnf_of_shape,
+    cached_dnf_as_list,
+    expand_cube,
+    get_dnf_cubes,
+    get_minterms,
+    get_shape,
+    heuristic_dnf,
+    heuristic_dnf_as_list,
+    is_implicant,
+    restrict,
+    same_bit_count,
+    stream_minterms,
+    term_of_shape,
+    truth_table,
+    variable_truth_table,
+)
+
+variables = ["a", "b", "c", "d"]
+
+
+def evaluate(term, values):
+    """Brute force evaluation of a term, values maps variables to bools."""
+
+    match term:
+        case Var(name):
+            return values[name]
+        case Not(inner):
+            return not evaluate(inner, values)
+        case And(inner):
+            return all(evaluate(subterm, values) for subterm in inner)
+        case Or(inner):
+            return any(evaluate(subterm, values) for subterm in inner)
+
+
+def assignments(signature):
+    """All assignments of the signature, the index of an assignment is its mapping."""
+
+    values = product((False, True), repeat=len(signature))
+    return [dict(zip(signature, assignment)) for assignment in values]
+
+
+def random_term(random, depth):
+    """A random term over `variables`, which may contain empty conjunctions and disjunctions."""
+
+    if depth == 0 or random.random() < 0.2:
+        term = Var(random.choice(variables))
+    else:
+        constructor = random.choice([And, Or])
+        term = constructor(*(random_term(random, depth - 1) for _ in range(random.randrange(4))))
+    return Not(term) if random.random() < 0.3 else term
+
+
+class TestTruthTable(unittest.TestCase):
+    def test_variables(self):
+        for length in range(1, 7):
+            for position in range(length):
+                table = variable_truth_table(position, length)
+                bit = 1 << (length - 1 - position)
+                expected = sum(1 << x for x in range(2**length) if x & bit)
+                self.assertEqual(table, expected)
+
+    def test_random_terms(self):
+        random = Random(9)
+        for _ in range(300):
+            term = random_term(random, 3)
+            table = truth_table(term, variables)
+            for x, values in enumerate(assignments(variables)):
+                self.assertEqual(table >> x & 1 == 1, evaluate(term, values))
+            self.assertLess(table, 1 << 2 ** len(variables))
+
+    def test_constants(self):
+        self.assertEqual(truth_table(And(), []), 1)
+        self.assertEqual(truth_table(Or(), ["a"]), 0)
+        self.assertEqual(truth_table(Not(Or()), ["a"]), 0b11)
+
+
+class TestRestrict(unittest.TestCase):
+    def test_random_terms(self):
+        random = Random(0)
+        for _ in range(300):
+            term = random_term(random, 3)
+            variable = random.choice(variables)
+            for value in (False, True):
+                restricted = restrict(term, variable, value)
+                for values in assignments(variables):
+                    values[variable] = value
+                    expected = evaluate(term, values)
+                    if isinstance(restricted, bool):
+                        self.assertEqual(restricted, expected)
+                    else:
+                        self.assertNotIn(variable, restricted.variables)
+                        self.assertEqual(evaluate(restricted, values), expected)
+
+    def test_constants(self):
+        self.assertIs(restrict(Or(), "a", True), False)
+        self.assertIs(restrict(Not(And()), "a", True), False)
+        self.assertIs(restrict(And("a", Not(Or())), "a", True), True)
+        self.assertIs(restrict(And("a", Or(), "b"), "a", True), False)
+        self.assertIs(restrict(Or("a", And()), "a", False), True)
+
+    def test_unchanged(self):
+        term = And("a", "b")
+        self.assertIs(restrict(term, "c", True), term)
+
+    def test_deep(self):
+        term = Var("a")
+        for i in range(3000):
+            term = Not(Not(And(term, f"x{i}")))
+            # the cached variables of deep terms are computed bottom-up
+            term.variables
+        self.assertIs(restrict(term, "a", False), False)
+
+
+class TestMinterms(unittest.TestCase):
+    def test_random_terms(self):
+        random = Random(1)
+        for _ in range(300):
+            term = random_term(random, 3)
+            expected = [
+                x for x, values in enumerate(assignments(variables)) if evaluate(term, values)
+            ]
+            self.assertEqual(sorted(stream_minterms(term, variables)), expected)
+            self.assertEqual(sorted(x for x, _ in get_minterms(term, variables)), expected)
+
+    def test_constants(self):
+        self.assertEqual(list(stream_minterms(Or(), [])), [])
+        self.assertEqual(list(stream_minterms(And(), [])), [0])
+        self.assertEqual(sorted(stream_minterms(Not(Or()), ["a"])), [0, 1])
+        self.assertEqual(list(stream_minterms(And("a", Or()), ["a"])), [])
+
+    def test_large_signature(self):
+        signature = [f"x{i}" for i in range(24)]
+        self.assertEqual(list(get_minterms(And(*signature, Or()), signature)), [])
+        self.assertEqual(list(get_minterms(And(*signature), signature)), [(2**24 - 1, 0)])
+        minterms = list(get_minterms(Or(And(*signature), Not(Or(*signature))), signature))
+        self.assertEqual(minterms, [(0, 0), (2**24 - 1, 0)])
+
+    def test_unknown_variable(self):
+        self.assertRaises(ValueError, list, stream_minterms(And("a", "b"), ["a"]))
+
+
+def cube_mappings(cube, signature):
+    """The mappings (as integers) in a cube."""
+
+    positives, negatives = cube
+    return [
+        x
+        for x in range(2 ** len(signature))
+        if x & positives == positives and x & negatives == 0
+    ]
+
+
+def equivalent(term1, term2):
+    return all(
+        evaluate(term1, values) == evaluate(term2, values) for values in assignments(variables)
+    )
+
+
+class TestHeuristicDnf(unittest.TestCase):
+    def test_random_terms(self):
+        random = Random(2)
+        for _ in range(300):
+            term = random_term(random, 3)
+            dnf = heuristic_dnf(term)
+            self.assertTrue(equivalent(term, dnf), f"{term} is not equivalent to {dnf}")
+            for clause in dnf.inner:
+                self.assertTrue(
+                    all(isinstance(literal, (Var, Not)) for literal in clause.inner)
+                )
+
+    def test_off_cube_limit(self):
+        random = Random(3)
+        with mock.patch.object(boolean, "HEURISTIC_MAX_OFF_CUBES", 2):
+            for _ in range(300):
+                term = random_term(random, 3)
+                dnf = heuristic_dnf(term)
+                self.assertTrue(equivalent(term, dnf), f"{term} is not equivalent to {dnf}")
+
+    def test_dnf_cubes(self):
+        random = Random(4)
+        for _ in range(100):
+            term = random_term(random, 3)
+            on_cubes, off_cubes = get_dnf_cubes(term, variables)
+            for cubes, value in ((on_cubes, True), (off_cubes, False)):
+                covered = {x for cube in cubes for x in cube_mappings(cube, variables)}
+                expected = {
+                    x
+                    for x, values in enumerate(assignments(variables))
+                    if evaluate(term, values) == value
+                }
+                self.assertEqual(covered, expected)
+        term = And(*(Or(f"x{i}", f"y{i}") for i in range(10)))
+        on_cubes, off_cubes = get_dnf_cubes(Not(term), sorted(term.variables), 100)
+        self.assertEqual(len(on_cubes), 10)
+        self.assertIsNone(off_cubes)
+
+    def test_expand_cube(self):
+        random = Random(5)
+        for _ in range(100):
+            term = random_term(random, 3)
+            on_cubes, off_cubes = get_dnf_cubes(term, variables)
+            minterms = set(stream_minterms(term, variables))
+            implicant = lambda cube: set(cube_mappings(cube, variables)) <= minterms
+            for cube in on_cubes:
+                for off in (off_cubes, lambda cube: is_implicant(term, variables, cube)):
+                    positives, negatives = expanded = expand_cube(cube, off)
+                    self.assertTrue(implicant(expanded))
+                    # the literals of the expanded cube are literals of the cube
+                    self.assertEqual(positives & cube[0], positives)
+                    self.assertEqual(negatives & cube[1], negatives)
+                    # the expanded cube is prime
+                    literals = positives | negatives
+                    while literals:
+                        bit = literals & -literals
+                        literals ^= bit
+                        self.assertFalse(implicant((positives & ~bit, negatives & ~bit)))
+
+
+class TestEvaluator(unittest.TestCase):
+    def test_random_terms(self):
+        random = Random(12)
+        for _ in range(300):
+            term = random_term(random, 3)
+            evaluator = Evaluator(term, variables)
+            cache = {}
+            for x, values in enumerate(assignments(variables)):
+                expected = evaluate(term, values)
+                self.assertEqual(evaluator((x, 0)), expected)
+                self.assertEqual(evaluator((x, 0), cache), expected)
+                self.assertEqual(term.evaluate((x, 0), variables), expected)
+            # repeated evaluations use the caches
+            for x, values in enumerate(assignments(variables)):
+                self.assertEqual(evaluator((x, 0)), evaluate(term, values))
+                self.assertEqual(evaluator((x, 0), cache), evaluate(term, values))
+
+    def test_short_circuit(self):
+        term = Or("a", And("b", "c"))
+        evaluator = Evaluator(term, ["a", "b", "c"])
+        self.assertTrue(evaluator((0b100, 0)))
+        # the conjunction is not evaluated, if the variable is true
+        self.assertNotIn(And("b", "c"), {subterm for subterm, _ in evaluator.cache})
+
+    def test_deep(self):
+        term = Var("a")
+        for i in range(3000):
+            term = Not(term) if i % 2 else And(term, f"x{i}")
+            # the cached hashes and variables of deep terms are computed bottom-up
+            hash(term)
+            term.variables
+        signature = ["a", *(f"x{i}" for i in range(0, 3000, 2))]
+        everything = 2 ** len(signature) - 1
+        # all variables except for a are true
+        others = everything >> 1
+        self.assertEqual(Evaluator(term, signature)((everything, 0)), True)
+        self.assertEqual(term.evaluate((others, 0), signature), False)
+        # the expression is nested too deeply for the python parser
+        function = term.compile(signature)
+        self.assertEqual((function(everything), function(others)), (True, False))
+
+
+class TestCompile(unittest.TestCase):
+    def test_random_terms(self):
+        random = Random(8)
+        for _ in range(300):
+            term = random_term(random, 3)
+            function = term.compile(variables)
+            for x, values in enumerate(assignments(variables)):
+                self.assertEqual(function(x), evaluate(term, values))
+
+    def test_shared_subterms(self):
+        term = Or("x", "y")
+        for _ in range(200):
+            term = And(Or(term, "a"), Or(term, "b"))
+        signature = ["x", "y", "a", "b"]
+        function = term.compile(signature)
+        table = truth_table(term, signature)
+        for x in range(16):
+            self.assertEqual(function(x), table >> x & 1 == 1)
+
+
+def evaluate_dnf(dnf, values):
+    return any(all(values[name] == polarity for polarity, name in clause) for clause in dnf)
+
+
+class TestShape(unittest.TestCase):
+    def test_random_terms(self):
+        random = Random(10)
+        for _ in range(300):
+            term = random_term(random, 3)
+            shape, slots = get_shape(term)
+            self.assertEqual(sorted(slots), sorted(term.variables))
+            shaped = term_of_shape(shape)
+            for values in assignments(variables):
+                slot_values = {slot: values[name] for slot, name in enumerate(slots)}
+                self.assertEqual(evaluate(shaped, slot_values), evaluate(term, values))
+
+    def test_renaming(self):
+        shape1, slots1 = get_shape(And("a", Or("b", Not("c"))))
+        shape2, slots2 = get_shape(And("x", Or("y", Not("z"))))
+        self.assertEqual(shape1, shape2)
+        self.assertEqual((slots1, slots2), (["a", "b", "c"], ["x", "y", "z"]))
+
+    def test_cached_dnf(self):
+        random = Random(11)
+        for _ in range(100):
+            term = random_term(random, 3)
+            for dnf in (cached_dnf_as_list(term), cached_dnf_as_list(term, heuristic_dnf_as_list)):
+                for values in assignments(variables):
+                    self.assertEqual(evaluate_dnf(dnf, values), evaluate(term, values))
+
+    def test_cache_hit(self):
+        cached_dnf_as_list(And("a", Or("b", Not("c"))))
+        hits = _dnf_of_shape.cache_info().hits
+        dnf = cached_dnf_as_list(And("x", Or("y", Not("z"))))
+        self.assertEqual(_dnf_of_shape.cache_info().hits, hits + 1)
+        self.assertEqual(
+            {frozenset(clause) for clause in dnf},
+            {frozenset({(True, "x"), (True, "y")}), frozenset({(True, "x"), (False, "z")})},
+        )
+
+    def test_deep(self):
+        term = Var("a")
+        for i in range(3000):
+            term = Not(term) if i % 2 else And(term, f"x{i}")
+        shape, slots = get_shape(term)
+        self.assertEqual(len(slots), 1501)
+        shaped = term_of_shape(shape)
+        depth = 0
+        while not isinstance(shaped, Var):
+            depth += 1
+            match shaped:
+                case Not(inner):
+                    shaped = inner
+                case And(inner):
+                    shaped = max(inner, key=lambda subterm: not isinstance(subterm, Var))
+        self.assertEqual(depth, 3000)
+
+
+class TestSameBitCount(unittest.TestCase):
+    def test_brute_force(self):
+        for length in range(8):
+            for bit_count in range(length + 2):
+                expected = [x for x in range(2**length) if x.bit_count() == bit_count]
+                self.assertEqual(list(same_bit_count(bit_count, length)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import json
+import os
+import sys
+import tempfile
+import types
+import unittest
+
+from bcls import Term
+from bcls.__main__ import MAX_PENDING_PER_JOB, Options, read_queries, run_batch, show_term
+
+REPOSITORY = """
+from bcls import Arrow, Constructor
+
+a = Constructor("a")
+b = Constructor("b")
+repository = {"X": a, "F": Arrow(a, b)}
+"""
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".py")
+        with os.fdopen(handle, "w") as file:
+            file.write(REPOSITORY)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def run_queries(self, lines, jobs=1, interpret=False):
+        options = Options(self.path, "repository", 10, interpret)
+        return [json.loads(line) for line in run_batch(options, read_queries(lines), jobs)]
+
+    def test_batch(self):
+        results = self.run_queries(["# comment", "", "b", "a & ~b", "c", "a ->"])
+        self.assertEqual([result["index"] for result in results], [0, 1, 2, 3])
+        self.assertEqual(results[0]["results"], ["F(X)"])
+        self.assertEqual(results[1]["results"], ["X"])
+        self.assertIn("inhabit", results[0]["time"])
+        self.assertEqual(results[2]["results"], [])
+        self.assertTrue(results[3]["error"].startswith("ValueError"))
+
+    def test_parallel(self):
+        queries = ["b", "a", "a | b"]
+        self.assertEqual(
+            [result["results"] for result in self.run_queries(queries, jobs=2)],
+            [result["results"] for result in self.run_queries(queries)],
+        )
+
+    def test_bounded_reading(self):
+        read = []
+
+        def queries():
+            for i in range(50):
+                read.append(i)
+                yield "b"
+
+        options = Options(self.path, "repository", 10, False)
+        results = run_batch(options, queries(), jobs=2)
+        next(results)
+        self.assertLessEqual(len(read), MAX_PENDING_PER_JOB * 2 + 1)
+        self.assertEqual(len(list(results)), 49)
+
+    def test_module_name(self):
+        # a repository file named like a standard module does not replace it
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "types.py")
+        with open(path, "w") as file:
+            file.write(REPOSITORY)
+        try:
+            options = Options(path, "repository", 10, False)
+            results = [json.loads(line) for line in run_batch(options, ["b"])]
+            self.assertEqual(results[0]["results"], ["F(X)"])
+            self.assertIs(sys.modules["types"], types)
+        finally:
+            os.remove(path)
+            os.rmdir(directory)
+
+
+class TestShowTerm(unittest.TestCase):
+    def test_combinators(self):
+        def f(x, y):
+            return x
+
+        term = Term(f, (Term("X", ()), Term(len, (Term(3, ()),))))
+        self.assertEqual(show_term(term), "f(X, len(3))")
+
+    def test_deep(self):
+        term = Term("X", ())
+        for _ in range(5000):
+            term = Term("F", (term,))
+        self.assertEqual(show_term(term), "F(" * 5000 + "X" + ")" * 5000)
+
+
+if __name__ == "__main__":
+    unittest.main()
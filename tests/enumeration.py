@@ -0,0 +1,248 @@
+import asyncio
+import pickle
+import threading
+import time
+import unittest
+
+from bcls import (
+    Arrow,
+    Constructor,
+    FiniteCombinatoryLogic,
+    Subtypes,
+    Term,
+    enumerate_terms,
+    enumerate_terms_async,
+    inhabit_and_interpret,
+    inhabit_and_interpret_async,
+    inhabit_async,
+    interpret_terms,
+    interpret_terms_concurrently,
+)
+from bcls.enumeration import TermTable, smallest_candidates, tree_size
+
+grammar = {
+    "X": [("a", []), ("b", ["X", "Y"])],
+    "Y": [("c", []), ("d", ["Y", "X"])],
+}
+
+
+class TestTerms(unittest.TestCase):
+    def test_tuple_compatibility(self):
+        make_term = TermTable()
+        term = make_term("b", [make_term("a", []), make_term("c", [])])
+        tree = ("b", (("a", ()), ("c", ())))
+        self.assertEqual(term, tree)
+        self.assertEqual(hash(term), hash(tree))
+        self.assertEqual(term[0], "b")
+        self.assertEqual(term.size, tree_size(tree))
+        self.assertEqual(repr(term), repr(tree))
+        combinator, arguments = term
+        self.assertEqual((combinator, arguments), tree)
+        self.assertNotIsInstance(term, tuple)
+
+    def test_hash_consing(self):
+        make_term = TermTable()
+        t1 = make_term("b", [make_term("a", []), make_term("c", [])])
+        t2 = make_term("b", [make_term("a", []), make_term("c", [])])
+        self.assertIs(t1, t2)
+        self.assertEqual(len(make_term), 3)
+
+    def test_pickle(self):
+        term = Term("b", (Term("a", ()), Term("c", ())))
+        self.assertEqual(pickle.loads(pickle.dumps(term)), term)
+
+    def test_smallest_candidates(self):
+        make_term = TermTable()
+        a, c = make_term("a", []), make_term("c", [])
+        ba = make_term("b", [a])
+        candidates = [("b", (ba,)), ("a", ()), ("b", (a,)), ("d", (a, c)), ("c", ()), ("a", ())]
+        self.assertEqual(smallest_candidates(candidates, {a}, 2), [("c", ()), ("b", (a,))])
+        self.assertEqual(
+            smallest_candidates(candidates, set(), 4),
+            [("a", ()), ("c", ()), ("b", (a,)), ("b", (ba,))],
+        )
+        self.assertEqual(len(smallest_candidates(candidates, set(), 10)), 5)
+
+    def test_enumeration_order(self):
+        terms = list(enumerate_terms("X", grammar, max_count=20))
+        self.assertEqual(len(terms), len(set(terms)))
+        sizes = [t.size for t in terms]
+        self.assertEqual(sizes[:2], [1, 3])
+        shared = {id(arg) for t in terms for arg in t[1] if arg == ("a", ())}
+        self.assertLessEqual(len(shared), 1)
+
+
+class TestInterpretation(unittest.TestCase):
+    def test_cached_interpretation(self):
+        calls = []
+
+        def a():
+            calls.append("a")
+            return "a"
+
+        def b(x, y):
+            calls.append("b")
+            return f"b({x}, {y})"
+
+        def c():
+            return "c"
+
+        def d(y, x):
+            return f"d({y}, {x})"
+
+        g = {
+            "X": [(a, []), (b, ["X", "Y"])],
+            "Y": [(c, []), (d, ["Y", "X"])],
+        }
+        terms = list(enumerate_terms("X", g, max_count=50))
+        uncached = list(interpret_terms(terms))
+        calls_uncached = len(calls)
+        calls_of_a = calls.count("a")
+        calls.clear()
+        cached = list(interpret_terms(terms, cache_size=1000))
+        self.assertEqual(uncached, cached)
+        self.assertLess(len(calls), calls_uncached)
+
+        calls.clear()
+        impure = list(interpret_terms(terms, cache_size=1000, is_pure=lambda x: x != a))
+        self.assertEqual(uncached, impure)
+        self.assertEqual(calls.count("a"), calls_of_a)
+
+
+def leaf():
+    return 1
+
+
+def node(x, y):
+    return x + y
+
+
+concurrent_grammar = {
+    "X": [(leaf, []), (node, ["X", "X"])],
+}
+
+
+class TestConcurrentInterpretation(unittest.TestCase):
+    def test_threads(self):
+        terms = list(enumerate_terms("X", concurrent_grammar, max_count=100))
+        expected = list(interpret_terms(terms))
+        self.assertEqual(
+            list(interpret_terms_concurrently(terms, "thread", max_workers=4)), expected
+        )
+        unordered = interpret_terms_concurrently(terms, "thread", 4, ordered=False)
+        self.assertEqual(sorted(unordered), sorted(expected))
+
+    def test_processes(self):
+        terms = list(enumerate_terms("X", concurrent_grammar, max_count=20))
+        expected = list(interpret_terms(terms))
+        results = interpret_terms_concurrently(terms, "process", max_workers=2)
+        self.assertEqual(list(results), expected)
+
+    def test_cancel_on_close(self):
+        started = []
+        running = threading.Event()
+        release = threading.Event()
+
+        def slow():
+            started.append(1)
+            # all but the first term wait
+            if len(started) > 1:
+                running.set()
+                release.wait(5)
+            return 1
+
+        terms = [Term(slow, ()) for _ in range(20)]
+        results = interpret_terms_concurrently(terms, "thread", max_workers=1, max_pending=10)
+        self.assertEqual(next(results), 1)
+        self.assertTrue(running.wait(5))
+        threading.Timer(0.1, release.set).start()
+        results.close()
+        # only the running term is finished, pending terms are cancelled
+        self.assertEqual(len(started), 2)
+
+    def test_inhabit_and_interpret(self):
+        a = Constructor("a")
+        repository = {leaf: a, node: Arrow(a, Arrow(a, a))}
+        expected = list(inhabit_and_interpret(repository, [a, a], max_count=10))
+        for executor in ("thread", "process"):
+            results = inhabit_and_interpret(
+                repository, [a, a], max_count=10, executor=executor, max_workers=2, max_pending=3
+            )
+            self.assertEqual(list(results), expected)
+        with self.assertRaises(ValueError):
+            list(inhabit_and_interpret(repository, a, cache_size=10, executor="thread"))
+
+
+class TestAsyncInterpretation(unittest.TestCase):
+    def test_async_combinators(self):
+        a = Constructor("a")
+
+        async def x():
+            await asyncio.sleep(0)
+            return "x"
+
+        async def f(y):
+            await asyncio.sleep(0)
+            return f"f({y})"
+
+        async def run():
+            repository = {x: a, f: Arrow(a, a)}
+            return [
+                result
+                async for result in inhabit_and_interpret_async(repository, a, max_count=3)
+            ]
+
+        self.assertEqual(asyncio.run(run()), ["x", "f(x)", "f(f(x))"])
+
+    def test_enumerate_cancel(self):
+        # the fifth round has 730 ** 3 candidates
+        grammar = {"X": [("a", []), ("b", ["X", "X", "X"])]}
+
+        async def run():
+            async def consume():
+                async for _ in enumerate_terms_async("X", grammar, None, chunk_size=1000):
+                    pass
+
+            task = asyncio.create_task(consume())
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        start = time.perf_counter()
+        # asyncio.run waits for the worker thread
+        asyncio.run(run())
+        self.assertLess(time.perf_counter() - start, 10)
+
+    def test_inhabit_cancel(self):
+        types = [Constructor(f"T{i}") for i in range(50)]
+        repository = {"X": types[0]}
+        repository.update({f"F{i}": Arrow(types[i], types[i + 1]) for i in range(49)})
+        fcl = FiniteCombinatoryLogic(repository, Subtypes({}))
+        reports = []
+        started = threading.Event()
+        cancel = threading.Event()
+
+        def progress(report):
+            reports.append(report)
+            started.set()
+            # block the worker until the awaiting task is cancelled
+            cancel.wait(10)
+
+        async def run():
+            task = asyncio.create_task(
+                inhabit_async(fcl, types[-1], progress=progress, cancel=cancel)
+            )
+            await asyncio.to_thread(started.wait, 10)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        # asyncio.run waits for the worker thread
+        asyncio.run(run())
+        self.assertTrue(cancel.is_set())
+        self.assertEqual(len(reports), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
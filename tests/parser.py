@@ -0,0 +1,87 @@
+import unittest
+
+from bcls import (
+    And,
+    Arrow,
+    Constructor,
+    Intersection,
+    Not,
+    Omega,
+    Or,
+    Product,
+    TypeParser,
+    Var,
+    parse_query,
+    parse_type,
+)
+
+
+def structure(term):
+    """Boolean terms (other than variables) do not implement equality, compare their structure."""
+    match term:
+        case Var(name):
+            return name
+        case Not(inner):
+            return (Not, structure(inner))
+        case And(inner) | Or(inner):
+            return (type(term), frozenset(map(structure, inner)))
+
+
+class TestParser(unittest.TestCase):
+    def setUp(self):
+        self.a = Constructor("a")
+        self.b = Constructor("b")
+        self.c = Constructor("c")
+
+    def test_types(self):
+        a, b, c = self.a, self.b, self.c
+        self.assertEqual(parse_type("omega"), Omega())
+        self.assertEqual(parse_type("List(a * b)"), Constructor("List", Product(a, b)))
+        self.assertEqual(parse_type("a & b -> c"), Arrow(Intersection(a, b), c))
+        self.assertEqual(parse_type("a -> b -> c"), Arrow(a, Arrow(b, c)))
+        self.assertEqual(parse_type("(a -> b) -> c"), Arrow(Arrow(a, b), c))
+        self.assertEqual(parse_type("a * b * c"), Product(Product(a, b), c))
+        self.assertEqual(parse_type("a * b & c"), Product(a, Intersection(b, c)))
+        self.assertEqual(parse_type("a & b & c"), Intersection(a, Intersection(b, c)))
+
+    def test_roundtrip(self):
+        a, b, c = self.a, self.b, self.c
+        types = [
+            Arrow(Product(Product(a, b), Arrow(c, Omega())), Constructor("L", Intersection(a, b))),
+            Intersection(Arrow(a, b), Intersection(Product(a, Product(b, c)), c)),
+            Arrow(Arrow(Intersection(a, b), c), Constructor("x-y", Constructor("L", Omega()))),
+        ]
+        for ty in types:
+            self.assertEqual(parse_type(str(ty)), ty)
+
+    def test_queries(self):
+        a, b, c = self.a, self.b, self.c
+        queries = {
+            "a -> b": Var(Arrow(a, b)),
+            "~a & b | c": Or(And(Not(a), b), c),
+            "a & ~(b | c) & c": And(a, Not(Or(b, c)), c),
+            "(a -> b) & ~c": And(Arrow(a, b), Not(c)),
+        }
+        for text, query in queries.items():
+            self.assertEqual(structure(parse_query(text)), structure(query))
+
+    def test_interning(self):
+        parser = TypeParser()
+        first = parser.parse_type("L(a) -> L(a) * b")
+        second = parser.parse_type("L(a) * b")
+        self.assertIs(first.source, first.target.left)
+        self.assertIs(first.target, second)
+
+    def test_deep(self):
+        ty = parse_type(" & ".join(["a"] * 10000))
+        self.assertEqual(ty.size, 29999)
+        self.assertEqual(parse_type("(" * 10000 + "a" + ")" * 10000), self.a)
+
+    def test_errors(self):
+        for text in ["", "a b", "(a", "a)", "a &", "()", "a | b", "L(~a)", "~a -> b"]:
+            self.assertRaises(ValueError, parse_type, text)
+        self.assertRaises(ValueError, parse_query, "~a -> b")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+
+from bcls import (
+    Arrow,
+    Constructor,
+    FiniteCombinatoryLogic,
+    Intersection,
+    Omega,
+    Product,
+    Subtypes,
+    load_repository,
+    save_repository,
+)
+
+
+class TestSerialization(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".bcls")
+        os.close(handle)
+        a = Constructor("a")
+        b = Constructor("b")
+        c = Constructor("c", Product(a, Intersection(b, Omega())))
+        self.repository = {
+            "X": a,
+            "F": Intersection(Arrow(a, Intersection(b, c)), Arrow(b, Omega())),
+            "G": Arrow(c, Arrow(Product(a * b, Omega()), Constructor("d", a))),
+        }
+        self.environment = {"a": {"b"}, "b": {"d"}}
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_roundtrip(self):
+        save_repository(self.path, self.repository, self.environment)
+        repository, environment = load_repository(self.path)
+        self.assertEqual(environment, self.environment)
+        self.assertEqual(list(repository), list(self.repository))
+        for combinator, ty in self.repository.items():
+            loaded = repository[combinator]
+            self.assertEqual(loaded, ty)
+            self.assertEqual(hash(loaded), hash(ty))
+            self.assertEqual(loaded.size, ty.size)
+            self.assertEqual(loaded.is_omega, ty.is_omega)
+            self.assertEqual(loaded.organized, ty.organized)
+            self.assertEqual(str(loaded), str(ty))
+            self.assertEqual(pickle.loads(pickle.dumps(loaded)), ty)
+
+    def test_sharing(self):
+        save_repository(self.path, self.repository)
+        repository, _ = load_repository(self.path)
+        self.assertIs(repository["X"], repository["F"].left.source)
+        self.assertIs(repository["X"], repository["G"].target.target.arg)
+
+    def test_inhabitation(self):
+        save_repository(self.path, self.repository, self.environment)
+        combinators = {name: name.lower() for name in self.repository}
+        repository, environment = load_repository(self.path, combinators)
+        self.assertEqual(set(repository), {"x", "f", "g"})
+        target = Constructor("d", Constructor("a"))
+        expected = FiniteCombinatoryLogic(
+            {name.lower(): ty for name, ty in self.repository.items()},
+            Subtypes(self.environment),
+        ).inhabit(target)
+        grammar = FiniteCombinatoryLogic(repository, Subtypes(environment)).inhabit(target)
+        self.assertEqual(grammar, expected)
+
+    def test_byte_order(self):
+        byteorder = "big" if sys.byteorder == "little" else "little"
+        save_repository(self.path, self.repository, self.environment, byteorder=byteorder)
+        repository, environment = load_repository(self.path)
+        self.assertEqual(environment, self.environment)
+        self.assertEqual(repository, self.repository)
+
+    def test_truncated(self):
+        save_repository(self.path, self.repository, self.environment)
+        with open(self.path, "rb") as file:
+            data = file.read()
+        for length in (0, 2, 20, len(data) // 2, len(data) - 4):
+            with open(self.path, "wb") as file:
+                file.write(data[:length])
+            self.assertRaises(ValueError, load_repository, self.path)
+
+    def test_invalid(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a repository")
+        self.assertRaises(ValueError, load_repository, self.path)
+        self.assertRaises(TypeError, save_repository, self.path, {"X": Constructor(1)})
+
+
+if __name__ == "__main__":
+    unittest.main()
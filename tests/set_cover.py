@@ -1,4 +1,4 @@
-from bcls.combinatorics import minimal_covers, maximal_elements
+from bcls.combinatorics import minimal_covers, minimum_cover, maximal_elements
 from itertools import combinations
 from collections import deque
 from random import randrange
@@ -90,3 +90,57 @@ for _ in range(100000):
         print(covers2)
         print("COVERS NOT EQUIVALENT")
         break
+
+# minimum cover check against the smallest naive minimal cover
+for _ in range(10000):
+    sets = [random_set() for _ in range(randrange(max_sets))]
+    elements = random_set()
+    minimum = minimum_cover(sets, elements, contains)
+    naive_covers = naive_minimal_covers(sets, elements, contains)
+    if minimum is None:
+        if naive_covers:
+            print(f"cover {elements} by {sets}")
+            print("MINIMUM COVER NOT FOUND")
+            break
+    elif not any(equivalent_lists(minimum, c) for c in naive_covers) or len(
+        minimum
+    ) != min(map(len, naive_covers)):
+        print(f"cover {elements} by {sets}")
+        print(minimum)
+        print(naive_covers)
+        print("COVER NOT MINIMUM")
+        break
+
+
+# weighted minimum cover check against the cheapest cover found by brute force
+def naive_minimum_cost(sets, to_cover, contains, cost):
+    costs = [
+        sum(map(cost, cover))
+        for i in range(len(sets) + 1)
+        for cover in combinations(sets, i)
+        if all(any(contains(s, e) for s in cover) for e in to_cover)
+    ]
+    return min(costs, default=None)
+
+
+for _ in range(2000):
+    sets = [random_set() for _ in range(randrange(max_sets))]
+    elements = random_set()
+    weights = {id(s): randrange(1, 10) for s in sets}
+    cost = lambda s: weights[id(s)]
+    minimum = minimum_cover(sets, elements, contains, cost)
+    naive_cost = naive_minimum_cost(sets, elements, contains, cost)
+    if minimum is None or naive_cost is None:
+        if minimum is not None or naive_cost is not None:
+            print(f"cover {elements} by {sets} with costs {list(map(cost, sets))}")
+            print("WEIGHTED MINIMUM COVER NOT FOUND")
+            break
+    elif (
+        not all(any(contains(s, e) for s in minimum) for e in elements)
+        or sum(map(cost, minimum)) != naive_cost
+    ):
+        print(f"cover {elements} by {sets} with costs {list(map(cost, sets))}")
+        print(minimum)
+        print(naive_cost)
+        print("WEIGHTED COVER NOT MINIMUM")
+        break
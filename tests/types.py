@@ -30,6 +30,26 @@ class TestTypes(unittest.TestCase):
             "a & b & c & (a & c -> b) & (a -> c & b) & (a & b * c) & (a * b & c) & (a * (b * c)) & (a * b * c) & ((a -> b) -> c -> a) & List(a) & omega",
         )
 
+    def test_pretty_print_deep(self):
+        deep = Type.intersect([Arrow(a, Constructor(str(i))) for i in range(5000)])
+        self.assertTrue(str(deep).startswith("(a -> 0) & (a -> 1) & "))
+
+    def test_pretty_print_cached(self):
+        self.assertEqual(str(Arrow(a, b)), "a -> b")
+        # cached strings of components are parenthesized where necessary
+        self.assertEqual(str(Arrow(Arrow(a, b), c)), "(a -> b) -> c")
+        self.assertEqual(str(Intersection(Arrow(a, b), c)), "(a -> b) & c")
+        self.assertEqual(str(Product(c, a * b)), "c * (a * b)")
+
+    def test_organized_intersection(self):
+        paths = [Arrow(a, Constructor(str(i))) for i in range(5000)]
+        long = Type.intersect(paths)
+        self.assertEqual(long.organized, set(paths))
+        self.assertEqual(Intersection(long, c).organized, set(paths) | {c})
+        left = Arrow(a, Intersection(b, c))
+        right = Intersection(Product(a * b, c), Intersection(left, Omega()))
+        self.assertEqual(Intersection(left, right).organized, left.organized | right.organized)
+
     def test_mul(self):
         self.assertEqual(a * b, Product(a, b))
         self.assertEqual(a * b * c, Product(Product(a, b), c))
@@ -42,5 +62,47 @@ class TestTypes(unittest.TestCase):
         self.assertEqual(s1, s2)
 
 
+class TestSubtypes(unittest.TestCase):
+    def setUp(self):
+        self.subtypes = Subtypes({"a": {"b"}})
+
+    def test_intersection_supertype(self):
+        self.assertTrue(self.subtypes.check_subtype(Intersection(a, c), Intersection(c, b)))
+        self.assertFalse(self.subtypes.check_subtype(a, Intersection(b, c)))
+        self.assertTrue(self.subtypes.check_subtype(complicated, complicated))
+
+    def test_deep_intersection_supertype(self):
+        deep = Type.intersect([Arrow(a, Constructor(str(i))) for i in range(1500)])
+        self.assertTrue(self.subtypes.check_subtype(deep, deep))
+        self.assertFalse(self.subtypes.check_subtype(Arrow(b, Constructor("0")), deep))
+        deep = Type.intersect([Constructor(str(i)) for i in range(5000)])
+        self.assertTrue(self.subtypes.check_subtype(deep, deep))
+        self.assertFalse(self.subtypes.check_subtype(deep, Intersection(deep, a)))
+
+    def test_constructor_lookup(self):
+        subtypes = Subtypes({"a": {"b"}, "b": {"c"}, "d": {"c"}})
+        many = Type.intersect([Constructor(str(i)) for i in range(10)] + [Constructor("List", a)])
+        self.assertTrue(subtypes.check_subtype(Intersection(many, a), c))
+        self.assertTrue(subtypes.check_subtype(Intersection(many, Constructor("d")), c))
+        self.assertFalse(subtypes.check_subtype(many, c))
+        self.assertTrue(subtypes.check_subtype(many, Constructor("List", c)))
+        self.assertFalse(subtypes.check_subtype(c, Constructor("d")))
+        self.assertTrue(subtypes.check_subtype(Constructor("e"), Constructor("e")))
+
+    def test_arrows(self):
+        ty = Intersection(Arrow(b, c), Arrow(c, Arrow(a, b)))
+        self.assertTrue(self.subtypes.check_subtype(ty, Arrow(a, c)))
+        target = Intersection(c, Arrow(a, b))
+        self.assertTrue(self.subtypes.check_subtype(ty, Arrow(Intersection(a, c), target)))
+        self.assertFalse(self.subtypes.check_subtype(ty, Arrow(Omega(), c)))
+        self.assertTrue(self.subtypes.check_subtype(Arrow(a, Omega()), Arrow(b, Omega())))
+
+    def test_path_index_cache(self):
+        ty = Intersection(Constructor("List", a), Product(a, b))
+        self.assertTrue(self.subtypes.check_subtype(ty, Constructor("List", b)))
+        self.assertIn("_path_index", ty.__dict__)
+        self.assertNotIn("_path_index", ty.__getstate__())
+
+
 if __name__ == "__main__":
     unittest.main()